@@ -0,0 +1,48 @@
+"""
+Micro-benchmark of the integer time formatter against the previous Decimal -> str -> split path.
+
+Usage: python benchmarks/bench_formatting.py
+"""
+
+# Standard library
+import sys
+import timeit
+from decimal import Decimal as d
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# Local application
+from crt.time import Time
+
+RUNS = 100_000
+REPEATS = 5
+
+
+def string_components(time: d) -> tuple:
+    """The previous `format_components` helper."""
+    time_str = str(max(time, d(0)))
+    if '.' in time_str:
+        seconds, milliseconds = map(int, time_str.split(".", 1))
+    else:
+        seconds, milliseconds = int(time_str), 0
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return (f"{hours:02}", f"{minutes:02}", f"{seconds:02}", str(milliseconds).rjust(3, "0"))
+
+
+def main() -> None:
+    """Times both formatters on a marathon-length run and shows their output at every precision."""
+    time = Time(0, 2_158_000, "59.94")
+    old = min(timeit.repeat(lambda: string_components(time.with_loads), number=RUNS, repeat=REPEATS)) / RUNS * 1e6
+    new = min(timeit.repeat(lambda: time.time_components(), number=RUNS, repeat=REPEATS)) / RUNS * 1e6
+    print(f"string round-trip: {old:.3f} us, integer divmod: {new:.3f} us")
+
+    print(f"{'precision':>9} {'string round-trip':>20} {'integer divmod':>16}")
+    for precision in range(0, 7):
+        time.precision = precision
+        print(f"{precision:>9} {':'.join(string_components(time.with_loads)):>20} {time.iso_format():>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Import-time benchmark of the headless core, measured with `python -X importtime` in fresh interpreters.
+
+Checks that `import crt.core` stays within its budget and never loads the GUI dependencies, and shows the modules
+that cost the most. The GUI import is measured too when PySide6 is installed.
+
+Usage: python benchmarks/bench_import.py [runs]
+"""
+
+# Standard library
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+RUNS = 15
+# The headless import budget in milliseconds, on top of the interpreter start-up
+BUDGET_MS = 60
+GUI_MODULES = ("PySide6", "darkdetect", "requests", "appdirs")
+
+
+def import_times(statement: str) -> dict[str, tuple[int, int]]:
+    """Runs a statement in a fresh interpreter and reads its import times.
+
+    Args:
+        statement (str): The statement, e.g. "import crt.core".
+
+    Returns:
+        dict[str, tuple[int, int]]: The self and cumulative import time of every module in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=SRC, env={**os.environ, "PYTHONPATH": str(SRC)}, capture_output=True, text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def best_of(module: str, runs: int) -> tuple[float, dict[str, tuple[int, int]]]:
+    """Imports a module in several fresh interpreters and keeps the fastest run.
+
+    Args:
+        module (str): The module to import.
+        runs (int): The number of interpreters to start.
+
+    Returns:
+        tuple[float, dict[str, tuple[int, int]]]: The cumulative import time in milliseconds and the import times of
+        the fastest run.
+    """
+    best = None
+    for _ in range(runs):
+        times = import_times(f"import {module}")
+        total = times[module][1] / 1000
+        if best is None or total < best[0]:
+            best = (total, times)
+    return best
+
+
+def main() -> int:
+    """Measures the headless import and fails if it is over budget or loads the GUI.
+
+    Returns:
+        int: The exit code.
+    """
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+    # Warm the bytecode cache so the first run does not pay for compiling
+    import_times("import crt.core")
+
+    total, times = best_of("crt.core", runs)
+    print(f"import crt.core: {total:.1f} ms (best of {runs}, budget {BUDGET_MS} ms)")
+    print(f"{'self [ms]':>10} {'cumulative [ms]':>16}  module")
+    for name, (own, cumulative) in sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:12]:
+        print(f"{own / 1000:>10.2f} {cumulative / 1000:>16.2f}  {name}")
+
+    gui = [name for name in times if name.split(".")[0] in GUI_MODULES or name in ("crt.app", "crt.gui")]
+    if gui:
+        print(f"FAIL: the headless import loaded {', '.join(sorted(gui))}")
+        return 1
+
+    try:
+        gui_total, _ = best_of("crt.app", min(runs, 3))
+        print(f"import crt.app: {gui_total:.1f} ms, for comparison")
+    except RuntimeError as e:
+        print(f"import crt.app: skipped ({e})")
+
+    if total > BUDGET_MS:
+        print(f"FAIL: over the {BUDGET_MS} ms budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Micro-benchmark of the shared frame-input parser against the previous regex chain.
+
+Usage: python benchmarks/bench_parsing.py
+"""
+
+# Standard library
+import json
+import re
+import sys
+import timeit
+from decimal import Decimal as d, InvalidOperation
+from fractions import Fraction
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# Local application
+from crt.framerate import seconds_to_frame
+from crt.parsing import debug_info_to_seconds, parse_frame
+
+RUNS = 20_000
+REPEATS = 5
+FRAMERATE = Fraction(60000, 1001)
+
+# Trimmed copy of what YouTube's "Copy debug info" puts on the clipboard
+DEBUG_INFO = json.dumps({
+    "ns": "yt", "el": "detailpage", "cpn": "Zq3xS1dJ8kQnV4fT", "ver": 2, "cmt": "4523.817",
+    "fmt": "299", "fs": "0", "rt": "812.004", "euri": "", "lact": 3, "cl": "612345678",
+    "mos": 0, "state": "4", "volume": 100, "cbr": "Chrome", "cbrver": "126.0.0.0", "c": "WEB",
+    "cver": "2.20240614.01.00", "cplayer": "UNIPLAYER", "cos": "Windows", "cosver": "10.0",
+    "cplatform": "DESKTOP", "hl": "en_US", "cr": "US", "len": "15234.561", "fexp": [str(n) for n in range(23983296, 23983296 + 120)],
+    "afmt": "251", "vct": "4523.817", "vd": "15234.561", "vpl": "0.000-4523.817", "vbu": "4510.000-4560.000",
+    "vbs": "4", "vpa": "0", "vsk": "0", "ven": "0", "vpr": "1", "vrs": "4", "vns": "2", "vec": "null",
+    "vemsg": "", "vvol": "1", "vdom": "1", "vsrc": "1", "vw": 1920, "vh": 1080, "dvf": 12, "drf": 0,
+    "debug_videoId": "dQw4w9WgXcQ", "0sz": False, "op": "", "yof": False, "dis": "", "gpu": "ANGLE (NVIDIA)",
+    "debug_playbackQuality": "hd1080", "debug_date": "Mon Jun 17 2024 21:14:52 GMT+0000",
+}, indent=2)
+
+CORPUS = (
+    "0",
+    "1234",
+    "  98211 ",
+    "frame 5021",
+    "1,204,551",
+    "12.5",
+    "4523.817",
+    "1:15:23.817",
+    "01:02:03.500",
+    "00:00.016",
+    "3.2.1",
+    "",
+    "abc",
+    DEBUG_INFO,
+    "Stats for nerds " + DEBUG_INFO,
+)
+
+
+def regex_chain(text: str, framerate: d) -> int:
+    """The previous `App._parse_frame_input` implementation."""
+    text = text.strip()
+    if '{' in text and '"cmt"' in text:
+        try:
+            cmt = json.loads(text[text.find('{'):])["cmt"]
+            return seconds_to_frame(cmt, framerate)
+        except (json.JSONDecodeError, KeyError, InvalidOperation, ValueError):
+            return 0
+    cleaned = re.sub(r'[^0-9.]', '', text)
+    if not cleaned or not re.search(r'[0-9]', cleaned):
+        return 0
+    if cleaned.count('.') > 1:
+        idx = cleaned.find('.')
+        cleaned = cleaned[:idx + 1] + cleaned[idx + 1:].replace('.', '')
+    if '.' in cleaned:
+        try:
+            return seconds_to_frame(cleaned, framerate)
+        except (InvalidOperation, ValueError):
+            return 0
+    try:
+        return int(cleaned)
+    except ValueError:
+        return 0
+
+
+def json_cmt(text: str):
+    """Reads `cmt` by parsing the whole debug info, returning None if it is invalid."""
+    try:
+        return json.loads(text[text.find('{'):])["cmt"]
+    except (json.JSONDecodeError, KeyError):
+        return None
+
+
+def main() -> None:
+    """Times both parsers on every corpus entry and shows where their results differ."""
+    print(f"{'input':>24} {'regex (us)':>11} {'scanner (us)':>13} {'regex':>8} {'scanner':>8}")
+    for text in CORPUS:
+        old = min(timeit.repeat(lambda: regex_chain(text, FRAMERATE), number=RUNS, repeat=REPEATS)) / RUNS * 1e6
+        new = min(timeit.repeat(lambda: parse_frame(text, FRAMERATE), number=RUNS, repeat=REPEATS)) / RUNS * 1e6
+        label = text.strip().replace("\n", " ")
+        label = label if len(label) <= 24 else label[:21] + "..."
+        print(f"{label!r:>24} {old:>11.3f} {new:>13.3f} {regex_chain(text, FRAMERATE):>8} {parse_frame(text, FRAMERATE):>8}")
+
+    print()
+    print(f"{'debug info':>24} {'json.loads (us)':>16} {'cmt scan (us)':>14}")
+    # The clipboard sometimes cuts the blob off, which the full parse rejects
+    truncated = DEBUG_INFO[:len(DEBUG_INFO) // 2]
+    for label, text in (("complete", DEBUG_INFO), ("truncated", truncated)):
+        old = min(timeit.repeat(lambda: json_cmt(text), number=RUNS, repeat=REPEATS)) / RUNS * 1e6
+        new = min(timeit.repeat(lambda: debug_info_to_seconds(text), number=RUNS, repeat=REPEATS)) / RUNS * 1e6
+        print(f"{label:>24} {old:>16.3f} {new:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
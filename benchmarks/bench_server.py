@@ -0,0 +1,198 @@
+"""
+Load test of the retime service, see `crt.server`.
+
+Starts `crt serve` on a free local port, or targets a running server with --port, then sends retime requests over
+several keep-alive connections at once and reports the throughput and latency percentiles seen by the client next
+to the counters of the server's /stats endpoint.
+
+Usage: python benchmarks/bench_server.py [-c CONNECTIONS] [-n REQUESTS] [--loads LOADS] [--batch SIZE] [--port PORT]
+"""
+
+# Standard library
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+from pathlib import Path
+from time import perf_counter
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def make_request(loads: int) -> dict:
+    """Builds a retime request with evenly spaced loads.
+
+    Args:
+        loads (int): The number of loads.
+
+    Returns:
+        dict: The request.
+    """
+    return {
+        "start": 0, "end": loads * 100 + 100, "framerate": 60,
+        "loads": [[index * 100 + 10, index * 100 + 60] for index in range(loads)],
+    }
+
+
+async def call(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, body: bytes = b"") -> tuple[int, dict]:
+    """Sends a request over a keep-alive connection and reads the response.
+
+    Args:
+        reader (asyncio.StreamReader): The connection reader.
+        writer (asyncio.StreamWriter): The connection writer.
+        method (str): The HTTP method.
+        path (str): The request path.
+        body (bytes): The JSON body. Defaults to b"".
+
+    Returns:
+        tuple[int, dict]: The status code and the JSON response.
+    """
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()).strip():
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(port: int, body: bytes, count: int, latencies: list[float], failures: list[int]) -> None:
+    """Sends requests one after another over a single connection.
+
+    Args:
+        port (int): The server port.
+        body (bytes): The request body.
+        count (int): The number of requests to send.
+        latencies (list[float]): The latency of every request is appended to this, in seconds.
+        failures (list[int]): The status of every failed request is appended to this.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for _ in range(count):
+            started = perf_counter()
+            status, _ = await call(reader, writer, "POST", "/retime", body)
+            latencies.append(perf_counter() - started)
+            if status != 200:
+                failures.append(status)
+    finally:
+        writer.close()
+
+
+async def load_test(port: int, connections: int, requests: int, body: bytes) -> tuple[float, list[float], list[int], dict]:
+    """Runs the load test.
+
+    Args:
+        port (int): The server port.
+        connections (int): The number of concurrent connections.
+        requests (int): The total number of requests.
+        body (bytes): The request body.
+
+    Returns:
+        tuple[float, list[float], list[int], dict]: The elapsed seconds, the latencies, the failed statuses and the
+        server's stats.
+    """
+    latencies, failures = [], []
+    share, extra = divmod(requests, connections)
+    started = perf_counter()
+    await asyncio.gather(*(
+        client(port, body, share + (index < extra), latencies, failures) for index in range(connections)
+    ))
+    elapsed = perf_counter() - started
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    _, stats = await call(reader, writer, "GET", "/stats")
+    writer.close()
+    return elapsed, latencies, failures, stats
+
+
+async def wait_until_ready(port: int, timeout: float = 10) -> None:
+    """Waits for a server to accept connections.
+
+    Args:
+        port (int): The server port.
+        timeout (float): The number of seconds to wait. Defaults to 10.
+
+    Raises:
+        RuntimeError: The server did not start in time.
+    """
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.05)
+            continue
+        await call(reader, writer, "GET", "/health")
+        writer.close()
+        return
+    raise RuntimeError("The server did not start.")
+
+
+def free_port() -> int:
+    """Finds a free local port.
+
+    Returns:
+        int: The port.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def main() -> int:
+    """Load tests a retime server and prints the results.
+
+    Returns:
+        int: The exit code, 1 if any request failed.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-c", "--connections", type=int, default=16, help="concurrent connections (default: 16)")
+    parser.add_argument("-n", "--requests", type=int, default=5000, help="total requests (default: 5000)")
+    parser.add_argument("--loads", type=int, default=10, help="loads per retimed time (default: 10)")
+    parser.add_argument("--batch", type=int, default=1, help="times per request, 1 sends single requests (default: 1)")
+    parser.add_argument("-j", "--workers", type=int, help="worker processes of the started server")
+    parser.add_argument("--port", type=int, help="target a running server instead of starting one")
+    args = parser.parse_args()
+
+    request = make_request(args.loads)
+    body = json.dumps({"requests": [request] * args.batch} if args.batch > 1 else request).encode()
+
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        command = [sys.executable, "-m", "crt", "serve", "--port", str(port)]
+        if args.workers is not None:
+            command += ["--workers", str(args.workers)]
+        server = subprocess.Popen(command, cwd=SRC, env={**os.environ, "PYTHONPATH": str(SRC)}, stderr=subprocess.DEVNULL)
+    try:
+        asyncio.run(wait_until_ready(port))
+        elapsed, latencies, failures, stats = asyncio.run(load_test(port, args.connections, args.requests, body))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+
+    def percentile(fraction: float) -> float:
+        return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)] * 1000
+
+    times = len(latencies) * args.batch
+    print(f"{len(latencies)} requests of {args.batch} time(s) with {args.loads} loads over {args.connections} connections")
+    print(f"throughput: {len(latencies) / elapsed:.0f} requests/s, {times / elapsed:.0f} times/s")
+    print(f"latency: p50 {percentile(0.5):.2f} ms, p90 {percentile(0.9):.2f} ms, p99 {percentile(0.99):.2f} ms, max {latencies[-1] * 1000:.2f} ms")
+    print(f"server stats: {json.dumps(stats)}")
+    if failures:
+        print(f"FAIL: {len(failures)} requests failed, e.g. with status {failures[0]}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,9 @@
 """
 A tool that aids speedrunners and moderators in finding the accurate time of a speedrun with or without loads.
+
+The GUI is only imported once `crt.App` is first used, so scripts that only need `crt.core` never load Qt.
 """
 
-from crt.app import App
 from crt._version import __version__
 
 __name__ = "crt"
@@ -10,3 +11,11 @@ __author__ = "Conner Glover"
 __description__ = "A tool that aids speedrunners and moderators in finding the accurate time of a speedrun with or without loads."
 __license__ = "MIT"
 __all__ = ["App"]
+
+def __getattr__(name: str):
+    """Imports the GUI on first access of `App`."""
+    if name == "App":
+        from crt.app import App
+        globals()["App"] = App
+        return App
+    raise AttributeError(f"module 'crt' has no attribute {name!r}")
@@ -0,0 +1,9 @@
+"""
+Runs the command-line interface: python -m crt retime ...
+"""
+
+import sys
+
+from crt.cli import main
+
+sys.exit(main())
@@ -1,9 +1,9 @@
 # Standard library
-import json
-import re
+import os
 from decimal import Decimal as d, InvalidOperation, DivisionByZero, DivisionUndefined
+from fractions import Fraction
 from webbrowser import open as open_url
-from typing import NoReturn
+from typing import NoReturn, Optional
 
 # Third-party
 import darkdetect
@@ -17,13 +17,26 @@ from requests import get as get_url
 # Local application
 from crt._version import __version__
 from crt.app_settings.app import Settings
+from crt.coalesce import coalesce
 from crt.decorators import error_handler
-from crt.gui import MainGUI
-from crt.load import Load
+from crt.framerate import parse_framerate
+from crt.gui import LoadNotifier, MainGUI, SaveNotifier
+from crt.history import EditHistory
+from crt.journal import Journal, discard, orphaned_sessions, recover
+from crt.load import LoadStore, LoadValidationError
+from crt.load_csv import import_loads, write_loads
 from crt.load_viewer.app import LoadViewer
+from crt.mod_note import render_mod_note
+from crt.parsing import debug_info_to_seconds, parse_frame
+from crt.paste_loads import PasteLoads
+from crt.recent_files import RecentFiles
 from crt.save_as.app import SaveAs
 from crt.session_history import SessionHistory
+from crt.splits import read_splits
+from crt.splits_viewer import SplitsViewer
 from crt.time import Time
+from crt.time_binary import is_binary
+from crt.time_file import SaveWorker, load_in_background, load_time_file, read_run, snapshot
 
 
 # ── Palette helpers ────────────────────────────────────────────────────────────
@@ -256,32 +269,6 @@ def _clipboard_set(text: str):
     QGuiApplication.clipboard().setText(str(text))
 
 
-def _time_components(time_val: d):
-    """Extracts (hours, minutes, seconds, milliseconds) strings from a Decimal time value.
-
-    This replicates the logic inside the @format_time decorator's format_components helper
-    so it can be called directly without going through the decorator wrapper.
-    """
-    time_str = str(max(time_val, d(0)))
-    if '.' in time_str:
-        seconds_part, ms_part = time_str.split(".", 1)
-        seconds_total = int(seconds_part)
-        milliseconds = int(ms_part)
-    else:
-        seconds_total = int(time_str)
-        milliseconds = 0
-
-    minutes, seconds = divmod(seconds_total, 60)
-    hours, minutes = divmod(minutes, 60)
-
-    return (
-        f"{hours:02}",
-        f"{minutes:02}",
-        f"{seconds:02}",
-        str(milliseconds).rjust(3, "0"),
-    )
-
-
 class App:
     """Main application for CRT."""
 
@@ -292,16 +279,36 @@ class App:
 
         self.time = Time()
         self.file_path = None
-        self.past_file_paths = []
 
         self.settings = Settings()
         self.settings_dict = self.settings.config_to_dict()
 
-        # Load stats tracking
-        self._load_stats = {
-            'total_loads': 0,
-            'avg_length': 0
-        }
+        # The recently used files, kept across sessions with a summary of each
+        self.recent_files = RecentFiles(
+            os.path.join(os.path.dirname(self.settings.file_path), "history.json"), background=True
+        )
+
+        self.history = EditHistory(self.time, max_bytes=self.settings_dict["undo_limit_mb"] * 1024 * 1024)
+
+        # Saves are written on a worker thread, which reports back through a queued Qt signal
+        self._save_notifier = SaveNotifier()
+        self._save_notifier.finished.connect(self._on_saved)
+        self._saver = SaveWorker(
+            lambda file_path, error: self._save_notifier.finished.emit(file_path, "" if error is None else str(error))
+        )
+        self._confirm_saves = set()
+
+        # JSON files show their run at once and read their loads on a worker thread
+        self._load_notifier = LoadNotifier()
+        self._load_notifier.finished.connect(self._on_loaded)
+        self._loading = None
+        self._loader = None
+        # The file path, run and loads the run of a loading file replaced, restored if its loads cannot be used
+        self._replaced = None
+
+        # The (time, revision) last rendered, so unchanged events skip re-formatting
+        self._displayed = None
+        self._mod_note_cache = None
 
         # Apply theme via stylesheet
         self._apply_theme(self.settings_dict["theme"])
@@ -312,6 +319,27 @@ class App:
         self.language = self.settings.language
         self.window = MainGUI(self.language.content)
 
+        # Every edit is journaled, so the time survives a crash
+        journal_directory = os.path.join(os.path.dirname(self.settings.file_path), "journal")
+        self._recover_session(journal_directory)
+        self.journal = Journal(journal_directory, self.time)
+        self.journal.set_file_path(self.file_path)
+
+    def _recover_session(self, directory: str) -> NoReturn:
+        """Offers to recover the time of the last session if it did not close cleanly."""
+        sessions = orphaned_sessions(directory)
+        if sessions and _popup_yes_no(
+            "Recover", "CRT did not close properly last time. Would you like to recover the unsaved time?"
+        ):
+            try:
+                self.file_path = recover(sessions[0], self.time)
+            except ValueError as e:
+                _popup_error("Recover", str(e))
+            self.history.clear()
+            self._sync_inputs()
+        for session in sessions:
+            discard(session)
+
     def _apply_theme(self, theme: str):
         """Applies a Qt stylesheet theme."""
         match theme:
@@ -351,6 +379,14 @@ class App:
         load_window.run()
         self._update_displays()
 
+    @error_handler
+    def _paste_loads(self) -> NoReturn:
+        """Previews a clipboard of loads and adds them in one batch."""
+        added = PasteLoads(self.time, _clipboard_get(), self.language).run()
+        self._update_displays()
+        if added:
+            _popup_ok("Loads", f"Added {added} loads.")
+
     @error_handler
     def _add_loads(self, values: dict) -> NoReturn:
         """Adds the loads."""
@@ -358,14 +394,8 @@ class App:
         end_frame = int(values.get("end_loads") or 0)
 
         if self.time.loads:
-            if self._load_stats['total_loads'] != len(self.time.loads):
-                self._load_stats['avg_length'] = (
-                    sum(load.end_frame - load.start_frame for load in self.time.loads)
-                    / len(self.time.loads)
-                )
-                self._load_stats['total_loads'] = len(self.time.loads)
-
-            if (end_frame - start_frame) > self._load_stats['avg_length'] * 10:
+            # Compare against ten times the average without dividing: length > 10 * total / count
+            if (end_frame - start_frame) * len(self.time.loads) > self.time.total_load_length * 10:
                 if not _popup_yes_no("Woah!", "This load is concerningly long. Would you like to add the load anyway?"):
                     return
 
@@ -377,91 +407,23 @@ class App:
 
     # ── Input parsing helpers ──────────────────────────────────────────────────
 
-    @staticmethod
-    def _is_debug_info(text: str) -> bool:
-        """Returns True if the text looks like YouTube debug info JSON."""
-        return '{' in text and '"cmt"' in text
-
     def debug_info_to_frame(self, time: Time, debug_info: str) -> int:
         """Converts YouTube debug info JSON to a frame number."""
-        start_pos = debug_info.find('{')
-        if start_pos == -1:
-            raise ValueError("The debug info provided is invalid.\nPlease re-enter debug info.")
-        debug_info = debug_info[start_pos:]
-        try:
-            parsed = json.loads(debug_info)
-            cmt = parsed["cmt"]
-        except (json.decoder.JSONDecodeError, KeyError):
-            raise ValueError("The debug info provided is invalid.\nPlease re-enter debug info.")
-        output = int(round(d(str(cmt)) * d(str(time.framerate)), 0))
-        return output
+        return round(Fraction(debug_info_to_seconds(debug_info)) * time.framerate_fraction)
 
     def _clean_framerate(self, framerate: str) -> d:
-        """Cleans a framerate string into a valid Decimal.
+        """Cleans a framerate string into a valid Decimal, or a Fraction for ratios such as "30000/1001".
 
-        Rules:
-        - Strip all non-numeric, non-decimal characters.
-        - If empty or no digits remain, return Decimal('0').
-        - Collapse multiple decimal points (keep only the first).
-        - Trailing decimal point gets a '0' appended.
+        See `crt.framerate.parse_framerate` for the rules.
         """
-        cleaned = re.sub(r'[^0-9.]', '', framerate)
-        if not re.search(r'[0-9]', cleaned):
-            return d('0')
-        # Collapse multiple decimal points
-        if cleaned.count('.') > 1:
-            idx = cleaned.find('.')
-            cleaned = cleaned[:idx + 1] + cleaned[idx + 1:].replace('.', '')
-        if cleaned.endswith('.'):
-            cleaned += '0'
         try:
-            return d(cleaned)
+            return parse_framerate(framerate)
         except (InvalidOperation, ValueError):
             return d('0')
 
     def _parse_frame_input(self, text: str, time: Time) -> int:
-        """Parse a frame input field according to the full validation spec:
-
-        1. If it looks like YouTube debug info, extract the frame from JSON.
-        2. Otherwise strip all non-numeric, non-decimal characters.
-        3. If empty after stripping, return 0.
-        4. If a decimal point is present, treat the value as a timestamp in
-           seconds and convert to a frame number (value * framerate, rounded).
-        5. Otherwise return the integer value.
-        """
-        text = text.strip()
-
-        # Step 1 — debug info
-        if self._is_debug_info(text):
-            return self.debug_info_to_frame(time, text)
-
-        # Step 2 — strip non-numeric/non-decimal characters
-        cleaned = re.sub(r'[^0-9.]', '', text)
-
-        # Step 3 — empty → 0
-        if not cleaned or not re.search(r'[0-9]', cleaned):
-            return 0
-
-        # Collapse multiple decimal points
-        if cleaned.count('.') > 1:
-            idx = cleaned.find('.')
-            cleaned = cleaned[:idx + 1] + cleaned[idx + 1:].replace('.', '')
-
-        # Step 4 — decimal → timestamp conversion
-        if '.' in cleaned:
-            try:
-                fps = d(str(time.framerate))
-                if fps == 0:
-                    return 0
-                return int(round(d(cleaned) * fps, 0))
-            except (InvalidOperation, ValueError):
-                return 0
-
-        # Step 5 — plain integer
-        try:
-            return int(cleaned)
-        except ValueError:
-            return 0
+        """Parses a frame input field, see `crt.parsing.parse_frame` for the accepted formats."""
+        return parse_frame(text, time.framerate_fraction)
 
     def clean_frame(self, frame: str) -> int:
         """Legacy wrapper — cleans a frame string to an integer (no decimal/debug handling)."""
@@ -484,6 +446,12 @@ class App:
         widget = self.window.window.findChild(QLineEdit, key)
         return widget.text() if widget else ""
 
+    def _sync_inputs(self):
+        """Updates the framerate, start and end inputs from the time."""
+        self._set_input("framerate", self.time.framerate)
+        self._set_input("start", self.time.start_frame)
+        self._set_input("end", self.time.end_frame)
+
     # ── Input event handlers ───────────────────────────────────────────────────
 
     def _set_framerate(self, new_value: str) -> NoReturn:
@@ -497,11 +465,16 @@ class App:
     def _set_time(self, key: str, new_value: str) -> NoReturn:
         """Handles the start/end frame inputs."""
         frame = self._parse_frame_input(new_value, self.time)
-        match key:
-            case "start":
-                self.time.mutate(start_frame=frame)
-            case "end":
-                self.time.mutate(end_frame=frame)
+        try:
+            match key:
+                case "start":
+                    self.time.mutate(start_frame=frame)
+                case "end":
+                    self.time.mutate(end_frame=frame)
+        except ValueError:
+            # Keep showing the run the time still has
+            self._set_input(key, getattr(self.time, f"{key}_frame"))
+            raise
         self._set_input(key, frame)
         self._update_displays()
 
@@ -520,64 +493,262 @@ class App:
         """Creates a new time."""
         self._save_as_time()
         self.time = Time()
-        self._set_input("framerate", self.time.framerate)
-        self._set_input("start", self.time.start_frame)
-        self._set_input("end", self.time.end_frame)
+        # Forget any file still loading, so its loads never land in the new time
+        self._loading = None
+        self._loader = None
+        self._replaced = None
+        self.history.attach(self.time)
+        self.journal.attach(self.time)
+        self._sync_inputs()
         self._set_input("start_loads", "0")
         self._set_input("end_loads", "0")
         self._update_displays()
 
-    def _convert_to_dict(self) -> dict:
-        """Converts the time to a JSON dictionary."""
-        return {
-            "start_frame": self.time.start_frame,
-            "end_frame": self.time.end_frame,
-            "framerate": str(self.time.framerate),
-            "loads": [(load.start_frame, load.end_frame) for load in self.time.loads]
-        }
-
+    @error_handler
     def _open_time(self) -> NoReturn:
         """Opens a time."""
         old_file_path = self.file_path
         new_file_path, _ = QFileDialog.getOpenFileName(
-            self.window.window, "Open Time", "", "Time Files (*.json)"
+            self.window.window, "Open Time", "", "Time Files (*.json *.crtb)"
         )
         if not new_file_path:
             return
 
         if new_file_path != old_file_path:
-            self.file_path = new_file_path
-            if old_file_path not in self.past_file_paths and old_file_path is not None:
-                self.past_file_paths.append(old_file_path)
+            self._open_file(new_file_path)
+            self._update_displays()
 
-        if self.file_path and self.file_path != old_file_path:
-            with open(self.file_path, "r") as file:
-                try:
-                    file_data = json.load(file)
-                except json.decoder.JSONDecodeError:
-                    raise ValueError("The file provided is corrupted.")
-
-                loads = [Load(load[0], load[1]) for load in file_data["loads"]]
-                self.time.mutate(
-                    start_frame=file_data["start_frame"],
-                    end_frame=file_data["end_frame"],
-                    framerate=file_data["framerate"]
-                )
-                self.time.loads = loads
+    @error_handler
+    def _import_loads(self) -> NoReturn:
+        """Adds the loads of a CSV or TSV file."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self.window.window, "Import Loads", "", "Load Lists (*.csv *.tsv *.txt)"
+        )
+        if not file_path:
+            return
 
-                self._set_input("start", self.time.start_frame)
-                self._set_input("end", self.time.end_frame)
-                self._set_input("framerate", self.time.framerate)
-                self._set_input("start_loads", "0")
-                self._set_input("end_loads", "0")
-                self._update_displays()
+        with open(file_path, "r", newline="", encoding="utf-8-sig") as file:
+            result = import_loads(file, self.time)
+        self._update_displays()
+
+        message = f"Imported {result.added} loads."
+        if result.error_count:
+            message += f"\n\nSkipped {result.error_count} rows:\n"
+            message += "\n".join(f"Line {line}: {error}" for line, error in result.errors[:10])
+            if result.error_count > 10:
+                message += f"\n…and {result.error_count - 10} more."
+        _popup_ok("Import Loads", message)
+
+    @error_handler
+    def _export_loads(self) -> NoReturn:
+        """Writes the loads to a CSV or TSV file."""
+        if not self.time.loads:
+            raise ValueError("No loads to export.")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self.window.window, "Export Loads", "", "CSV Files (*.csv);;TSV Files (*.tsv)"
+        )
+        if not file_path:
+            return
+        if not file_path.endswith((".csv", ".tsv")):
+            file_path += ".csv"
+
+        with open(file_path, "w", newline="", encoding="utf-8") as file:
+            count = write_loads(file, self.time, delimiter="\t" if file_path.endswith(".tsv") else ",")
+        _popup_ok("Export Loads", f"Exported {count} loads.")
+
+    @error_handler
+    def _import_splits(self) -> NoReturn:
+        """Shows the segments of a LiveSplit splits file timed against the loads."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self.window.window, "Import Splits", "", "LiveSplit Splits (*.lss)"
+        )
+        if not file_path:
+            return
+
+        splits = read_splits(file_path)
+        SplitsViewer(self.time, splits, self.language).run()
+
+    def _open_file(self, file_path: str) -> NoReturn:
+        """Opens a time file, showing its run before its loads have been read.
+
+        Binary files are memory-mapped and open at once. JSON files have their run applied straight away and their
+        loads read and validated on a worker thread, see `_on_loaded`. The file path only changes once the file has
+        been applied.
+        """
+        run = None if is_binary(file_path) else read_run(file_path)
+        if run is None:
+            self._loading = None
+            self._replaced = None
+            self._apply_file_data(file_path, load_time_file(file_path))
+            self.recent_files.touch(file_path)
+            return
+        # Replacing the loads never touches the old store, so keeping it is enough to restore it. A file that is still
+        # loading is not worth restoring, so the state from before it is kept instead.
+        replaced = self._replaced if self._loading else (
+            self.file_path, self.time.start_frame, self.time.end_frame, self.time.framerate_fraction, self.time.loads
+        )
+        self._apply_file_data(file_path, {**run, "loads": []})
+        self._loading = file_path
+        self._replaced = replaced
+        self._loader = load_in_background(
+            file_path, lambda path, data, error: self._load_notifier.finished.emit(path, data, error)
+        )
+
+    @error_handler
+    def _on_loaded(self, file_path: str, file_data: dict, error: Exception) -> NoReturn:
+        """Adopts the loads read on the worker thread, on the GUI thread.
+
+        Loads added while the file was being read are kept. If the loads cannot be used, the file that was open before
+        is restored, so a later save never writes the run of this file without its loads.
+        """
+        if file_path != self._loading:
+            # Another file was opened, or a new time started, in the meantime
+            return
+        self._loading = None
+        replaced, self._replaced = self._replaced, None
+        try:
+            if isinstance(error, LoadValidationError):
+                # Let the synchronous path offer to merge the overlapping loads
+                self._apply_file_data(file_path, load_time_file(file_path))
+            elif error is not None:
+                raise error
+            else:
+                added = self.time.loads.copy()
+                with self.history.suspended():
+                    self.time.adopt_loads(file_data["loads"], file_data["aggregates"])
+                    if added:
+                        self.time.add_loads(added)
+                # Undoing must never bring back the time of the previous file
+                self.history.clear()
+            self.recent_files.touch(file_path)
+        except Exception:
+            if replaced is not None:
+                self._restore_time(*replaced)
+            raise
+        finally:
+            self._update_displays()
+
+    def _restore_time(self, file_path: Optional[str], start_frame: int, end_frame: int, framerate: Fraction, loads: LoadStore) -> NoReturn:
+        """Puts back the file path, run and loads a file that failed to load had replaced."""
+        with self.history.suspended():
+            # The current loads may lie outside the restored run, so they go first
+            self.time.clear_loads()
+            self.time.mutate(start_frame, end_frame, framerate)
+            self.time.adopt_loads(loads)
+        self.history.clear()
+        self.file_path = file_path
+        self.journal.set_file_path(file_path)
+        self._sync_inputs()
+
+    def _finish_loading(self) -> NoReturn:
+        """Waits for the loads being read in the background, so they are not left out of a save."""
+        if self._loading and self._loader is not None:
+            self._loader.join()
+            self._qt_app.processEvents()
+
+    def _apply_file_data(self, file_path: str, file_data: dict) -> NoReturn:
+        """Applies the contents of a time file to the time and the inputs, and makes it the open file.
+
+        The loads are validated against the run of the file before anything is changed, so a file that cannot be
+        opened leaves the time and the file path as they were.
+        """
+        loads, aggregates = self._validated_loads(file_data)
+        with self.history.suspended():
+            # The current loads may lie outside the new run, so they go first
+            self.time.clear_loads()
+            self.time.mutate(
+                start_frame=file_data["start_frame"],
+                end_frame=file_data["end_frame"],
+                framerate=file_data["framerate"]
+            )
+            self.time.adopt_loads(loads, aggregates)
+        # Undoing must never bring back the time of the previous file
+        self.history.clear()
+        self.file_path = file_path
+        self.journal.set_file_path(file_path)
+
+        self._sync_inputs()
+        self._set_input("start_loads", "0")
+        self._set_input("end_loads", "0")
+
+    def _validated_loads(self, file_data: dict) -> tuple[LoadStore, Optional[tuple]]:
+        """Validates the loads of a time file against its own run.
+
+        Files written before overlapping loads were rejected can still be opened by merging their loads. Binary files
+        only ever hold validated loads, so their memory-mapped loads are adopted as they are unless they fail the cheap
+        checks of `Time.adopt_loads`.
+        """
+        staged = Time(file_data["start_frame"], file_data["end_frame"], file_data["framerate"])
+        if "aggregates" in file_data:
+            staged.adopt_loads(file_data["loads"], file_data["aggregates"])
+            # The aggregates only still hold if the store was adopted rather than validated
+            return staged.loads, file_data["aggregates"] if staged.loads is file_data["loads"] else None
+        try:
+            staged.replace_loads(file_data["loads"])
+        except LoadValidationError as e:
+            # Merging only fixes overlaps, any other bad load is reported as it is
+            if not e.only_overlaps:
+                raise
+            if not _popup_yes_no("Loads", "This file has overlapping loads. Would you like to merge them?"):
+                raise
+            merged, _ = coalesce(file_data["loads"], self.settings_dict["merge_gap"])
+            staged.replace_loads(merged)
+        return staged.loads, None
+
+    @error_handler
+    def _undo(self) -> NoReturn:
+        """Reverts the most recent edit to the time."""
+        if self.history.undo():
+            self._sync_inputs()
+
+    @error_handler
+    def _redo(self) -> NoReturn:
+        """Re-applies the most recently reverted edit to the time."""
+        if self.history.redo():
+            self._sync_inputs()
+
+    @error_handler
+    def _merge_loads(self) -> NoReturn:
+        """Merges loads that touch or are within the merge gap of each other."""
+        merges = self.time.coalesce_loads(self.settings_dict["merge_gap"])
+        if merges:
+            _popup_ok("Loads", f"Merged {sum(merge.count for merge in merges)} loads into {len(merges)}.")
+        else:
+            _popup_ok("Loads", "There are no loads to merge.")
+        self._update_displays()
+
+    def _prepare_save(self) -> NoReturn:
+        """Normalises the time before it is written, if enabled in the settings."""
+        if self.settings_dict["merge_loads_on_save"]:
+            self.time.coalesce_loads(self.settings_dict["merge_gap"])
+
+    def _write_time(self, confirm: bool) -> NoReturn:
+        """Hands a snapshot of the time to the background save worker.
+
+        Args:
+            confirm (bool): Whether to tell the user once the time has been saved. Failures are always shown.
+        """
+        self._finish_loading()
+        self._prepare_save()
+        self.journal.set_file_path(self.file_path)
+        self.recent_files.touch(self.file_path)
+        if confirm:
+            self._confirm_saves.add(self.file_path)
+        self._saver.submit(self.file_path, snapshot(self.time))
+
+    def _on_saved(self, file_path: str, error: str) -> NoReturn:
+        """Reports the outcome of a background save, on the GUI thread."""
+        confirm = file_path in self._confirm_saves
+        self._confirm_saves.discard(file_path)
+        if error:
+            _popup_error("Save", f"The time could not be saved.\n{error}")
+        elif confirm:
+            _popup_ok("Save", "Time saved successfully.")
 
     def _save_time(self) -> NoReturn:
         """Saves the time."""
         if self.file_path:
-            with open(self.file_path, "w") as file:
-                json.dump(self._convert_to_dict(), file)
-            _popup_ok("Save", "Time saved successfully.")
+            self._write_time(confirm=True)
         else:
             self._save_as_time()
 
@@ -585,39 +756,14 @@ class App:
     def _session_history(self) -> NoReturn:
         """Opens the session history."""
         old_file_path = self.file_path
-        session_history = SessionHistory(self.language, self.past_file_paths)
+        session_history = SessionHistory(self.language, self.recent_files, old_file_path)
         new_file_path = session_history.run()
 
         if old_file_path and _popup_yes_no("Save", "Would you like to save the current file?"):
             self._save_time()
 
         if new_file_path and new_file_path != old_file_path:
-            self.file_path = new_file_path
-            if new_file_path in self.past_file_paths:
-                self.past_file_paths.remove(new_file_path)
-            if old_file_path and old_file_path not in self.past_file_paths:
-                self.past_file_paths.append(old_file_path)
-
-            try:
-                with open(new_file_path, "r") as file:
-                    file_data = json.load(file)
-
-                loads = [Load(load[0], load[1]) for load in file_data["loads"]]
-                self.time.mutate(
-                    start_frame=file_data["start_frame"],
-                    end_frame=file_data["end_frame"],
-                    framerate=file_data["framerate"]
-                )
-                self.time.loads = loads
-
-                self._set_input("start", self.time.start_frame)
-                self._set_input("end", self.time.end_frame)
-                self._set_input("framerate", self.time.framerate)
-                self._set_input("start_loads", "0")
-                self._set_input("end_loads", "0")
-
-            except json.decoder.JSONDecodeError:
-                raise ValueError("The file provided is corrupted.")
+            self._open_file(new_file_path)
 
         self._update_displays()
 
@@ -636,54 +782,39 @@ class App:
         new_file_path = SaveAs(self.language).run()
         if new_file_path != old_file_path:
             self.file_path = new_file_path
-            if old_file_path not in self.past_file_paths and old_file_path is not None:
-                self.past_file_paths.append(old_file_path)
 
         if self.file_path:
-            with open(self.file_path, "w") as file:
-                json.dump(self._convert_to_dict(), file)
+            self._write_time(confirm=False)
 
     # ── Mod note ───────────────────────────────────────────────────────────────
 
     @property
     def _mod_note(self) -> str:
-        """Gets the mod note."""
-        # Guard against zero framerate to avoid DivisionUndefined
-        fps = self.time.framerate
-        if not fps or fps == 0:
-            start_time = 0
-            end_time = 0
-        else:
-            start_time = round(float(self.time.start_frame) / float(fps), self.time.precision)
-            end_time = round(float(self.time.end_frame) / float(fps), self.time.precision)
-
-        # Extract time components without calling the non-existent format_time_components method
-        hours, minutes, seconds, milliseconds = _time_components(self.time.with_loads)
-
-        return self.settings_dict["mod_note_format"].format(
-            time_with_loads=self.time.iso_format(False),
-            time_without_loads=self.time.iso_format(True),
-            hours=hours,
-            minutes=minutes,
-            seconds=seconds,
-            milliseconds=milliseconds,
-            start_frame=self.time.start_frame,
-            end_frame=self.time.end_frame,
-            start_time=start_time,
-            end_time=end_time,
-            total_frames=self.time.length_with_loads,
-            fps=fps,
-            plug="[Conner's Retime Tool](https://github.com/connerglover/conners-retime-tool)",
-        )
+        """Gets the mod note, re-rendering it only if the time or the format changed."""
+        key = (self.time, self.time.revision, self.settings_dict["mod_note_format"])
+        if self._mod_note_cache is None or self._mod_note_cache[0] != key:
+            self._mod_note_cache = (key, self._render_mod_note())
+        return self._mod_note_cache[1]
+
+    def _render_mod_note(self) -> str:
+        """Renders the mod note."""
+        return render_mod_note(self.time, self.settings_dict["mod_note_format"])
 
     # ── Display updates ────────────────────────────────────────────────────────
 
     def _update_displays(self) -> NoReturn:
-        """Update time displays."""
+        """Update time displays, skipping the formatting if the time has not changed since the last update."""
+        if self._displayed == (self.time, self.time.revision, self._loading):
+            return
+        self._displayed = (self.time, self.time.revision, self._loading)
+
         from crt.gui import ClickableLabel
         wl = self.window.window.findChild(ClickableLabel, "without_loads_display")
         ld = self.window.window.findChild(ClickableLabel, "loads_display")
-        if wl:
+        if wl and self._loading:
+            # The time without loads is only known once the loads have been read
+            wl.setText("…")
+        elif wl:
             try:
                 wl.setText(self.time.iso_format(True))
             except (DivisionByZero, DivisionUndefined, InvalidOperation):
@@ -754,9 +885,13 @@ class App:
         win.show()
         self._qt_app.exec()
 
-        # On exit, offer to save
+        # On exit, offer to save, then wait for the write so the outcome can still be shown
         if self.file_path and _popup_yes_no("Exit", "Would you like to save?"):
             self._save_time()
+        self._saver.close()
+        self.recent_files.close()
+        self.journal.close()
+        self._qt_app.processEvents()
 
     def _dispatch(self, event: str, values: dict):
         """Dispatches an event to the appropriate handler."""
@@ -771,8 +906,18 @@ class App:
                 self._save_time()
             case "Save As":
                 self._save_as_time()
+            case "Import Loads":
+                self._import_loads()
+            case "Export Loads":
+                self._export_loads()
+            case "Import Splits":
+                self._import_splits()
             case "Settings":
                 self._settings()
+            case "Undo":
+                self._undo()
+            case "Redo":
+                self._redo()
             case "Clear Loads":
                 self.time.clear_loads()
                 self._update_displays()
@@ -793,10 +938,15 @@ class App:
                 )
             case "Edit Loads":
                 self._edit_loads()
+            case "Merge Loads":
+                self._merge_loads()
+            case "Paste Loads":
+                self._paste_loads()
             case "Add Loads":
                 self._add_loads(values)
             case "Copy Mod Note":
                 try:
+                    self._finish_loading()
                     _clipboard_set(self._mod_note)
                 except Exception as e:
                     self._show_error(e)
@@ -9,6 +9,7 @@ import appdirs
 
 # Local application
 from crt.language import Language
+from crt.mod_note import DEFAULT_FORMAT
 from crt.app_settings.gui import SettingsGUI
 
 
@@ -34,10 +35,10 @@ class Settings:
             "enable_updates": "True",
             "theme": "Automatic",
             "language": "en",
-            "mod_note_format": (
-                "Mod Note {time_without_loads} without loads, and {time_with_loads} "
-                "with loads at {fps} FPS using {plug}"
-            )
+            "mod_note_format": DEFAULT_FORMAT,
+            "merge_loads_on_save": "False",
+            "merge_gap": "0",
+            "undo_limit_mb": "16"
         }
 
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
@@ -86,9 +87,38 @@ class Settings:
             self._apply_theme(values["theme"])
             self.config.set("Settings", "language", str(values["language"]))
             self.config.set("Settings", "mod_note_format", str(values["mod_note_format"]))
+            self.config.set("Settings", "merge_loads_on_save", str(values["merge_loads_on_save"]))
+            self.config.set("Settings", "merge_gap", str(self._clean_gap(values["merge_gap"])))
+            self.config.set("Settings", "undo_limit_mb", str(self._clean_undo_limit(values["undo_limit_mb"])))
             self.config.write(file)
         self._settings_cache = None
 
+    def _clean_gap(self, gap: str) -> int:
+        """Cleans a setting such as the merge gap into a whole number.
+
+        Args:
+            gap (str): The setting value.
+
+        Returns:
+            int: The value, or 0 if it is not a whole number.
+        """
+        digits = "".join(char for char in str(gap) if char.isdigit())
+        return int(digits) if digits else 0
+
+    def _clean_undo_limit(self, limit: str) -> int:
+        """Cleans the undo limit into a number of megabytes.
+
+        Args:
+            limit (str): The setting value.
+
+        Returns:
+            int: The limit, or the default if it is not a whole number of at least 1.
+        """
+        limit = str(limit).strip()
+        if not limit.isdigit() or int(limit) < 1:
+            return int(self.defaults["undo_limit_mb"])
+        return int(limit)
+
     def config_to_dict(self) -> dict:
         """Converts the settings into a dictionary."""
         if self._settings_cache is None:
@@ -96,7 +126,10 @@ class Settings:
                 "enable_updates": self.config.getboolean("Settings", "enable_updates"),
                 "theme": self.config.get("Settings", "theme"),
                 "language": self.config.get("Settings", "language"),
-                "mod_note_format": self.config.get("Settings", "mod_note_format")
+                "mod_note_format": self.config.get("Settings", "mod_note_format"),
+                "merge_loads_on_save": self.config.getboolean("Settings", "merge_loads_on_save"),
+                "merge_gap": self._clean_gap(self.config.get("Settings", "merge_gap")),
+                "undo_limit_mb": self._clean_undo_limit(self.config.get("Settings", "undo_limit_mb"))
             }
         return self._settings_cache
 
@@ -100,6 +100,47 @@ class SettingsDialog(QDialog):
         row3.addWidget(self.mod_note_format)
         layout.addLayout(row3)
 
+        # Merge loads on save checkbox
+        row4 = QHBoxLayout()
+        spacer4 = QWidget(); spacer4.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        row4.addWidget(spacer4)
+        self.merge_loads_on_save = QCheckBox(c["Merge Loads on Save"])
+        self.merge_loads_on_save.setObjectName("merge_loads_on_save")
+        self.merge_loads_on_save.setChecked(settings.get("merge_loads_on_save", False))
+        self.merge_loads_on_save.setFont(QFont("Helvetica", 12))
+        row4.addWidget(self.merge_loads_on_save)
+        layout.addLayout(row4)
+
+        # Merge gap
+        row5 = QHBoxLayout()
+        row5.setSpacing(8)
+        spacer5 = QWidget(); spacer5.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        row5.addWidget(spacer5)
+        lbl_gap = QLabel(c["Merge Gap (Frames)"])
+        lbl_gap.setFont(QFont("Helvetica", 13))
+        row5.addWidget(lbl_gap)
+        self.merge_gap = QLineEdit(str(settings.get("merge_gap", 0)))
+        self.merge_gap.setObjectName("merge_gap")
+        self.merge_gap.setFont(QFont("Helvetica", 11))
+        self.merge_gap.setMaximumWidth(80)
+        row5.addWidget(self.merge_gap)
+        layout.addLayout(row5)
+
+        # Undo limit
+        row6 = QHBoxLayout()
+        row6.setSpacing(8)
+        spacer6 = QWidget(); spacer6.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        row6.addWidget(spacer6)
+        lbl_undo = QLabel(c["Undo Limit (MB)"])
+        lbl_undo.setFont(QFont("Helvetica", 13))
+        row6.addWidget(lbl_undo)
+        self.undo_limit_mb = QLineEdit(str(settings.get("undo_limit_mb", 16)))
+        self.undo_limit_mb.setObjectName("undo_limit_mb")
+        self.undo_limit_mb.setFont(QFont("Helvetica", 11))
+        self.undo_limit_mb.setMaximumWidth(80)
+        row6.addWidget(self.undo_limit_mb)
+        layout.addLayout(row6)
+
         # Separator
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
@@ -128,6 +169,9 @@ class SettingsDialog(QDialog):
             "theme": self.theme.currentText(),
             "language": self.language.currentText(),
             "mod_note_format": self.mod_note_format.text(),
+            "merge_loads_on_save": self.merge_loads_on_save.isChecked(),
+            "merge_gap": self.merge_gap.text(),
+            "undo_limit_mb": self.undo_limit_mb.text(),
         }
 
 
@@ -0,0 +1,100 @@
+# Standard library
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+# Local application
+from crt.retime import open_time, summarise
+from crt.time_binary import EXTENSION
+
+def find_time_files(directory: str, recursive: bool = True) -> Iterator[str]:
+    """Lists the time files in a directory lazily, so a huge directory is never held in memory at once.
+
+    Args:
+        directory (str): The directory.
+        recursive (bool): Whether to look in subdirectories too. Defaults to True.
+
+    Yields:
+        str: The path of every .json and .crtb file.
+    """
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif entry.name.lower().endswith((".json", EXTENSION)):
+                    yield entry.path
+
+def retime_file(path: str, note_format: Optional[str] = None, precision: int = 3) -> dict:
+    """Retimes a single time file, reporting any error instead of raising it.
+
+    Args:
+        path (str): The path of the time file.
+        note_format (str | None): The mod note template. Defaults to None, which leaves out the mod note.
+        precision (int): The precision of the times. Defaults to 3.
+
+    Returns:
+        dict: The path and either the summary, see `crt.retime.summarise`, or the error. Overlapping loads are merged
+        and reported in the summary rather than failing the file.
+    """
+    try:
+        time, merges = open_time(path, precision)
+        return {"path": path, **summarise(time, note_format, merges)}
+    except (KeyError, IndexError) as e:
+        return {"path": path, "error": f"The file or mod note format is missing the field {e}."}
+    except Exception as e:
+        return {"path": path, "error": str(e) or type(e).__name__}
+
+def _retime_chunk(paths: list[str], note_format: Optional[str], precision: int) -> list[dict]:
+    """Retimes a chunk of files in a worker process.
+
+    Args:
+        paths (list[str]): The paths of the time files.
+        note_format (str | None): The mod note template.
+        precision (int): The precision of the times.
+
+    Returns:
+        list[dict]: The result of every file, see `retime_file`.
+    """
+    return [retime_file(path, note_format, precision) for path in paths]
+
+def retime_files(paths: Iterable[str], workers: Optional[int] = None, note_format: Optional[str] = None, precision: int = 3, chunk_size: int = 8) -> Iterator[dict]:
+    """Retimes many time files on a pool of processes, yielding the results as they complete.
+
+    Files are handed to the workers in small chunks to keep the inter-process overhead low, and only a few chunks per
+    worker are in flight at a time. The paths are consumed lazily, so memory stays bounded however many files there
+    are. A file that fails is reported with its error and never stops the batch.
+
+    Args:
+        paths (Iterable[str]): The paths of the time files.
+        workers (int | None): The number of worker processes. Defaults to None, which uses one per CPU.
+        note_format (str | None): The mod note template. Defaults to None, which leaves out the mod note.
+        precision (int): The precision of the times. Defaults to 3.
+        chunk_size (int): The number of files per task. Defaults to 8.
+
+    Yields:
+        dict: The result of every file in completion order, see `retime_file`.
+    """
+    workers = workers or os.cpu_count() or 1
+    paths = iter(paths)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        running: set[Future] = set()
+
+        def submit() -> bool:
+            chunk = list(islice(paths, chunk_size))
+            if chunk:
+                running.add(pool.submit(_retime_chunk, chunk, note_format, precision))
+            return bool(chunk)
+
+        for _ in range(workers * 2):
+            if not submit():
+                break
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running.discard(future)
+                submit()
+                yield from future.result()
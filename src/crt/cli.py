@@ -0,0 +1,335 @@
+"""
+The command-line interface of CRT.
+
+Usage:
+    crt retime [FILE] [-s START] [-e END] [-f FRAMERATE] [-l START END]... [-p PRECISION] [--json]
+    crt mod-note [FILE] [...the retime options] [--format TEMPLATE]
+    crt convert SOURCE [DESTINATION]
+    crt batch DIRECTORY [-j WORKERS] [--mod-note] [--format TEMPLATE] [-o OUTPUT]
+    crt serve [--host HOST] [--port PORT] [--unix PATH] [-j WORKERS]
+    crt watch DIRECTORY [-o OUTPUT] [--index PATH] [--debounce SECONDS] [--poll] [--once] [--mod-note]
+
+Frames can be given as frame numbers, timestamps such as 1:02.5 or YouTube debug info. Only the headless core is
+imported, so a call starts in tens of milliseconds.
+"""
+
+# Standard library
+import argparse
+import json
+import os
+import sys
+from typing import Optional
+
+# Local application
+from crt._version import __version__
+from crt.coalesce import Merge
+from crt.framerate import FramerateLike, to_fraction
+from crt.mod_note import DEFAULT_FORMAT, render_mod_note
+from crt.parsing import parse_frame
+from crt.retime import open_time, summarise
+from crt.time import Time
+from crt.time_binary import EXTENSION, binary_to_json, is_binary, json_to_binary
+
+def _frame(text: str, framerate: FramerateLike) -> int:
+    """Converts a frame argument into a frame number.
+
+    Args:
+        text (str): The argument.
+        framerate (FramerateLike): The framerate used to convert timestamps.
+
+    Raises:
+        ValueError: The argument is not a frame, timestamp or debug info.
+
+    Returns:
+        int: The frame number.
+    """
+    if not any(char.isdigit() for char in text):
+        raise ValueError(f"The frame {text!r} is invalid.")
+    return parse_frame(text, framerate)
+
+def _precision(text: str) -> int:
+    """Converts a precision argument into a number of decimal places.
+
+    Args:
+        text (str): The argument.
+
+    Raises:
+        argparse.ArgumentTypeError: The argument is not a whole number from 0 to 9.
+
+    Returns:
+        int: The number of decimal places.
+    """
+    if not text.isdigit() or int(text) > 9:
+        raise argparse.ArgumentTypeError(f"{text!r} is not a whole number from 0 to 9")
+    return int(text)
+
+def build_time(args: argparse.Namespace) -> tuple[Time, list[Merge]]:
+    """Builds the time described by the retime options.
+
+    A time file is opened first, and the start, end and framerate options then override its run. Overlapping loads in
+    the file are merged. Loads given as options are added to the loads of the file.
+
+    Args:
+        args (argparse.Namespace): The parsed options.
+
+    Raises:
+        ValueError: An option is invalid, or a load overlaps another load or lies outside of the run.
+
+    Returns:
+        tuple[Time, list[Merge]]: The time, and every load made by merging overlapping loads of the file.
+    """
+    merges = []
+    if args.file:
+        time, merges = open_time(args.file, args.precision)
+    elif args.start is None or args.end is None:
+        raise ValueError("Give a time file, or both --start and --end.")
+    else:
+        time = Time(precision=args.precision)
+
+    if args.framerate is not None:
+        framerate = to_fraction(args.framerate)
+        if framerate <= 0:
+            raise ValueError("The framerate must be greater than 0.")
+        time.mutate(framerate=framerate)
+    framerate = time.framerate_fraction
+    time.mutate(
+        start_frame=None if args.start is None else _frame(args.start, framerate),
+        end_frame=None if args.end is None else _frame(args.end, framerate),
+    )
+    if time.end_frame < time.start_frame:
+        raise ValueError("The run ends before it starts.")
+    if args.load:
+        time.add_loads((_frame(start, framerate), _frame(end, framerate)) for start, end in args.load)
+    return time, merges
+
+def _retime(args: argparse.Namespace) -> str:
+    """Retimes the run.
+
+    Args:
+        args (argparse.Namespace): The parsed options.
+
+    Returns:
+        str: The output.
+    """
+    time, merges = build_time(args)
+    if args.json:
+        return json.dumps(summarise(time, merges=merges))
+    lines = [
+        f"Without loads: {time.iso_format(True)}",
+        f"With loads: {time.iso_format(False)}",
+    ]
+    if time.loads:
+        lines.append(f"Loads: {len(time.loads)} ({time.frames_to_time(time.total_load_length)} s)")
+    if merges:
+        lines.append(f"Merged {sum(merge.count for merge in merges)} overlapping loads into {len(merges)}.")
+    return "\n".join(lines)
+
+def _mod_note(args: argparse.Namespace) -> str:
+    """Renders the mod note.
+
+    Args:
+        args (argparse.Namespace): The parsed options.
+
+    Returns:
+        str: The output.
+    """
+    time, merges = build_time(args)
+    try:
+        if args.json:
+            return json.dumps(summarise(time, args.format, merges))
+        if merges:
+            # The note itself is meant to be pasted, so the merge is reported beside it
+            print(f"Merged {sum(merge.count for merge in merges)} overlapping loads into {len(merges)}.", file=sys.stderr)
+        return render_mod_note(time, args.format)
+    except (KeyError, IndexError, AttributeError) as e:
+        raise ValueError(f"The mod note format uses an unknown field: {e}")
+
+def _convert(args: argparse.Namespace) -> str:
+    """Converts a time file between JSON and the binary format.
+
+    Args:
+        args (argparse.Namespace): The parsed options.
+
+    Returns:
+        str: The output.
+    """
+    to_json = is_binary(args.source)
+    destination = args.destination
+    if destination is None:
+        destination = args.source.rsplit(".", 1)[0] + (".json" if to_json else EXTENSION)
+    count = (binary_to_json if to_json else json_to_binary)(args.source, destination)
+    return f"Converted {count} loads to {destination}"
+
+def _batch(args: argparse.Namespace) -> str:
+    """Retimes every time file in a directory, writing one JSON line per file as soon as it is done.
+
+    Args:
+        args (argparse.Namespace): The parsed options.
+
+    Raises:
+        ValueError: At least one file could not be retimed. Its error is in its line.
+
+    Returns:
+        str: The number of files retimed.
+    """
+    # The process pool is only needed here, so plain retimes do not pay for importing it
+    from crt.batch import find_time_files, retime_files
+
+    if not os.path.isdir(args.directory):
+        raise ValueError(f"{args.directory} is not a directory.")
+    note_format = args.format if args.mod_note else None
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    count = errors = 0
+    try:
+        paths = find_time_files(args.directory, not args.no_recursive)
+        for result in retime_files(paths, args.workers, note_format, args.precision):
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+            count += 1
+            errors += "error" in result
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    if errors:
+        raise ValueError(f"{errors} of {count} files could not be retimed.")
+    return f"Retimed {count} files." if args.output else ""
+
+def _serve(args: argparse.Namespace) -> str:
+    """Runs the retime service until it is interrupted, see `crt.server`.
+
+    Args:
+        args (argparse.Namespace): The parsed options.
+
+    Returns:
+        str: The output.
+    """
+    from crt.server import run_server
+
+    where = args.unix or f"http://{args.host}:{args.port}"
+    print(f"Serving retimes on {where}, press Ctrl+C to stop.", file=sys.stderr)
+    run_server(args.host, args.port, args.unix, args.workers)
+    return ""
+
+def _watch(args: argparse.Namespace) -> str:
+    """Retimes the changed time files in a directory, then keeps watching it until interrupted, see `crt.watch`.
+
+    Args:
+        args (argparse.Namespace): The parsed options.
+
+    Returns:
+        str: The output.
+    """
+    from crt.watch import FolderWatcher, open_result_log
+
+    note_format = args.format if args.mod_note else None
+    log = open_result_log(args.output)
+    try:
+        watcher = FolderWatcher(
+            args.directory, log, args.index, not args.no_recursive, args.debounce, args.interval, args.poll,
+            note_format, args.precision, args.workers,
+        )
+    except BaseException:
+        log.close()
+        raise
+    try:
+        if args.once:
+            count = watcher.sync()
+            return f"Retimed {count} files." if args.output else ""
+        print(f"Watching {watcher.directory}, press Ctrl+C to stop.", file=sys.stderr)
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            pass
+        return ""
+    finally:
+        watcher.close()
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(prog="crt", description="Conner's Retime Tool")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    time_options = argparse.ArgumentParser(add_help=False)
+    time_options.add_argument("file", nargs="?", help="a .json or .crtb time file")
+    time_options.add_argument("-s", "--start", help="the first frame of the run")
+    time_options.add_argument("-e", "--end", help="the final frame of the run")
+    time_options.add_argument("-f", "--framerate", help="the framerate, e.g. 60, 59.94 or 30000/1001 (default: 60)")
+    time_options.add_argument(
+        "-l", "--load", nargs=2, action="append", metavar=("START", "END"), help="a load, may be repeated"
+    )
+    time_options.add_argument("-p", "--precision", type=_precision, default=3, help="decimal places, 0 to 9 (default: 3)")
+    time_options.add_argument("--json", action="store_true", help="print the result as JSON")
+
+    retime = commands.add_parser("retime", parents=[time_options], help="print the time with and without loads")
+    retime.set_defaults(handler=_retime)
+
+    mod_note = commands.add_parser("mod-note", parents=[time_options], help="print a mod note")
+    mod_note.add_argument("--format", default=DEFAULT_FORMAT, help="the mod note template")
+    mod_note.set_defaults(handler=_mod_note)
+
+    convert = commands.add_parser("convert", help="convert a time file between .json and .crtb")
+    convert.add_argument("source", help="the time file to convert")
+    convert.add_argument("destination", nargs="?", help="the converted file, next to the source by default")
+    convert.set_defaults(handler=_convert)
+
+    batch = commands.add_parser("batch", help="retime every time file in a directory, as JSON Lines")
+    batch.add_argument("directory", help="the directory to retime")
+    batch.add_argument("-j", "--workers", type=int, help="the number of worker processes (default: one per CPU)")
+    batch.add_argument("-o", "--output", help="the JSON Lines file to write (default: standard output)")
+    batch.add_argument("--no-recursive", action="store_true", help="leave out subdirectories")
+    batch.add_argument("--mod-note", action="store_true", help="include a mod note for every file")
+    batch.add_argument("--format", default=DEFAULT_FORMAT, help="the mod note template")
+    batch.add_argument("-p", "--precision", type=_precision, default=3, help="decimal places, 0 to 9 (default: 3)")
+    batch.set_defaults(handler=_batch)
+
+    serve = commands.add_parser("serve", help="serve retimes over local HTTP/JSON")
+    serve.add_argument("--host", default="127.0.0.1", help="the address to listen on (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="the port to listen on (default: 8765)")
+    serve.add_argument("--unix", help="listen on this Unix socket instead of TCP")
+    serve.add_argument("-j", "--workers", type=int, help="worker processes for large requests (default: one per CPU)")
+    serve.set_defaults(handler=_serve)
+
+    watch = commands.add_parser("watch", help="retime the time files in a directory whenever they change")
+    watch.add_argument("directory", help="the directory to watch")
+    watch.add_argument(
+        "-o", "--output", help="a JSON Lines file, or a .sqlite/.sqlite3/.db database, to append to (default: standard output)"
+    )
+    watch.add_argument("--index", help="the index of retimed files (default: .crt-index.sqlite3 in the directory)")
+    watch.add_argument("--debounce", type=float, default=0.5, help="quiet seconds before a changed file is retimed (default: 0.5)")
+    watch.add_argument("--poll", action="store_true", help="poll for changes even where inotify is available")
+    watch.add_argument("--interval", type=float, default=2.0, help="seconds between polls (default: 2)")
+    watch.add_argument("--once", action="store_true", help="retime the files changed since the last run and exit")
+    watch.add_argument("--no-recursive", action="store_true", help="leave out subdirectories")
+    watch.add_argument("--mod-note", action="store_true", help="include a mod note for every file")
+    watch.add_argument("--format", default=DEFAULT_FORMAT, help="the mod note template")
+    watch.add_argument("-p", "--precision", type=_precision, default=3, help="decimal places, 0 to 9 (default: 3)")
+    watch.add_argument("-j", "--workers", type=int, help="worker processes when many files change (default: one per CPU)")
+    watch.set_defaults(handler=_watch)
+    return parser
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Runs the command-line interface.
+
+    Args:
+        argv (list[str] | None): The arguments. Defaults to None, which reads them from the command line.
+
+    Returns:
+        int: The exit code: 0 on success, 1 if the input is invalid and 2 if the arguments are.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        output = args.handler(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if output:
+        print(output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+# Standard library
+from dataclasses import dataclass
+from typing import Iterable, Union
+
+# Local application
+from crt.load import Load, LoadStore
+
+@dataclass(frozen=True, slots=True)
+class Merge:
+    """
+    A load produced by merging several overlapping or adjacent loads.
+    """
+    start_frame: int
+    end_frame: int
+    count: int
+
+def coalesce(loads: Iterable[Union[Load, tuple[int, int]]], gap: int = 0, presorted: bool = False) -> tuple[LoadStore, list[Merge]]:
+    """Merges loads that overlap, touch, or are at most `gap` frames apart.
+
+    Sorting dominates, so this is O(n log n), or O(n) if the loads are already sorted by start frame.
+
+    Args:
+        loads (Iterable[Load | tuple[int, int]]): The loads to merge, in any order.
+        gap (int): The largest number of frames between two loads that still merges them. Defaults to 0, which only
+            merges loads that overlap or touch.
+        presorted (bool): Whether the loads are already sorted by start frame. Defaults to False.
+
+    Raises:
+        ValueError: The gap is negative.
+
+    Returns:
+        tuple[LoadStore, list[Merge]]: The merged loads sorted by start frame, and every load that was made from more
+        than one load.
+    """
+    if gap < 0:
+        raise ValueError("The merge gap cannot be negative.")
+
+    pairs = loads.pairs() if isinstance(loads, LoadStore) else (
+        (load.start_frame, load.end_frame) if isinstance(load, Load) else tuple(load) for load in loads
+    )
+    if not presorted:
+        pairs = sorted(pairs)
+
+    merged = LoadStore()
+    merges = []
+    current_start = current_end = None
+    count = 0
+    for start_frame, end_frame in pairs:
+        if current_end is not None and start_frame - current_end <= gap:
+            current_end = max(current_end, end_frame)
+            count += 1
+            continue
+        if current_end is not None:
+            merged.append(current_start, current_end)
+            if count > 1:
+                merges.append(Merge(current_start, current_end, count))
+        current_start, current_end, count = start_frame, end_frame, 1
+    if current_end is not None:
+        merged.append(current_start, current_end)
+        if count > 1:
+            merges.append(Merge(current_start, current_end, count))
+    return merged, merges
@@ -0,0 +1,30 @@
+"""
+The headless core of CRT: times, loads, parsing, formatting, time files and mod notes, without Qt.
+"""
+
+from crt.coalesce import Merge, coalesce
+from crt.formatting import iso_format, src_format, time_components
+from crt.framerate import FramerateLike, parse_framerate, to_display, to_fraction
+from crt.load import Load, LoadStore, LoadValidationError
+from crt.mod_note import DEFAULT_FORMAT, render_mod_note
+from crt.parsing import debug_info_to_seconds, is_debug_info, parse_frame, parse_timestamp
+from crt.retime import open_time, summarise
+from crt.time import Op, Time
+from crt.time_binary import binary_to_json, is_binary, json_to_binary, open_binary
+from crt.time_file import load_time_file, read_run, save_time_file, snapshot
+
+__name__ = "crt.core"
+__author__ = "Conner Glover"
+__description__ = "The headless core of CRT: times, loads, parsing, formatting, time files and mod notes, without Qt."
+__all__ = [
+    "Merge", "coalesce",
+    "iso_format", "src_format", "time_components",
+    "FramerateLike", "parse_framerate", "to_display", "to_fraction",
+    "Load", "LoadStore", "LoadValidationError",
+    "DEFAULT_FORMAT", "render_mod_note",
+    "debug_info_to_seconds", "is_debug_info", "parse_frame", "parse_timestamp",
+    "open_time", "summarise",
+    "Op", "Time",
+    "binary_to_json", "is_binary", "json_to_binary", "open_binary",
+    "load_time_file", "read_run", "save_time_file", "snapshot",
+]
@@ -1,7 +1,6 @@
 # Standard library
-from decimal import Decimal as d
 from functools import wraps
-from typing import Callable, Tuple
+from typing import Callable
 
 def error_handler(func: Callable) -> Callable:
     """Handles errors by showing popup rather than crashing the program.
@@ -40,13 +39,26 @@ def validate_load(func: Callable) -> Callable:
         end_frame = kwargs.get('end_frame', args[1] if len(args) > 1 else None)
         
         if start_frame is not None and end_frame is not None:
-            if start_frame == end_frame:
-                raise ValueError("The duration of the load is 0.000")
-            if start_frame > end_frame:
-                raise ValueError("The load time ends before it starts.")
+            check_load(start_frame, end_frame)
         return func(self, *args, **kwargs)
     return wrapper
 
+def check_load(start_frame: int, end_frame: int) -> None:
+    """Checks the frames of a single load, the same way `validate_load` does.
+
+    Args:
+        start_frame (int): The first frame of the load.
+        end_frame (int): The final frame of the load.
+
+    Raises:
+        ValueError: The duration of the load is 0.000
+        ValueError: The load time ends before it starts.
+    """
+    if start_frame == end_frame:
+        raise ValueError("The duration of the load is 0.000")
+    if start_frame > end_frame:
+        raise ValueError("The load time ends before it starts.")
+
 def format_time(func: Callable) -> Callable:
     """Pre-formats time into hours, minutes, seconds, and milliseconds.
 
@@ -55,36 +67,9 @@ def format_time(func: Callable) -> Callable:
 
     Returns:
         Callable: Function containing the formatted time.
-    """    
-    def format_components(time: d) -> Tuple[str, str, str, str]:
-        """Formats the tiem into hours, minutes, seconds, and milliseconds.
-
-        Args:
-            time (d): The time to format.
-
-        Returns:
-            Tuple[str, str, str, str]: A tuple containing the elements of the formatted time.
-        """        
-        time_str = str(max(time, d(0)))
-        
-        if '.' in time_str:
-            seconds, milliseconds = map(int, time_str.split(".", 1))
-        else:
-            seconds, milliseconds = int(time_str), 0
-        
-        minutes, seconds = divmod(seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        
-        return (
-            f"{hours:02}",
-            f"{minutes:02}", 
-            f"{seconds:02}",
-            str(milliseconds).rjust(3, "0")
-        )
-
+    """
     @wraps(func)
     def wrapper(self, loads: bool = False) -> str:
-        time_value = self.without_loads if loads else self.with_loads
-        hours, minutes, seconds, ms = format_components(time_value)
+        hours, minutes, seconds, ms = self.time_components(loads)
         return func(self, hours, minutes, seconds, ms)
     return wrapper
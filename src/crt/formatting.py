@@ -0,0 +1,60 @@
+# Standard library
+from typing import Tuple
+
+def time_components(units: int, precision: int) -> Tuple[str, str, str, str]:
+    """Splits a time into hours, minutes, seconds and the fractional part using integer arithmetic only.
+
+    Args:
+        units (int): The time in whole `10 ** -precision` second units, see `crt.framerate.frames_to_units`.
+        precision (int): The number of decimal places.
+
+    Returns:
+        Tuple[str, str, str, str]: The zero-padded hours, minutes and seconds, and the fractional part padded to
+        `precision` digits (empty when the precision is 0). Negative times are clamped to zero.
+    """
+    seconds, fraction = divmod(max(units, 0), 10 ** precision)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    return (
+        f"{hours:02}",
+        f"{minutes:02}",
+        f"{seconds:02}",
+        f"{fraction:0{precision}}" if precision else "",
+    )
+
+def iso_format(hours: str, minutes: str, seconds: str, fraction: str) -> str:
+    """Joins time components in ISO format, dropping leading zero hours and minutes.
+
+    Args:
+        hours (str): String of hours
+        minutes (str): String of minutes
+        seconds (str): String of seconds
+        fraction (str): String of the fractional part, may be empty
+
+    Returns:
+        str: Formatted time
+    """
+    suffix = f".{fraction}" if fraction else ""
+    if hours != "00":
+        return f"{hours}:{minutes}:{seconds}{suffix}"
+    elif minutes != "00":
+        return f"{minutes}:{seconds}{suffix}"
+    return f"{seconds}{suffix}"
+
+def src_format(hours: str, minutes: str, seconds: str, fraction: str) -> str:
+    """Joins time components in Speedrun.com format, which only has milliseconds.
+
+    Args:
+        hours (str): String of hours
+        minutes (str): String of minutes
+        seconds (str): String of seconds
+        fraction (str): String of the fractional part, may be empty
+
+    Returns:
+        str: Formatted time
+    """
+    if not fraction:
+        return f"{hours}h {minutes}m {seconds}s"
+    milliseconds = fraction.ljust(3, "0")[:3]
+    return f"{hours}h {minutes}m {seconds}s {milliseconds}ms"
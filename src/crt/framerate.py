@@ -0,0 +1,147 @@
+# Standard library
+import re
+from decimal import Decimal as d
+from fractions import Fraction
+from typing import Union
+
+FramerateLike = Union[int, str, d, Fraction, float]
+
+def to_fraction(framerate: FramerateLike) -> Fraction:
+    """Converts a framerate into an exact rational.
+
+    Strings may be decimals such as "29.97" or ratios such as "30000/1001". Floats go through their shortest string
+    form so 59.94 becomes 2997/50 rather than its binary approximation.
+
+    Args:
+        framerate (FramerateLike): The framerate to convert.
+
+    Raises:
+        ValueError: The framerate is not a number.
+
+    Returns:
+        Fraction: The exact framerate.
+    """
+    if isinstance(framerate, Fraction):
+        return framerate
+    if isinstance(framerate, float):
+        framerate = repr(framerate)
+    try:
+        return Fraction(str(framerate).strip())
+    except (ValueError, ZeroDivisionError):
+        raise ValueError(f"The framerate {framerate!r} is invalid.")
+
+def to_display(framerate: Fraction) -> Union[d, Fraction]:
+    """Converts an exact framerate into the value shown to the user.
+
+    Framerates with a terminating decimal expansion become a Decimal ("59.94"), anything else stays a ratio
+    ("30000/1001") so it can be round-tripped through a time file without drifting.
+
+    Args:
+        framerate (Fraction): The exact framerate.
+
+    Returns:
+        d | Fraction: The framerate as a Decimal if it is exact, otherwise the Fraction.
+    """
+    denominator = framerate.denominator
+    twos = fives = 0
+    while denominator % 2 == 0:
+        denominator //= 2
+        twos += 1
+    while denominator % 5 == 0:
+        denominator //= 5
+        fives += 1
+    if denominator != 1:
+        return framerate
+    places = max(twos, fives)
+    return d(framerate.numerator * 10 ** places // framerate.denominator).scaleb(-places)
+
+def parse_framerate(text: str) -> Union[d, Fraction]:
+    """Cleans a framerate typed or pasted by the user.
+
+    Rules:
+    - Strip all non-numeric characters other than "." and "/".
+    - If no digits remain, return Decimal('0').
+    - Collapse multiple decimal points (keep only the first).
+    - Trailing decimal point gets a '0' appended.
+    - A single "/" between two numbers is read as a ratio, e.g. "30000/1001".
+
+    Args:
+        text (str): The framerate text.
+
+    Returns:
+        d | Fraction: The framerate, see `to_display`.
+    """
+    cleaned = re.sub(r'[^0-9./]', '', text)
+    numerator, _, denominator = cleaned.partition('/')
+    numerator = _clean_decimal(numerator)
+    if numerator is None:
+        return d('0')
+    denominator = _clean_decimal(denominator.replace('/', ''))
+    if denominator is None or denominator == 0:
+        return numerator
+    return to_display(Fraction(numerator) / Fraction(denominator))
+
+def _clean_decimal(text: str) -> Union[d, None]:
+    """Cleans the digits and decimal points of one side of a framerate.
+
+    Args:
+        text (str): The text containing only digits and decimal points.
+
+    Returns:
+        d | None: The number, or None if there are no digits.
+    """
+    if not re.search(r'[0-9]', text):
+        return None
+    if text.count('.') > 1:
+        idx = text.find('.')
+        text = text[:idx + 1] + text[idx + 1:].replace('.', '')
+    if text.endswith('.'):
+        text += '0'
+    return d(text)
+
+def frames_to_units(frames: int, framerate: Fraction, precision: int) -> int:
+    """Converts frames into a whole number of `10 ** -precision` second units using integer arithmetic only.
+
+    The result is rounded half to even, which matches rounding a Decimal to `precision` places.
+
+    Args:
+        frames (int): The number of frames.
+        framerate (Fraction): The exact framerate.
+        precision (int): The number of decimal places.
+
+    Returns:
+        int: The rounded time in units, or 0 if the framerate is 0.
+    """
+    if not framerate:
+        return 0
+    numerator = frames * framerate.denominator * 10 ** precision
+    divisor = framerate.numerator
+    quotient, remainder = divmod(numerator, divisor)
+    twice = remainder * 2
+    if twice > divisor or (twice == divisor and quotient & 1):
+        quotient += 1
+    return quotient
+
+def seconds_to_frame(seconds: Union[d, str], framerate: FramerateLike) -> int:
+    """Converts a timestamp into the nearest frame, rounding half to even.
+
+    Args:
+        seconds (d | str): The timestamp in seconds.
+        framerate (FramerateLike): The framerate of the video.
+
+    Returns:
+        int: The frame number.
+    """
+    return round(Fraction(d(str(seconds))) * to_fraction(framerate))
+
+def units_to_decimal(units: int, precision: int) -> d:
+    """Converts whole `10 ** -precision` second units into seconds.
+
+    Args:
+        units (int): The time in units.
+        precision (int): The number of decimal places.
+
+    Returns:
+        d: The time in seconds with exactly `precision` decimal places.
+    """
+    return d(units).scaleb(-precision)
@@ -4,8 +4,8 @@ from PySide6.QtWidgets import (
     QLabel, QLineEdit, QPushButton, QFrame, QMenuBar, QMenu,
     QSizePolicy, QApplication
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QAction, QFont
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtGui import QAction, QFont, QKeySequence
 
 # Local application
 from crt.base_gui import BaseGUI
@@ -20,6 +20,16 @@ class ClickableLabel(QLabel):
         super().mousePressEvent(event)
 
 
+class SaveNotifier(QObject):
+    """Carries the outcome of a background save back to the GUI thread: the file path and the error, or ""."""
+    finished = Signal(str, str)
+
+
+class LoadNotifier(QObject):
+    """Carries the outcome of a background open back to the GUI thread: the file path, the contents and the error."""
+    finished = Signal(str, object, object)
+
+
 class MainWindow(QMainWindow):
     """The main QMainWindow for CRT."""
 
@@ -47,15 +57,24 @@ class MainWindow(QMainWindow):
         self._add_action(file_menu, c["Save"],            "Save")
         self._add_action(file_menu, c["Save As"],         "Save As")
         file_menu.addSeparator()
+        self._add_action(file_menu, c["Import Loads"],    "Import Loads")
+        self._add_action(file_menu, c["Export Loads"],    "Export Loads")
+        self._add_action(file_menu, c["Import Splits"],   "Import Splits")
+        file_menu.addSeparator()
         self._add_action(file_menu, c["Settings"],        "Settings")
         file_menu.addSeparator()
         self._add_action(file_menu, c["Exit"],            "Exit")
 
         edit_menu = menubar.addMenu(c["Edit (Menu Bar)"])
+        self._add_action(edit_menu, c["Undo"],            "Undo").setShortcut(QKeySequence.StandardKey.Undo)
+        self._add_action(edit_menu, c["Redo"],            "Redo").setShortcut(QKeySequence.StandardKey.Redo)
+        edit_menu.addSeparator()
         self._add_action(edit_menu, c["Copy Mod Note"],   "Copy Mod Note")
         edit_menu.addSeparator()
         self._add_action(edit_menu, c["Clear Loads"],     "Clear Loads")
         self._add_action(edit_menu, c["Edit Loads"],      "Edit Loads")
+        self._add_action(edit_menu, c["Merge Loads"],     "Merge Loads")
+        self._add_action(edit_menu, c["Paste Loads"],     "Paste Loads")
 
         help_menu = menubar.addMenu(c["Help"])
         self._add_action(help_menu, c["Check for Updates"], "Check for Updates")
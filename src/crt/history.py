@@ -0,0 +1,172 @@
+# Standard library
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Local application
+from crt.time import Edit, Op, Time
+
+class EditHistory:
+    """
+    An undo/redo journal for a `Time`.
+
+    The journal stores the compact edits the time reports (an op code plus a few frame numbers) instead of copies of
+    the time, so recording an edit is O(1). Only bulk load replacements carry load snapshots. Once the estimated size
+    of the journal exceeds `max_bytes` the oldest edits are forgotten.
+    """
+
+    # Rough size of a small edit tuple: the tuple itself plus its int objects
+    EDIT_BYTES = 64
+    INT_BYTES = 32
+
+    def __init__(self, time: Optional[Time] = None, max_bytes: int = 16 * 1024 * 1024) -> None:
+        """Initializes the EditHistory class.
+
+        Args:
+            time (Time | None): The time to record. Defaults to None.
+            max_bytes (int): The memory cap of the journal in bytes. Defaults to 16 MiB.
+        """
+        self.max_bytes = max_bytes
+        self.time = None
+        self._undo: deque[Edit] = deque()
+        self._redo: deque[Edit] = deque()
+        self._size = 0
+        self._replaying = False
+        if time is not None:
+            self.attach(time)
+
+    @property
+    def can_undo(self) -> bool:
+        """Whether there is an edit to undo.
+
+        Returns:
+            bool: True if `undo` would do something.
+        """
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Whether there is an edit to redo.
+
+        Returns:
+            bool: True if `redo` would do something.
+        """
+        return bool(self._redo)
+
+    @property
+    def size(self) -> int:
+        """The estimated memory used by the undo and redo stacks.
+
+        Returns:
+            int: The estimated size in bytes.
+        """
+        return self._size
+
+    def attach(self, time: Time) -> None:
+        """Starts recording a time, forgetting the edits of the previous one.
+
+        Args:
+            time (Time): The time to record.
+        """
+        self.detach()
+        self.time = time
+        time.subscribe(self._record)
+
+    def detach(self) -> None:
+        """Stops recording and forgets every edit."""
+        if self.time is not None:
+            self.time.unsubscribe(self._record)
+            self.time = None
+        self.clear()
+
+    def clear(self) -> None:
+        """Forgets every edit."""
+        self._undo.clear()
+        self._redo.clear()
+        self._size = 0
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """Stops recording edits inside a `with` block, e.g. while a file replaces the time.
+
+        Yields:
+            None: Nothing.
+        """
+        replaying = self._replaying
+        self._replaying = True
+        try:
+            yield
+        finally:
+            self._replaying = replaying
+
+    def _estimate(self, edit: Edit) -> int:
+        """Estimates the memory held by an edit.
+
+        Args:
+            edit (Edit): The edit.
+
+        Returns:
+            int: The estimated size in bytes.
+        """
+        if edit[0] == Op.REPLACE_LOADS:
+            return self.EDIT_BYTES + edit[1].nbytes + edit[2].nbytes
+        return self.EDIT_BYTES + self.INT_BYTES * len(edit)
+
+    def _record(self, edit: Edit) -> None:
+        """Records an edit reported by the time.
+
+        Args:
+            edit (Edit): The edit.
+        """
+        if self._replaying:
+            return
+        if self._redo:
+            self._size -= sum(map(self._estimate, self._redo))
+            self._redo.clear()
+        self._undo.append(edit)
+        self._size += self._estimate(edit)
+        while self._size > self.max_bytes and self._undo:
+            self._size -= self._estimate(self._undo.popleft())
+
+    def _replay(self, edit: Edit, reverse: bool) -> None:
+        """Applies an edit to the time without recording it again.
+
+        Args:
+            edit (Edit): The edit.
+            reverse (bool): Whether to revert the edit.
+        """
+        self._replaying = True
+        try:
+            self.time.apply(edit, reverse=reverse)
+        finally:
+            self._replaying = False
+
+    def undo(self) -> bool:
+        """Reverts the most recent edit.
+
+        Returns:
+            bool: True if an edit was reverted.
+        """
+        if not self._undo or self.time is None:
+            return False
+        # Only move the edit once it applied, so a failed replay leaves it where it was
+        edit = self._undo[-1]
+        self._replay(edit, reverse=True)
+        self._undo.pop()
+        self._redo.append(edit)
+        return True
+
+    def redo(self) -> bool:
+        """Re-applies the most recently reverted edit.
+
+        Returns:
+            bool: True if an edit was re-applied.
+        """
+        if not self._redo or self.time is None:
+            return False
+        # Only move the edit once it applied, so a failed replay leaves it where it was
+        edit = self._redo[-1]
+        self._replay(edit, reverse=False)
+        self._redo.pop()
+        self._undo.append(edit)
+        return True
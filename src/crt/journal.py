@@ -0,0 +1,394 @@
+# Standard library
+import json
+import os
+import re
+import shutil
+import struct
+import sys
+import warnings
+import zlib
+from array import array
+from time import monotonic, time as wall_time
+from typing import BinaryIO, Optional
+
+# Local application
+from crt.load import LoadStore
+from crt.time import Edit, Op, Time
+from crt.time_file import SaveWorker, load_time_file, snapshot, write_atomic
+
+# op, payload length and CRC-32 of the payload, followed by the payload
+RECORD = struct.Struct("<BII")
+
+# The number of frame numbers in every edit but REPLACE_LOADS, whose payload is its two load columns instead
+_EDIT_SIZES = {Op.MUTATE: 8, Op.ADD_LOAD: 3, Op.DELETE_LOAD: 3, Op.MUTATE_LOAD: 6}
+
+_SNAPSHOT = re.compile(r"snapshot\.(\d+)\.crtb")
+_LOG = re.compile(r"edits\.(\d+)\.log")
+
+def _snapshot_name(generation: int) -> str:
+    return f"snapshot.{generation}.crtb"
+
+def _log_name(generation: int) -> str:
+    return f"edits.{generation}.log"
+
+def _lock(file: BinaryIO) -> bool:
+    """Takes an exclusive lock on an open file without waiting.
+
+    The operating system drops the lock when the process ends, however it ends, which is what tells a crashed session
+    from one that is still running.
+
+    Args:
+        file (BinaryIO): The file.
+
+    Returns:
+        bool: True if the lock was taken, False if another process holds it.
+    """
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+def encode_edit(edit: Edit) -> bytes:
+    """Packs an edit into a journal record.
+
+    Args:
+        edit (Edit): The edit, see `Op`.
+
+    Returns:
+        bytes: The record.
+    """
+    op = Op(edit[0])
+    if op == Op.REPLACE_LOADS:
+        # Only the new loads are needed to replay the edit
+        payload = b"".join((edit[2].starts, edit[2].ends))
+    else:
+        payload = struct.pack(f"<{_EDIT_SIZES[op]}q", *edit[1:])
+    return RECORD.pack(op, len(payload), zlib.crc32(payload)) + payload
+
+def _decode_payload(op: Op, payload: bytes) -> Edit:
+    """Unpacks the payload of a journal record.
+
+    Args:
+        op (Op): The op of the record.
+        payload (bytes): The payload.
+
+    Raises:
+        ValueError: The payload does not fit the op.
+
+    Returns:
+        Edit: The edit. REPLACE_LOADS edits have no old loads.
+    """
+    if op == Op.REPLACE_LOADS:
+        if len(payload) % 16:
+            raise ValueError("The journal record is corrupted.")
+        columns = array(LoadStore.TYPECODE)
+        columns.frombytes(payload)
+        if sys.byteorder != "little":
+            columns.byteswap()
+        count = len(columns) // 2
+        return (op, None, LoadStore.from_arrays(columns[:count], columns[count:]))
+    size = _EDIT_SIZES[op]
+    if len(payload) != size * 8:
+        raise ValueError("The journal record is corrupted.")
+    return (op, *struct.unpack(f"<{size}q", payload))
+
+def read_edits(buffer: bytes) -> list[Edit]:
+    """Reads the edits of a journal log.
+
+    Reading stops at the first record that is incomplete or fails its checksum, which is where a crash interrupted
+    the last append.
+
+    Args:
+        buffer (bytes): The contents of the log.
+
+    Returns:
+        list[Edit]: The edits that were fully written, in order.
+    """
+    edits = []
+    offset = 0
+    while offset + RECORD.size <= len(buffer):
+        op, length, crc = RECORD.unpack_from(buffer, offset)
+        start = offset + RECORD.size
+        payload = buffer[start:start + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            break
+        try:
+            edits.append(_decode_payload(Op(op), payload))
+        except ValueError:
+            break
+        offset = start + length
+    return edits
+
+class Journal:
+    """
+    An append-only journal of the edits made to a `Time`, for recovering the time after a crash.
+
+    Every edit the time reports is appended to a log as a small checksummed record, so recording an edit costs one
+    buffered write rather than a save of the whole time. Once the log outgrows `max_log_bytes` the journal is
+    compacted: a new generation starts with an empty log, and a snapshot of the time is written on a background thread.
+    The older generations are deleted once the snapshot is on disk, so a crash at any point leaves a snapshot and the
+    logs written after it.
+
+    Every session journals into its own directory, which is locked for as long as the session runs and deleted when it
+    closes cleanly. A directory that is left behind and unlocked belongs to a session that crashed, see
+    `orphaned_sessions` and `recover`.
+    """
+
+    def __init__(self, directory: str, time: Optional[Time] = None, max_log_bytes: int = 4 * 1024 * 1024, sync_interval: float = 1.0) -> None:
+        """Initializes the Journal class.
+
+        Args:
+            directory (str): The directory that holds the session directories.
+            time (Time | None): The time to record. Defaults to None.
+            max_log_bytes (int): The log size that triggers a compaction. Defaults to 4 MiB.
+            sync_interval (float): The longest time an appended edit may wait before it is synced to the disk, in
+                seconds. Defaults to 1.0.
+        """
+        self.max_log_bytes = max_log_bytes
+        self.sync_interval = sync_interval
+        self.time = None
+        self.path = os.path.join(directory, f"session-{int(wall_time() * 1000)}-{os.getpid()}")
+        self._generation = 0
+        self._log = None
+        self._log_size = 0
+        self._synced = monotonic()
+        self._file_path = None
+        self.disabled = False
+        self._saver = SaveWorker(self._compacted, delay=0)
+
+        # Without its directory or lock the journal is off, but the time is still edited as usual
+        self._lock_file = None
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            lock_file = open(os.path.join(self.path, "lock"), "wb")
+            if not _lock(lock_file):
+                lock_file.close()
+                raise OSError("The session is locked by another process.")
+            self._lock_file = lock_file
+        except Exception as e:
+            self._disable(e)
+        if time is not None:
+            self.attach(time)
+
+    def attach(self, time: Time) -> None:
+        """Starts recording a time, replacing the journal of the previous one.
+
+        Args:
+            time (Time): The time to record.
+        """
+        if self.time is not None:
+            self.time.unsubscribe(self._record)
+        self.time = time
+        time.subscribe(self._record)
+        if self.disabled:
+            return
+        try:
+            self.compact()
+        except Exception as e:
+            self._disable(e)
+
+    def set_file_path(self, file_path: Optional[str]) -> None:
+        """Remembers the file the time is saved to, so a recovered time can be saved back to it.
+
+        Args:
+            file_path (str | None): The file path.
+        """
+        if file_path == self._file_path:
+            return
+        self._file_path = file_path
+        if self.disabled:
+            return
+        try:
+            write_atomic(os.path.join(self.path, "session.json"), json.dumps({"file_path": file_path}))
+        except OSError as e:
+            self._disable(e)
+
+    def _disable(self, error: Exception) -> None:
+        """Stops journaling for the rest of the session, warning once, so a failing journal never fails an edit.
+
+        Args:
+            error (Exception): The error that stopped the journal.
+        """
+        if self.disabled:
+            return
+        self.disabled = True
+        warnings.warn(f"Crash recovery is off for this session, the journal could not be written: {error}", RuntimeWarning)
+
+    def _record(self, edit: Edit) -> None:
+        """Appends an edit reported by the time.
+
+        This runs inside the mutators of the time after the edit has been made, so it never raises. An edit the
+        record format cannot hold is kept by snapshotting the time instead, and an I/O error turns the journal off.
+
+        Args:
+            edit (Edit): The edit.
+        """
+        if self.disabled:
+            return
+        try:
+            if edit[0] == Op.REPLACE_LOADS and edit[2] is not None and edit[2].nbytes >= self.max_log_bytes:
+                # A bulk replacement that would fill the log on its own is cheaper to snapshot than to log
+                self.compact()
+                return
+            try:
+                record = encode_edit(edit)
+            except Exception:
+                # e.g. a framerate whose numerator does not fit 64 bits
+                self.compact()
+                return
+            self._log.write(record)
+            self._log.flush()
+            self._log_size += len(record)
+            if monotonic() - self._synced >= self.sync_interval:
+                self.sync()
+            if self._log_size >= self.max_log_bytes:
+                self.compact()
+        except Exception as e:
+            self._disable(e)
+
+    def sync(self) -> None:
+        """Forces the appended edits to the disk."""
+        if self._log is not None:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+        self._synced = monotonic()
+
+    def compact(self) -> None:
+        """Starts a new generation from a snapshot of the time, which is written in the background."""
+        if self._log is not None:
+            self.sync()
+            self._log.close()
+        self._generation += 1
+        self._log = open(os.path.join(self.path, _log_name(self._generation)), "ab")
+        self._log_size = 0
+        self._saver.submit(os.path.join(self.path, _snapshot_name(self._generation)), snapshot(self.time))
+
+    def _compacted(self, path: str, error: Optional[Exception]) -> None:
+        """Deletes the generations a freshly written snapshot supersedes. Runs on the worker thread.
+
+        Args:
+            path (str): The path of the snapshot.
+            error (Exception | None): The error if the snapshot could not be written.
+        """
+        if error is not None:
+            # Without the snapshot the time can no longer be recovered correctly
+            self._disable(error)
+            return
+        generation = int(_SNAPSHOT.fullmatch(os.path.basename(path)).group(1))
+        for name in os.listdir(self.path):
+            match = _SNAPSHOT.fullmatch(name) or _LOG.fullmatch(name)
+            if match and int(match.group(1)) < generation:
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        """Stops recording and deletes the journal, which marks the session as closed cleanly."""
+        if self.time is not None:
+            self.time.unsubscribe(self._record)
+            self.time = None
+        self._saver.close()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if self._lock_file is not None:
+            # Only a session this journal holds the lock of is its own to delete
+            self._lock_file.close()
+            self._lock_file = None
+            shutil.rmtree(self.path, ignore_errors=True)
+
+def orphaned_sessions(directory: str) -> list[str]:
+    """Finds the journals left behind by sessions that did not close cleanly.
+
+    Args:
+        directory (str): The directory that holds the session directories.
+
+    Returns:
+        list[str]: The session directories, most recent first.
+    """
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    sessions = []
+    for name in names:
+        path = os.path.join(directory, name)
+        if not name.startswith("session-") or not os.path.isdir(path):
+            continue
+        try:
+            with open(os.path.join(path, "lock"), "ab") as lock_file:
+                if not _lock(lock_file):
+                    # Another instance of CRT is still running this session
+                    continue
+        except OSError:
+            continue
+        sessions.append(path)
+    return sorted(sessions, key=os.path.getmtime, reverse=True)
+
+def recover(session: str, time: Time) -> Optional[str]:
+    """Rebuilds the time of a crashed session from its newest snapshot and the logs written after it.
+
+    Replay stops at the first edit that cannot be applied, so a damaged log recovers as much as it can.
+
+    Args:
+        session (str): The session directory, see `orphaned_sessions`.
+        time (Time): The time to rebuild into.
+
+    Raises:
+        ValueError: The session has no usable snapshot.
+
+    Returns:
+        str | None: The file the time was saved to, if any.
+    """
+    names = os.listdir(session)
+    snapshots = sorted((int(match.group(1)) for match in map(_SNAPSHOT.fullmatch, names) if match), reverse=True)
+    logs = sorted(int(match.group(1)) for match in map(_LOG.fullmatch, names) if match)
+
+    for generation in snapshots:
+        try:
+            data = load_time_file(os.path.join(session, _snapshot_name(generation)))
+            break
+        except (OSError, ValueError):
+            continue
+    else:
+        raise ValueError("The session has nothing to recover.")
+
+    time.clear_loads()
+    time.mutate(data["start_frame"], data["end_frame"], data["framerate"])
+    time.precision = data["precision"]
+    # Copy the loads so the snapshot can be deleted
+    loads = data["loads"]
+    loads.detach()
+    time.adopt_loads(loads, data["aggregates"])
+
+    edits = []
+    for log in logs:
+        if log >= generation:
+            with open(os.path.join(session, _log_name(log)), "rb") as file:
+                edits.extend(read_edits(file.read()))
+    try:
+        for edit in edits:
+            time.apply(edit)
+    except (ValueError, IndexError):
+        pass
+
+    try:
+        with open(os.path.join(session, "session.json"), "r") as file:
+            return json.load(file).get("file_path")
+    except (OSError, ValueError):
+        return None
+
+def discard(session: str) -> None:
+    """Deletes the journal of a session.
+
+    Args:
+        session (str): The session directory.
+    """
+    shutil.rmtree(session, ignore_errors=True)
@@ -58,6 +58,19 @@ class Language:
                     "Mod Note Format": "Mod Note Format",
                     "Restore Defaults": "Restore Defaults",
                     "Apply": "Apply",
+                    "Merge Loads": "Merge Loads",
+                    "Merge Loads on Save": "Merge Loads on Save",
+                    "Merge Gap (Frames)": "Merge Gap (Frames)",
+                    "Undo Limit (MB)": "Undo Limit (MB)",
+                    "Undo": "Undo",
+                    "Redo": "Redo",
+                    "Paste Loads": "Paste Loads",
+                    "Update Preview": "Update Preview",
+                    "Import Loads": "Import Loads",
+                    "Export Loads": "Export Loads",
+                    "Import Splits": "Import Splits",
+                    "Segment": "Segment",
+                    "Split Frame": "Split Frame",
                 }
             case "Français":
                 self.content = {
@@ -106,6 +119,19 @@ class Language:
                     "Mod Note Format": "Format de la note de modérateur",
                     "Restore Defaults": "Restaurer les paramètres par défaut",
                     "Apply": "Appliquer",
+                    "Merge Loads": "Fusionner les chargements",
+                    "Merge Loads on Save": "Fusionner les chargements à l'enregistrement",
+                    "Merge Gap (Frames)": "Écart de fusion (images)",
+                    "Undo Limit (MB)": "Limite d'annulation (Mo)",
+                    "Undo": "Annuler",
+                    "Redo": "Rétablir",
+                    "Paste Loads": "Coller des chargements",
+                    "Update Preview": "Actualiser l'aperçu",
+                    "Import Loads": "Importer des chargements",
+                    "Export Loads": "Exporter les chargements",
+                    "Import Splits": "Importer des splits",
+                    "Segment": "Segment",
+                    "Split Frame": "Image du split",
                 }
             case "Polski":
                 self.content = {
@@ -154,6 +180,19 @@ class Language:
                     "Mod Note Format": "Format notatki moderatora",
                     "Restore Defaults": "Przywróć domyślne",
                     "Apply": "Zastosuj",
+                    "Merge Loads": "Scal ładowania",
+                    "Merge Loads on Save": "Scalaj ładowania przy zapisie",
+                    "Merge Gap (Frames)": "Odstęp scalania (klatki)",
+                    "Undo Limit (MB)": "Limit cofania (MB)",
+                    "Undo": "Cofnij",
+                    "Redo": "Ponów",
+                    "Paste Loads": "Wklej ładowania",
+                    "Update Preview": "Odśwież podgląd",
+                    "Import Loads": "Importuj ładowania",
+                    "Export Loads": "Eksportuj ładowania",
+                    "Import Splits": "Importuj splity",
+                    "Segment": "Segment",
+                    "Split Frame": "Klatka splitu",
                 }
             case "Español":
                 self.content = {
@@ -202,6 +241,19 @@ class Language:
                     "Mod Note Format": "Formato de la Nota de Moderador",
                     "Restore Defaults": "Restaurar Valores Predeterminados",
                     "Apply": "Aplicar",
+                    "Merge Loads": "Combinar los Cargas",
+                    "Merge Loads on Save": "Combinar los Cargas al Guardar",
+                    "Merge Gap (Frames)": "Intervalo de Combinación (Fotogramas)",
+                    "Undo Limit (MB)": "Límite de Deshacer (MB)",
+                    "Undo": "Deshacer",
+                    "Redo": "Rehacer",
+                    "Paste Loads": "Pegar Cargas",
+                    "Update Preview": "Actualizar Vista Previa",
+                    "Import Loads": "Importar Cargas",
+                    "Export Loads": "Exportar Cargas",
+                    "Import Splits": "Importar Splits",
+                    "Segment": "Segmento",
+                    "Split Frame": "Fotograma del Split",
                 }
             case _:
                 self.content = {
@@ -250,6 +302,19 @@ class Language:
                     "Mod Note Format": "Mod Note Format",
                     "Restore Defaults": "Restore Defaults",
                     "Apply": "Apply",
+                    "Merge Loads": "Merge Loads",
+                    "Merge Loads on Save": "Merge Loads on Save",
+                    "Merge Gap (Frames)": "Merge Gap (Frames)",
+                    "Undo Limit (MB)": "Undo Limit (MB)",
+                    "Undo": "Undo",
+                    "Redo": "Redo",
+                    "Paste Loads": "Paste Loads",
+                    "Update Preview": "Update Preview",
+                    "Import Loads": "Import Loads",
+                    "Export Loads": "Export Loads",
+                    "Import Splits": "Import Splits",
+                    "Segment": "Segment",
+                    "Split Frame": "Split Frame",
                 }
     
     def translate(self, from_lang: str, to_lang: str, text: str) -> str:
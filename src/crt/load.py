@@ -1,7 +1,12 @@
 # Standard library
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from itertools import islice
+from operator import sub
+from typing import Iterable, Iterator, Optional, Union
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Load:
     """
     A class that represents a load in a video.
@@ -12,8 +17,320 @@ class Load:
     @property
     def length(self) -> int:
         """The length of the load.
-        
+
         Returns:
             int: The length of the load.
-        """        
+        """
         return int(self.end_frame) - int(self.start_frame)
+
+
+class LoadValidationError(ValueError):
+    """
+    Raised when a batch of loads is rejected, listing every bad row rather than only the first.
+    """
+
+    def __init__(self, errors: list[tuple[int, str]]) -> None:
+        """Initializes the LoadValidationError class.
+
+        Args:
+            errors (list[tuple[int, str]]): The zero-based row index and message of every bad row.
+        """
+        self.errors = errors
+        super().__init__("\n".join(f"Load {index + 1}: {message}" for index, message in errors))
+
+    @property
+    def only_overlaps(self) -> bool:
+        """Whether every bad row only overlaps another load, which merging the loads fixes.
+
+        Returns:
+            bool: True if there are no errors other than overlaps.
+        """
+        return all(message.startswith("The load overlaps") for _, message in self.errors)
+
+
+class LoadStore:
+    """
+    A compact container of loads backed by two contiguous int64 arrays.
+
+    Loads are stored column-wise (every start frame in one array, every end frame in another), which costs 16 bytes
+    per load. Indexing hands out lightweight `Load` views, so existing callers can keep treating the store as a list.
+
+    A store can also read its columns straight from a buffer such as a memory-mapped file, see `from_buffer`. The
+    buffer is never written to: the first edit copies the columns into arrays.
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    TYPECODE = "q"
+
+    def __init__(self, loads: Optional[Iterable[Union[Load, tuple[int, int]]]] = None) -> None:
+        """Initializes the LoadStore class.
+
+        Args:
+            loads (Iterable[Load | tuple[int, int]] | None): The loads to store.
+        """
+        self._starts = array(self.TYPECODE)
+        self._ends = array(self.TYPECODE)
+        if loads is not None:
+            self.extend(loads)
+
+    @classmethod
+    def from_arrays(cls, starts: Iterable[int], ends: Iterable[int]) -> "LoadStore":
+        """Builds a store from separate start and end frame columns.
+
+        Args:
+            starts (Iterable[int]): The start frames.
+            ends (Iterable[int]): The end frames.
+
+        Raises:
+            ValueError: The columns have different lengths.
+
+        Returns:
+            LoadStore: The new store.
+        """
+        store = cls()
+        store._starts = cls._to_array(starts) if isinstance(starts, (array, memoryview)) else array(cls.TYPECODE, starts)
+        store._ends = cls._to_array(ends) if isinstance(ends, (array, memoryview)) else array(cls.TYPECODE, ends)
+        if len(store._starts) != len(store._ends):
+            raise ValueError("The start and end frame columns have different lengths.")
+        return store
+
+    @classmethod
+    def from_buffer(cls, starts: memoryview, ends: memoryview) -> "LoadStore":
+        """Builds a store that reads its columns from read-only buffers without copying them.
+
+        Args:
+            starts (memoryview): The start frames as int64, e.g. a slice of a memory-mapped file cast to "q".
+            ends (memoryview): The end frames as int64.
+
+        Raises:
+            ValueError: The columns have different lengths.
+
+        Returns:
+            LoadStore: The new store.
+        """
+        if len(starts) != len(ends):
+            raise ValueError("The start and end frame columns have different lengths.")
+        store = cls()
+        store._starts = starts.toreadonly()
+        store._ends = ends.toreadonly()
+        return store
+
+    @property
+    def mapped(self) -> bool:
+        """Whether the columns are still read from a buffer rather than owned arrays.
+
+        Returns:
+            bool: True until the store is first edited or detached.
+        """
+        return isinstance(self._starts, memoryview)
+
+    def detach(self) -> None:
+        """Copies buffer-backed columns into owned arrays, releasing the buffer."""
+        if self.mapped:
+            self._starts = self._to_array(self._starts)
+            self._ends = self._to_array(self._ends)
+
+    @classmethod
+    def _to_array(cls, column: Union[array, memoryview]) -> array:
+        """Copies a column into a new array.
+
+        Args:
+            column (array | memoryview): The column.
+
+        Returns:
+            array: The copy.
+        """
+        if isinstance(column, memoryview):
+            copy = array(cls.TYPECODE)
+            copy.frombytes(column.cast("B") if column.c_contiguous else column.tobytes())
+            return copy
+        return array(cls.TYPECODE, column)
+
+    @property
+    def starts(self) -> memoryview:
+        """A read-only buffer over the start frames.
+
+        The store cannot grow or shrink while the buffer is alive.
+
+        Returns:
+            memoryview: The start frames as int64.
+        """
+        return memoryview(self._starts).toreadonly()
+
+    @property
+    def ends(self) -> memoryview:
+        """A read-only buffer over the end frames.
+
+        The store cannot grow or shrink while the buffer is alive.
+
+        Returns:
+            memoryview: The end frames as int64.
+        """
+        return memoryview(self._ends).toreadonly()
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used by the load columns.
+
+        Returns:
+            int: The size of both columns in bytes.
+        """
+        return (len(self._starts) + len(self._ends)) * self._starts.itemsize
+
+    def lengths(self, start: int = 0) -> array:
+        """Calculates the length of every load.
+
+        Args:
+            start (int): The index of the first load to include. Defaults to 0.
+
+        Returns:
+            array: The load lengths as int64.
+        """
+        if start:
+            return array(self.TYPECODE, map(sub, self._ends[start:], self._starts[start:]))
+        return array(self.TYPECODE, map(sub, self._ends, self._starts))
+
+    def total_length(self) -> int:
+        """Calculates the combined length of every load.
+
+        Returns:
+            int: The total load length in frames.
+        """
+        return sum(self._ends) - sum(self._starts)
+
+    def bisect_starts(self, frame: int, right: bool = False) -> int:
+        """Bisects the start frame column, which must be sorted.
+
+        Args:
+            frame (int): The frame to search for.
+            right (bool): Whether to return the position after equal frames. Defaults to False.
+
+        Returns:
+            int: The insertion point of the frame.
+        """
+        return (bisect_right if right else bisect_left)(self._starts, frame)
+
+    def bisect_ends(self, frame: int, right: bool = False) -> int:
+        """Bisects the end frame column, which must be sorted.
+
+        Args:
+            frame (int): The frame to search for.
+            right (bool): Whether to return the position after equal frames. Defaults to False.
+
+        Returns:
+            int: The insertion point of the frame.
+        """
+        return (bisect_right if right else bisect_left)(self._ends, frame)
+
+    def pairs(self) -> Iterator[tuple[int, int]]:
+        """Iterates over the loads as (start_frame, end_frame) tuples.
+
+        Returns:
+            Iterator[tuple[int, int]]: The load frame pairs.
+        """
+        return zip(self._starts, self._ends)
+
+    def append(self, start_frame: int, end_frame: int) -> None:
+        """Appends a load.
+
+        Args:
+            start_frame (int): The first frame of the load.
+            end_frame (int): The final frame of the load.
+        """
+        self.detach()
+        self._starts.append(start_frame)
+        self._ends.append(end_frame)
+
+    def insert(self, index: int, start_frame: int, end_frame: int) -> None:
+        """Inserts a load before the given index.
+
+        Args:
+            index (int): The index to insert at.
+            start_frame (int): The first frame of the load.
+            end_frame (int): The final frame of the load.
+        """
+        self.detach()
+        self._starts.insert(index, start_frame)
+        self._ends.insert(index, end_frame)
+
+    def extend(self, loads: Iterable[Union[Load, tuple[int, int]]]) -> None:
+        """Appends many loads at once.
+
+        Args:
+            loads (Iterable[Load | tuple[int, int]]): The loads to append.
+        """
+        self.detach()
+        if isinstance(loads, LoadStore):
+            if loads.mapped:
+                self._starts.frombytes(loads._starts.cast("B"))
+                self._ends.frombytes(loads._ends.cast("B"))
+            else:
+                self._starts.extend(loads._starts)
+                self._ends.extend(loads._ends)
+            return
+        for load in loads:
+            if isinstance(load, Load):
+                self._starts.append(load.start_frame)
+                self._ends.append(load.end_frame)
+            else:
+                start_frame, end_frame = load
+                self._starts.append(start_frame)
+                self._ends.append(end_frame)
+
+    def clear(self) -> None:
+        """Removes every load."""
+        self.detach()
+        del self._starts[:]
+        del self._ends[:]
+
+    def copy(self) -> "LoadStore":
+        """Copies the store.
+
+        A buffer-backed store is never written to, so its copy shares the buffer.
+
+        Returns:
+            LoadStore: An independent copy of the store.
+        """
+        if self.mapped:
+            return LoadStore.from_buffer(self._starts, self._ends)
+        return LoadStore.from_arrays(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __bool__(self) -> bool:
+        return len(self._starts) > 0
+
+    def __iter__(self) -> Iterator[Load]:
+        return map(Load, self._starts, self._ends)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Load, "LoadStore"]:
+        if isinstance(index, slice):
+            return LoadStore.from_arrays(self._starts[index], self._ends[index])
+        return Load(self._starts[index], self._ends[index])
+
+    def __setitem__(self, index: int, load: Union[Load, tuple[int, int]]) -> None:
+        self.detach()
+        if isinstance(load, Load):
+            start_frame, end_frame = load.start_frame, load.end_frame
+        else:
+            start_frame, end_frame = load
+        self._starts[index] = start_frame
+        self._ends[index] = end_frame
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        self.detach()
+        del self._starts[index]
+        del self._ends[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LoadStore):
+            return self._starts == other._starts and self._ends == other._ends
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        preview = ", ".join(f"({start}, {end})" for start, end in islice(self.pairs(), 3))
+        if len(self) > 3:
+            preview += ", ..."
+        return f"LoadStore([{preview}], count={len(self)})"
@@ -0,0 +1,240 @@
+# Standard library
+import csv
+from dataclasses import dataclass, field
+from itertools import chain, repeat
+from typing import Iterable, Iterator, Optional, TextIO
+
+# Local application
+from crt.decorators import check_load
+from crt.framerate import FramerateLike, to_fraction
+from crt.load import LoadValidationError
+from crt.parsing import parse_frame
+from crt.time import Time
+
+@dataclass(frozen=True, slots=True)
+class CsvLoad:
+    """
+    A load read from a CSV or TSV file, or the reason a row could not be read.
+    """
+    line: int
+    start_frame: Optional[int] = None
+    end_frame: Optional[int] = None
+    label: str = ""
+    error: Optional[str] = None
+
+@dataclass(slots=True)
+class ImportResult:
+    """
+    The outcome of importing a load list.
+    """
+    added: int = 0
+    error_count: int = 0
+    # Only the first errors are kept, so a broken million-row file cannot fill the memory with messages
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+def sniff_delimiter(line: str) -> str:
+    """Guesses the delimiter of a load list from its first line.
+
+    Args:
+        line (str): The first line of the file.
+
+    Returns:
+        str: A tab, semicolon or comma.
+    """
+    if '\t' in line:
+        return '\t'
+    if ';' in line and ',' not in line:
+        return ';'
+    return ','
+
+def _columns(header: list[str]) -> Optional[tuple[int, int, Optional[int], bool]]:
+    """Finds the start, end and label columns of a header row.
+
+    Frame columns are preferred over time columns when a file has both.
+
+    Args:
+        header (list[str]): The cells of the first row.
+
+    Returns:
+        tuple[int, int, int | None, bool] | None: The column indices and whether the start and end columns hold times,
+        or None if the row is not a header.
+    """
+    names = [cell.strip().lower() for cell in header]
+    if any(any(char.isdigit() for char in name) for name in names[:2]):
+        return None
+
+    def find(*words: str) -> Optional[int]:
+        for word in words:
+            for index, name in enumerate(names):
+                if word in name:
+                    return index
+        return None
+
+    start = find("start frame", "start_frame", "start")
+    end = find("end frame", "end_frame", "end")
+    label = find("label", "name", "note")
+    start = 0 if start is None else start
+    end = 1 if end is None else end
+    is_time = any(word in names[start] for word in ("time", "second"))
+    return start, end, label, is_time
+
+def read_loads(file: TextIO, framerate: FramerateLike, delimiter: Optional[str] = None) -> Iterator[CsvLoad]:
+    """Reads loads from a CSV or TSV file one row at a time.
+
+    The start and end cells may be frame numbers or timestamps, see `crt.parsing.parse_frame`. An optional header row
+    names the columns, e.g. "start_frame,end_frame,label" or "Start Time\tEnd Time". Whole numbers in a time column
+    are seconds. Without a header the first two columns are the start and end and the third is the label. Blank rows
+    are skipped.
+
+    Args:
+        file (TextIO): The file, opened with `newline=""`.
+        framerate (FramerateLike): The framerate used to convert timestamps.
+        delimiter (str | None): The delimiter. Defaults to None, which guesses it from the first line.
+
+    Yields:
+        CsvLoad: Every load, and every row that could not be read with an error.
+    """
+    framerate = to_fraction(framerate)
+    first = file.readline()
+    if not first:
+        return
+    if delimiter is None:
+        delimiter = sniff_delimiter(first)
+    reader = csv.reader(chain((first,), file), delimiter=delimiter)
+
+    columns = None
+    for row in reader:
+        if not "".join(row).strip():
+            continue
+        if columns is None:
+            columns = _columns(row)
+            if columns is not None:
+                continue
+            columns = (0, 1, 2, False)
+        start, end, label, is_time = columns
+        line = reader.line_num
+        if len(row) <= max(start, end):
+            yield CsvLoad(line, error="Expected a start and an end.")
+            continue
+        label = row[label].strip() if label is not None and label < len(row) else ""
+        try:
+            start_frame = _cell_to_frame(row[start], framerate, is_time)
+            end_frame = _cell_to_frame(row[end], framerate, is_time)
+            check_load(start_frame, end_frame)
+        except ValueError as e:
+            yield CsvLoad(line, label=label, error=str(e))
+            continue
+        yield CsvLoad(line, start_frame, end_frame, label)
+
+def _cell_to_frame(cell: str, framerate: FramerateLike, is_time: bool) -> int:
+    """Converts a start or end cell into a frame number.
+
+    Args:
+        cell (str): The cell.
+        framerate (FramerateLike): The framerate used to convert timestamps.
+        is_time (bool): Whether the cell is in a time column.
+
+    Raises:
+        ValueError: The cell looks like debug info but is invalid.
+
+    Returns:
+        int: The frame number.
+    """
+    if not is_time and cell.isascii() and cell.isdigit():
+        # Plain frame numbers are by far the most common cell, so skip the scanner for them
+        return int(cell)
+    return parse_frame(cell, framerate, is_time)
+
+def import_loads(file: TextIO, time: Time, delimiter: Optional[str] = None, chunk_size: int = 65536, max_errors: int = 1000) -> ImportResult:
+    """Streams a CSV or TSV file of loads into a time.
+
+    Rows are parsed lazily and handed to `Time.add_loads` in chunks, so only one chunk of rows is held at a time on
+    top of the loads themselves. Rows that are malformed or that the time rejects, e.g. overlapping loads, are
+    skipped and reported with their line numbers. Each chunk is one edit of the time.
+
+    Args:
+        file (TextIO): The file, opened with `newline=""`.
+        time (Time): The time to add the loads to.
+        delimiter (str | None): The delimiter. Defaults to None, which guesses it from the first line.
+        chunk_size (int): The number of rows per batch. Defaults to 65536.
+        max_errors (int): The number of error messages to keep. Defaults to 1000.
+
+    Returns:
+        ImportResult: The number of loads added and the rows that were skipped.
+    """
+    result = ImportResult()
+
+    def report(line: int, message: str) -> None:
+        result.error_count += 1
+        if len(result.errors) < max_errors:
+            result.errors.append((line, message))
+
+    chunk = []
+    for load in read_loads(file, time.framerate_fraction, delimiter):
+        if load.error:
+            report(load.line, load.error)
+            continue
+        chunk.append(load)
+        if len(chunk) >= chunk_size:
+            _add_chunk(time, chunk, result, report)
+            chunk = []
+    if chunk:
+        _add_chunk(time, chunk, result, report)
+    return result
+
+def _add_chunk(time: Time, chunk: list[CsvLoad], result: ImportResult, report) -> None:
+    """Adds a chunk of rows to a time, retrying without the rows the time rejected.
+
+    Args:
+        time (Time): The time to add the loads to.
+        chunk (list[CsvLoad]): The rows.
+        result (ImportResult): The result to count the added loads in.
+        report (Callable[[int, str], None]): Records a skipped row.
+    """
+    try:
+        result.added += time.add_loads((load.start_frame, load.end_frame) for load in chunk)
+        return
+    except LoadValidationError as e:
+        rejected = {row for row, _ in e.errors}
+        for row, message in e.errors:
+            report(chunk[row].line, message)
+    # The rows that were kept by the overlap scan never overlap each other, so the retry only fails in corner cases
+    remaining = [load for row, load in enumerate(chunk) if row not in rejected]
+    try:
+        result.added += time.add_loads((load.start_frame, load.end_frame) for load in remaining)
+    except LoadValidationError as e:
+        for row, message in e.errors:
+            report(remaining[row].line, message)
+
+def write_loads(file: TextIO, time: Time, delimiter: str = ",", timestamps: bool = False, labels: Optional[Iterable[str]] = None) -> int:
+    """Streams the loads of a time into a CSV or TSV file.
+
+    Args:
+        file (TextIO): The file, opened with `newline=""`.
+        time (Time): The time to export.
+        delimiter (str): The delimiter. Defaults to ",".
+        timestamps (bool): Whether to write the loads as seconds at the precision of the time instead of frames.
+            Defaults to False.
+        labels (Iterable[str] | None): A label for every load, in load order. Defaults to None, which leaves out the
+            label column.
+
+    Returns:
+        int: The number of loads written.
+    """
+    writer = csv.writer(file, delimiter=delimiter, lineterminator="\n")
+    header = ["start_time", "end_time"] if timestamps else ["start_frame", "end_frame"]
+    if labels is not None:
+        header.append("label")
+    writer.writerow(header)
+
+    rows = time.loads.pairs()
+    if timestamps:
+        rows = ((time.frames_to_time(start), time.frames_to_time(end)) for start, end in rows)
+    if labels is not None:
+        rows = ((start, end, label) for (start, end), label in zip(rows, chain(labels, repeat(""))))
+
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
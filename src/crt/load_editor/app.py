@@ -1,5 +1,4 @@
 # Standard library
-import json
 from decimal import Decimal as d
 from typing import NoReturn
 
@@ -9,6 +8,7 @@ from PySide6.QtWidgets import QMessageBox, QLineEdit
 # Local application
 from crt.load import Load
 from crt.load_editor.gui import LoadEditorGUI
+from crt.parsing import parse_frame
 from crt.language import Language
 
 
@@ -33,46 +33,19 @@ class LoadEditor:
 
     def _handle_frame_input(self, values: dict, key: str) -> NoReturn:
         """Handles the frame input."""
-        value = values[key]
-        if value and value[-1] == "}":
-            try:
-                frame = self._debug_info_to_frame(value)
-            except ValueError as e:
-                frame = 0
-                _popup_error("Error", e)
-        else:
-            frame = self._clean_frame(value)
+        try:
+            frame = parse_frame(values[key], self.framerate)
+        except ValueError as e:
+            frame = 0
+            _popup_error("Error", e)
 
         # Update the widget directly
         inp = self.window.window.findChild(QLineEdit, key)
         if inp:
             inp.blockSignals(True)
-            inp.setText(str(int(frame)))
+            inp.setText(str(frame))
             inp.blockSignals(False)
 
-    def _debug_info_to_frame(self, debug_info: str) -> int:
-        """Converts debug info to a frame."""
-        debug_info = "{" + debug_info.split("{", 1)[-1]
-
-        try:
-            parsed_debug_info = json.loads(debug_info)
-        except json.decoder.JSONDecodeError:
-            raise ValueError("The debug info provided is invalid.\nPlease re-enter debug info.")
-
-        try:
-            cmt = parsed_debug_info["cmt"]
-        except KeyError:
-            raise ValueError("The debug info provided is invalid.\nPlease re-enter debug info.")
-
-        output = d(cmt) * d(self.framerate)
-        output = int(round(output, 0))
-        return output
-
-    def _clean_frame(self, frame: str) -> int:
-        """Cleans the frame."""
-        digits = ''.join(char for char in frame if char.isdigit())
-        return int(digits) if digits else 0
-
     def run(self) -> Load:
         """Runs the load editor."""
         from PySide6.QtWidgets import QApplication
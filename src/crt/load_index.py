@@ -0,0 +1,233 @@
+# Standard library
+import heapq
+from array import array
+from itertools import accumulate, islice
+from operator import itemgetter
+from typing import Iterable, Optional
+
+# Local application
+from crt.load import Load, LoadStore
+
+class LoadIndex:
+    """
+    A sorted interval index over the loads of a time.
+
+    Loads are kept ordered by start frame and never overlap, so the end frames are sorted as well and every lookup is a
+    bisection over the contiguous columns of the underlying `LoadStore`. A load covers the frames
+    `start_frame <= frame < end_frame`, which means loads that merely touch do not overlap.
+
+    A prefix sum of the load lengths answers range queries in O(log n). Edits only truncate the prefix sum at the
+    edited position and it is extended lazily by the next query, so appending loads in order stays O(1).
+    """
+
+    __slots__ = ("store", "_prefix")
+
+    def __init__(self, store: Optional[LoadStore] = None) -> None:
+        """Initializes the LoadIndex class.
+
+        Args:
+            store (LoadStore | None): Loads that are already sorted by start frame and do not overlap. Use `build` to
+                index loads in any order.
+        """
+        self._prefix = array(LoadStore.TYPECODE, [0])
+        self.store = store if store is not None else LoadStore()
+
+    @classmethod
+    def build(cls, rows: Iterable[tuple[int, int, int]], existing: Optional[LoadStore] = None) -> tuple["LoadIndex", list[tuple[int, str]]]:
+        """Indexes a batch of loads in any order with a single sort and a linear overlap scan.
+
+        Args:
+            rows (Iterable[tuple[int, int, int]]): The start frame, end frame and row number of every load.
+            existing (LoadStore | None): Already indexed loads to merge the batch into.
+
+        Returns:
+            tuple[LoadIndex, list[tuple[int, str]]]: The new index, and the row number and message of every row that
+            overlaps another load. The index is only meaningful if there are no errors.
+        """
+        batch = sorted(rows)
+        store = LoadStore()
+        if existing and batch:
+            # Existing loads that end before the batch starts cannot overlap it, so they are copied in bulk. Importing
+            # a file in chunks only ever merges the tail of the loads this way.
+            cut = existing.bisect_ends(batch[0][0], right=True)
+            store = existing[:cut]
+            tail = existing[cut:] if cut < len(existing) else None
+            if tail:
+                merged = heapq.merge(((start, end, None) for start, end in tail.pairs()), batch, key=itemgetter(0, 1))
+            else:
+                merged = batch
+        elif existing:
+            return cls(existing.copy()), []
+        else:
+            merged = batch
+
+        errors = []
+        previous_end = previous_row = None
+        for start_frame, end_frame, row in merged:
+            if previous_end is not None and start_frame < previous_end:
+                if row is None:
+                    errors.append((previous_row, "The load overlaps an existing load."))
+                elif previous_row is None:
+                    errors.append((row, "The load overlaps an existing load."))
+                else:
+                    errors.append((row, f"The load overlaps load {previous_row + 1}."))
+                # Skip the rejected load, keeping whichever load ends last as the neighbour to compare with
+                if end_frame > previous_end:
+                    previous_end, previous_row = end_frame, row
+                continue
+            store.append(start_frame, end_frame)
+            previous_end, previous_row = end_frame, row
+        return cls(store), errors
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def locate(self, start_frame: int, end_frame: int) -> int:
+        """Finds where a load belongs, checking it against its neighbours.
+
+        Args:
+            start_frame (int): The first frame of the load.
+            end_frame (int): The final frame of the load.
+
+        Raises:
+            ValueError: The load overlaps an existing load.
+
+        Returns:
+            int: The index the load would be inserted at.
+        """
+        index = self.store.bisect_starts(start_frame)
+        if index > 0 and self.store[index - 1].end_frame > start_frame:
+            raise ValueError(f"The load overlaps load {index}.")
+        if index < len(self.store) and self.store[index].start_frame < end_frame:
+            raise ValueError(f"The load overlaps load {index + 1}.")
+        return index
+
+    def insert(self, start_frame: int, end_frame: int) -> int:
+        """Inserts a load in start order.
+
+        Args:
+            start_frame (int): The first frame of the load.
+            end_frame (int): The final frame of the load.
+
+        Raises:
+            ValueError: The load overlaps an existing load.
+
+        Returns:
+            int: The index of the inserted load.
+        """
+        index = self.locate(start_frame, end_frame)
+        self.store.insert(index, start_frame, end_frame)
+        self._invalidate(index)
+        return index
+
+    def remove(self, index: int) -> Load:
+        """Removes a load.
+
+        Args:
+            index (int): The index of the load.
+
+        Returns:
+            Load: The removed load.
+        """
+        if index < 0:
+            index += len(self.store)
+        load = self.store[index]
+        del self.store[index]
+        self._invalidate(index)
+        return load
+
+    def restore(self, index: int, load: Load) -> None:
+        """Puts a removed load back where it was without re-validating it.
+
+        Args:
+            index (int): The index the load was removed from.
+            load (Load): The removed load.
+        """
+        self.store.insert(index, load.start_frame, load.end_frame)
+        self._invalidate(index)
+
+    def _invalidate(self, index: int) -> None:
+        """Drops the prefix sums that depend on the load at an index.
+
+        Args:
+            index (int): The index of the first edited load.
+        """
+        del self._prefix[index + 1:]
+
+    def prefix(self, index: int) -> int:
+        """Calculates the combined length of the loads before an index.
+
+        Args:
+            index (int): The number of leading loads to sum.
+
+        Returns:
+            int: The total length of `loads[:index]` in frames.
+        """
+        built = len(self._prefix) - 1
+        if index > built:
+            sums = accumulate(self.store.lengths(built), initial=self._prefix[-1])
+            self._prefix.extend(islice(sums, 1, None))
+        return self._prefix[index]
+
+    def covered(self, start_frame: int, end_frame: int) -> int:
+        """Calculates how many frames of `start_frame <= frame < end_frame` lie inside loads.
+
+        Loads that straddle either edge of the range only count the frames inside of it.
+
+        Args:
+            start_frame (int): The first frame of the range.
+            end_frame (int): The frame after the last frame of the range.
+
+        Returns:
+            int: The load length within the range in frames.
+        """
+        indices = self.intersecting(start_frame, end_frame)
+        if not indices:
+            return 0
+        first, last = indices[0], indices[-1]
+        total = self.prefix(last + 1) - self.prefix(first)
+        total -= max(start_frame - self.store[first].start_frame, 0)
+        total -= max(self.store[last].end_frame - end_frame, 0)
+        return total
+
+    def intersecting(self, start_frame: int, end_frame: int) -> range:
+        """Finds the loads that share at least one frame with `start_frame <= frame < end_frame`.
+
+        Args:
+            start_frame (int): The first frame of the range.
+            end_frame (int): The frame after the last frame of the range.
+
+        Returns:
+            range: The indices of the intersecting loads.
+        """
+        first = self.store.bisect_ends(start_frame, right=True)
+        last = self.store.bisect_starts(end_frame)
+        return range(first, max(first, last))
+
+    def containing(self, frame: int) -> Optional[int]:
+        """Finds the load that covers a frame.
+
+        Args:
+            frame (int): The frame to look up.
+
+        Returns:
+            int | None: The index of the load, or None if the frame is not inside a load.
+        """
+        index = self.store.bisect_starts(frame, right=True) - 1
+        if index >= 0 and frame < self.store[index].end_frame:
+            return index
+        return None
+
+    def outside(self, start_frame: int, end_frame: int) -> list[int]:
+        """Finds the loads that do not lie within `start_frame..end_frame`.
+
+        Args:
+            start_frame (int): The first frame of the run.
+            end_frame (int): The final frame of the run.
+
+        Returns:
+            list[int]: The indices of the loads outside of the bounds.
+        """
+        before = self.store.bisect_starts(start_frame)
+        after = self.store.bisect_ends(end_frame, right=True)
+        return list(range(before)) + list(range(max(before, after), len(self.store)))
@@ -1,13 +1,13 @@
 # Standard library
-import json
-import re
-from decimal import Decimal as d, InvalidOperation
 from typing import NoReturn
 
 # Third-party
 from PySide6.QtWidgets import QMessageBox
 
 # Local application
+from crt.load import Load, LoadValidationError
+from crt.load_index import LoadIndex
+from crt.parsing import parse_frame
 from crt.time import Time
 from crt.load_viewer.gui import LoadViewerGUI
 from crt.language import Language
@@ -22,46 +22,6 @@ def _popup_error(title: str, message: str):
     box.exec()
 
 
-def _parse_frame(text: str, framerate: d) -> int:
-    """Parse a frame input string following the full validation spec."""
-    text = str(text).strip()
-
-    # Debug info detection
-    if '{' in text and '"cmt"' in text:
-        start = text.find('{')
-        try:
-            parsed = json.loads(text[start:])
-            cmt = parsed["cmt"]
-            fps = d(str(framerate)) if framerate and framerate != 0 else d('1')
-            return int(round(d(str(cmt)) * fps, 0))
-        except (json.JSONDecodeError, KeyError, InvalidOperation):
-            pass
-
-    # Strip non-numeric/non-decimal characters
-    cleaned = re.sub(r'[^0-9.]', '', text)
-
-    if not cleaned or not re.search(r'[0-9]', cleaned):
-        return 0
-
-    # Collapse multiple decimal points
-    if cleaned.count('.') > 1:
-        idx = cleaned.find('.')
-        cleaned = cleaned[:idx + 1] + cleaned[idx + 1:].replace('.', '')
-
-    # Decimal → timestamp conversion
-    if '.' in cleaned:
-        try:
-            fps = d(str(framerate)) if framerate and framerate != 0 else d('1')
-            return int(round(d(cleaned) * fps, 0))
-        except (InvalidOperation, ValueError):
-            return 0
-
-    try:
-        return int(cleaned)
-    except ValueError:
-        return 0
-
-
 class LoadViewer:
     """Load viewer for CRT — handles inline editing of all loads at once."""
 
@@ -75,14 +35,24 @@ class LoadViewer:
         self._loads_to_delete: list[int] = []
 
     def _save_all(self, rows_data: dict) -> list[str]:
-        """Validate and save all edited rows. Returns a list of error messages."""
+        """Validate and save all edited rows. Returns a list of error messages.
+
+        The visible rows replace the loads in one step, since editing a load can move it past its neighbours and
+        shift the index of every row after it.
+        """
         errors = []
+        loads = []
+        row_indices = []
         for index_str, data in rows_data.items():
             index = int(index_str)
             if index >= len(self.time.loads):
                 continue
-            start_frame = _parse_frame(data.get("start", "0"), self.time.framerate)
-            end_frame = _parse_frame(data.get("end", "0"), self.time.framerate)
+            try:
+                start_frame = parse_frame(data.get("start", "0"), self.time.framerate_fraction)
+                end_frame = parse_frame(data.get("end", "0"), self.time.framerate_fraction)
+            except ValueError as e:
+                errors.append(f"Load {index + 1}: {e}")
+                continue
 
             if start_frame == end_frame:
                 errors.append(f"Load {index + 1}: duration is 0 (start equals end)")
@@ -91,8 +61,24 @@ class LoadViewer:
                 errors.append(f"Load {index + 1}: end frame is before start frame")
                 continue
 
-            self.time.loads[index].start_frame = start_frame
-            self.time.loads[index].end_frame = end_frame
+            loads.append(Load(start_frame, end_frame))
+            row_indices.append(index)
+
+        if not errors:
+            # Scan for overlaps with the row indices the viewer shows, so a message names the right neighbouring load
+            _, overlaps = LoadIndex.build(
+                (load.start_frame, load.end_frame, index) for load, index in zip(loads, row_indices)
+            )
+            errors.extend(f"Load {index + 1}: {message}" for index, message in sorted(overlaps))
+
+        if not errors:
+            try:
+                self.time.replace_loads(loads)
+            except LoadValidationError as e:
+                errors.extend(f"Load {row_indices[row] + 1}: {message}" for row, message in e.errors)
+            else:
+                # Deleted rows were left out of the replacement already
+                self._loads_to_delete.clear()
 
         return errors
 
@@ -105,7 +91,7 @@ class LoadViewer:
         """Removes deleted loads from the time object (highest index first)."""
         for index in sorted(set(self._loads_to_delete), reverse=True):
             if 0 <= index < len(self.time.loads):
-                del self.time.loads[index]
+                self.time.delete_load(index)
 
     def run(self) -> Time:
         """Runs the load viewer event loop."""
@@ -13,6 +13,7 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont, QGuiApplication
 
 # Local application
+from crt.framerate import frames_to_units, to_fraction, units_to_decimal
 from crt.time import Time
 from crt.base_gui import BaseGUI
 
@@ -37,11 +38,8 @@ class LoadRow(QWidget):
     def _load_duration_str(self) -> str:
         """Returns the load duration as a formatted time string."""
         try:
-            if self.framerate and self.framerate != 0:
-                t = round(d(self.load.length) / d(self.framerate), self.precision)
-            else:
-                t = d(0)
-            return str(t)
+            units = frames_to_units(self.load.length, to_fraction(self.framerate), self.precision)
+            return str(units_to_decimal(units, self.precision))
         except Exception:
             return "0"
 
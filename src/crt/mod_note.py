@@ -0,0 +1,43 @@
+# Local application
+from crt.time import Time
+
+PLUG = "[Conner's Retime Tool](https://github.com/connerglover/conners-retime-tool)"
+
+DEFAULT_FORMAT = (
+    "Mod Note {time_without_loads} without loads, and {time_with_loads} "
+    "with loads at {fps} FPS using {plug}"
+)
+
+def render_mod_note(time: Time, note_format: str = DEFAULT_FORMAT) -> str:
+    """Renders a mod note.
+
+    The format is a `str.format` template with the fields time_with_loads, time_without_loads, hours, minutes,
+    seconds, milliseconds, start_frame, end_frame, start_time, end_time, total_frames, fps and plug.
+
+    Args:
+        time (Time): The time.
+        note_format (str): The template. Defaults to `DEFAULT_FORMAT`.
+
+    Raises:
+        KeyError: The template uses an unknown field.
+
+    Returns:
+        str: The mod note.
+    """
+    hours, minutes, seconds, milliseconds = time.time_components()
+
+    return note_format.format(
+        time_with_loads=time.iso_format(False),
+        time_without_loads=time.iso_format(True),
+        hours=hours,
+        minutes=minutes,
+        seconds=seconds,
+        milliseconds=milliseconds,
+        start_frame=time.start_frame,
+        end_frame=time.end_frame,
+        start_time=time.frames_to_time(time.start_frame),
+        end_time=time.frames_to_time(time.end_frame),
+        total_frames=time.length_with_loads,
+        fps=time.framerate,
+        plug=PLUG,
+    )
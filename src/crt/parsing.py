@@ -0,0 +1,196 @@
+# Standard library
+import json
+import re
+from decimal import Decimal as d
+from fractions import Fraction
+from typing import Union
+
+# Local application
+from crt.framerate import FramerateLike, to_fraction
+
+DEBUG_INFO_ERROR = "The debug info provided is invalid.\nPlease re-enter debug info."
+
+# Digit runs, decimal points and colons, everything else is noise from copying
+_TOKEN = re.compile(r"[0-9]+|[.:]")
+
+# The playback time key of debug info, followed by the start of its value
+_CMT_KEY = re.compile(r'"cmt"\s*:\s*')
+_DECODER = json.JSONDecoder(parse_float=d)
+
+def is_debug_info(text: str) -> bool:
+    """Checks whether a pasted text looks like YouTube "Copy debug info" output.
+
+    Args:
+        text (str): The pasted text.
+
+    Returns:
+        bool: True if the text should be read as debug info.
+    """
+    return '"cmt"' in text
+
+def debug_info_to_seconds(debug_info: str, strict: bool = False) -> d:
+    """Reads the current playback time from YouTube debug info.
+
+    Debug info is several kilobytes of JSON, but only the `cmt` value is needed, so by default the text is scanned for
+    the `"cmt":` key and only the value after it is decoded. This also reads debug info that was cut off by the
+    clipboard, as long as the `cmt` value is complete. If the scan finds no usable value, the whole text is parsed
+    as JSON instead.
+
+    Args:
+        debug_info (str): The debug info, optionally preceded by other text.
+        strict (bool): Whether to always parse and validate the whole text as JSON. Defaults to False.
+
+    Raises:
+        ValueError: The debug info is invalid or has no playback time.
+
+    Returns:
+        d: The playback time in seconds.
+    """
+    if not strict:
+        for match in _CMT_KEY.finditer(debug_info):
+            try:
+                cmt, _ = _DECODER.raw_decode(debug_info, match.end())
+                return _to_seconds(cmt)
+            except ValueError:
+                # Covers JSONDecodeError, and "cmt" appearing as a value rather than a key
+                continue
+
+    start_pos = debug_info.find('{')
+    if start_pos == -1:
+        raise ValueError(DEBUG_INFO_ERROR)
+    try:
+        cmt = json.loads(debug_info[start_pos:], parse_float=d)["cmt"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        raise ValueError(DEBUG_INFO_ERROR)
+    return _to_seconds(cmt)
+
+def _to_seconds(cmt: Union[str, int, d]) -> d:
+    """Converts a playback time read from debug info into seconds.
+
+    Args:
+        cmt (str | int | d): The playback time.
+
+    Raises:
+        ValueError: The playback time is not a finite, non-negative number.
+
+    Returns:
+        d: The playback time in seconds.
+    """
+    if isinstance(cmt, bool) or not isinstance(cmt, (str, int, d)):
+        raise ValueError(DEBUG_INFO_ERROR)
+    try:
+        seconds = d(str(cmt).strip())
+    except ArithmeticError:
+        raise ValueError(DEBUG_INFO_ERROR)
+    if not seconds.is_finite() or seconds < 0:
+        raise ValueError(DEBUG_INFO_ERROR)
+    return seconds
+
+def _scan(text: str) -> Union[tuple[int, int], None]:
+    """Scans a frame number or timestamp, see `parse_timestamp` for the rules.
+
+    Args:
+        text (str): The input text.
+
+    Returns:
+        tuple[int, int] | None: The value as a numerator and a denominator, where a denominator of 0 marks a frame
+        number and any other denominator a timestamp in seconds, or None if the text has no digits.
+    """
+    whole = 0
+    field = fraction = ""
+    is_time = in_fraction = False
+    for token in _TOKEN.findall(text):
+        if token == ".":
+            is_time = in_fraction = True
+        elif token == ":":
+            if not in_fraction:
+                whole = (whole + int(field or 0)) * 60
+                field = ""
+                is_time = True
+        elif in_fraction:
+            fraction += token
+        else:
+            field += token
+
+    if not is_time:
+        return (int(field), 0) if field else None
+    if not (field or fraction or whole):
+        # Only separators, e.g. "." or "::"
+        return None
+    scale = 10 ** len(fraction)
+    return (whole + int(field or 0)) * scale + int(fraction or 0), scale
+
+def parse_timestamp(text: str) -> Union[int, Fraction, None]:
+    """Reads a typed or pasted frame number or timestamp in a single pass.
+
+    Rules:
+    - Every character other than digits, "." and ":" is ignored.
+    - Text without digits is empty.
+    - Digits before the first "." with no ":" form a frame number.
+    - A "." makes the value a timestamp in seconds. Further decimal points are dropped, so "1.2.3" is 1.23 seconds.
+    - ":" separates hours, minutes and seconds, so "1:02:03.5" is 3723.5 seconds. Colons after the decimal point are
+      ignored.
+
+    Args:
+        text (str): The input text.
+
+    Returns:
+        int | Fraction | None: The frame number as an int, the timestamp in seconds as a Fraction, or None if the text
+        has no digits.
+    """
+    value = _scan(text)
+    if value is None:
+        return None
+    numerator, denominator = value
+    return Fraction(numerator, denominator) if denominator else numerator
+
+def _round_half_even(numerator: int, denominator: int) -> int:
+    """Divides two non-negative integers, rounding half to even.
+
+    Args:
+        numerator (int): The dividend.
+        denominator (int): The divisor, greater than 0.
+
+    Returns:
+        int: The rounded quotient.
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    twice = remainder * 2
+    if twice > denominator or (twice == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+def parse_frame(text: str, framerate: FramerateLike, seconds: bool = False) -> int:
+    """Converts any frame input into a frame number.
+
+    Accepts YouTube debug info, plain frame numbers and timestamps in seconds or `hh:mm:ss.mmm`, see
+    `parse_timestamp`. Timestamps are rounded half to even to the nearest frame. A framerate of 0 turns every timestamp
+    into frame 0 rather than raising.
+
+    Args:
+        text (str): The input text.
+        framerate (FramerateLike): The framerate used to convert timestamps.
+        seconds (bool): Whether whole numbers are seconds rather than frames, e.g. for a column of times. Defaults to
+            False.
+
+    Raises:
+        ValueError: The text looks like debug info but is invalid.
+
+    Returns:
+        int: The frame number, or 0 if the text has no digits.
+    """
+    text = str(text)
+    if is_debug_info(text):
+        numerator, denominator = debug_info_to_seconds(text).as_integer_ratio()
+    else:
+        value = _scan(text)
+        if value is None:
+            return 0
+        numerator, denominator = value
+        if not denominator:
+            if not seconds:
+                return numerator
+            denominator = 1
+
+    framerate = to_fraction(framerate)
+    return _round_half_even(numerator * framerate.numerator, denominator * framerate.denominator)
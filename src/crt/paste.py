@@ -0,0 +1,117 @@
+# Standard library
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+# Local application
+from crt.decorators import check_load
+from crt.framerate import FramerateLike, to_fraction
+from crt.parsing import parse_frame
+
+# A frame number or timestamp: digits, optionally joined by colons and decimal points
+_VALUE = re.compile(r"\b[0-9]+(?:[:.][0-9]+)*\b")
+# A label before the values, e.g. "Load 1:" or "Loads:", which would otherwise be read as a value
+_LABEL = re.compile(r"^\s*[^\W\d_][\w ]*?#?\s*[0-9]*\s*:(?![0-9])")
+
+@dataclass(frozen=True, slots=True)
+class PastedLoad:
+    """
+    A load read from pasted text, or the reason a line could not be read.
+    """
+    line: int
+    start_frame: Optional[int] = None
+    end_frame: Optional[int] = None
+    error: Optional[str] = None
+
+def parse_pasted_loads(lines: Iterable[str], framerate: FramerateLike) -> Iterator[PastedLoad]:
+    """Reads loads from pasted text one line at a time.
+
+    Every load is a start and an end, which may be frame numbers, timestamps or YouTube debug info, see
+    `crt.parsing.parse_frame`. A line holding two values is a whole load, and lines holding one value are paired with
+    the next one, so "start end" lines, alternating start and end lines, and consecutive debug info blobs all work.
+    Any characters between values are separators, e.g. "100-250", "1:02.5 -> 1:05" or "100,250", and a leading
+    label such as "Load 1:" is ignored. Lines without digits, such as headers, are skipped.
+
+    Args:
+        lines (Iterable[str]): The pasted lines, e.g. `io.StringIO(text)`. They are consumed lazily.
+        framerate (FramerateLike): The framerate used to convert timestamps.
+
+    Yields:
+        PastedLoad: Every load with the line it starts on, and every line that could not be read with an error.
+    """
+    framerate = to_fraction(framerate)
+    pending = None
+    blob = []
+    depth = blob_line = 0
+
+    def pair(line: int, frame: int) -> Iterator[PastedLoad]:
+        nonlocal pending
+        if pending is None:
+            pending = (line, frame)
+            return
+        start_line, start_frame = pending
+        pending = None
+        yield _checked(start_line, start_frame, frame)
+
+    for number, line in enumerate(lines, 1):
+        # Debug info is JSON that may span several lines, so collect it until its braces balance
+        if depth or '{' in line:
+            if not depth:
+                blob_line = number
+            blob.append(line)
+            depth += line.count('{') - line.count('}')
+            if depth > 0:
+                continue
+            depth = 0
+            text = "".join(blob)
+            blob.clear()
+            try:
+                frame = parse_frame(text, framerate)
+            except ValueError as e:
+                yield PastedLoad(blob_line, error=str(e))
+                continue
+            yield from pair(blob_line, frame)
+            continue
+
+        values = _VALUE.findall(_LABEL.sub("", line, count=1))
+        if not values:
+            continue
+        if len(values) > 2:
+            yield PastedLoad(number, error=f"Expected a start and an end, found {len(values)} values.")
+            continue
+        frames = [parse_frame(value, framerate) for value in values]
+        if len(frames) == 2:
+            if pending is not None:
+                yield PastedLoad(pending[0], error="The load has no end.")
+                pending = None
+            yield _checked(number, *frames)
+        else:
+            yield from pair(number, frames[0])
+
+    # The clipboard may have cut the final debug info off, which the cmt scan can still read
+    if blob:
+        try:
+            frame = parse_frame("".join(blob), framerate)
+        except ValueError as e:
+            yield PastedLoad(blob_line, error=str(e))
+        else:
+            yield from pair(blob_line, frame)
+    if pending is not None:
+        yield PastedLoad(pending[0], error="The load has no end.")
+
+def _checked(line: int, start_frame: int, end_frame: int) -> PastedLoad:
+    """Checks the frames of a pasted load.
+
+    Args:
+        line (int): The line the load starts on.
+        start_frame (int): The first frame of the load.
+        end_frame (int): The final frame of the load.
+
+    Returns:
+        PastedLoad: The load, or the error if the frames are invalid.
+    """
+    try:
+        check_load(start_frame, end_frame)
+    except ValueError as e:
+        return PastedLoad(line, start_frame, end_frame, str(e))
+    return PastedLoad(line, start_frame, end_frame)
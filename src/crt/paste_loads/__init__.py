@@ -0,0 +1,10 @@
+"""
+Window that pastes many CRT loads at once.
+"""
+
+from crt.paste_loads.app import PasteLoads
+
+__name__ = "crt.paste_loads"
+__author__ = "Conner Glover"
+__description__ = "Window that pastes many CRT loads at once."
+__all__ = ["PasteLoads"]
@@ -0,0 +1,125 @@
+# Standard library
+from io import StringIO
+from typing import NoReturn, Optional
+
+# Third-party
+from PySide6.QtWidgets import QMessageBox
+
+# Local application
+from crt.load import LoadValidationError
+from crt.paste import PastedLoad, parse_pasted_loads
+from crt.paste_loads.gui import PasteLoadsGUI
+from crt.time import Time
+from crt.language import Language
+
+
+def _popup_error(title: str, message: str):
+    """Shows an error popup."""
+    box = QMessageBox()
+    box.setWindowTitle(title)
+    box.setText(str(message))
+    box.setIcon(QMessageBox.Icon.Critical)
+    box.setStandardButtons(QMessageBox.StandardButton.Ok)
+    box.exec()
+
+
+class PasteLoads:
+    """Paste loads window for CRT — previews a whole clipboard of loads and adds them in one batch."""
+
+    # Rows shown in the preview, so a huge paste does not build a huge table
+    PREVIEW_LIMIT = 1000
+
+    def __init__(self, time: Time, text: str, language: Language) -> NoReturn:
+        """Initializes the PasteLoads class."""
+        self.time = time
+        self.window = PasteLoadsGUI(text, language.content)
+        self._preview(text)
+
+    def _parse(self, text: str) -> tuple[list[PastedLoad], list[PastedLoad]]:
+        """Reads the pasted text.
+
+        Returns:
+            tuple[list[PastedLoad], list[PastedLoad]]: The valid loads and the lines with errors.
+        """
+        loads = []
+        errors = []
+        for pasted in parse_pasted_loads(StringIO(text), self.time.framerate_fraction):
+            (errors if pasted.error else loads).append(pasted)
+        return loads, errors
+
+    def _preview(self, text: str, rejected: Optional[dict[int, str]] = None) -> tuple[list[PastedLoad], list[PastedLoad]]:
+        """Parses the pasted text and shows the result.
+
+        Args:
+            text (str): The pasted text.
+            rejected (dict[int, str] | None): Errors the time reported for otherwise valid loads, by line.
+
+        Returns:
+            tuple[list[PastedLoad], list[PastedLoad]]: The valid loads and the lines with errors.
+        """
+        loads, errors = self._parse(text)
+        rejected = rejected or {}
+
+        rows = []
+        for pasted in sorted(loads + errors, key=lambda pasted: pasted.line)[:self.PREVIEW_LIMIT]:
+            error = pasted.error or rejected.get(pasted.line)
+            if pasted.start_frame is None:
+                start = end = ""
+            else:
+                start, end = pasted.start_frame, pasted.end_frame
+            status = error if error else self.time.frames_to_time(pasted.end_frame - pasted.start_frame)
+            rows.append((pasted.line, start, end, status, error is not None))
+
+        error_count = len(errors) + len(rejected)
+        summary = f"{len(loads) - len(rejected)} loads, {error_count} errors"
+        if len(loads) + len(errors) > self.PREVIEW_LIMIT:
+            summary += f" (showing the first {self.PREVIEW_LIMIT} lines)"
+        self.window.set_preview(rows, summary)
+        return loads, errors
+
+    def _add(self, text: str) -> Optional[int]:
+        """Adds the pasted loads if every line is valid.
+
+        Returns:
+            int | None: The number of loads added, or None if nothing was added.
+        """
+        loads, errors = self._preview(text)
+        if errors:
+            _popup_error("Error", "\n".join(f"Line {pasted.line}: {pasted.error}" for pasted in errors[:10]))
+            return None
+        if not loads:
+            _popup_error("Error", "There are no loads to add.")
+            return None
+        try:
+            return self.time.add_loads((pasted.start_frame, pasted.end_frame) for pasted in loads)
+        except LoadValidationError as e:
+            rejected = {loads[row].line: message for row, message in e.errors}
+            self._preview(text, rejected)
+            _popup_error("Error", "\n".join(f"Line {line}: {message}" for line, message in list(rejected.items())[:10]))
+            return None
+
+    def run(self) -> int:
+        """Runs the paste loads event loop.
+
+        Returns:
+            int: The number of loads added.
+        """
+        added = 0
+        while True:
+            event, values = self.window.read()
+
+            match event:
+                case "preview":
+                    self._preview(values.get("text", ""))
+
+                case "add":
+                    added = self._add(values.get("text", ""))
+                    if added is not None:
+                        break
+                    added = 0
+
+                case "cancel" | None:
+                    break
+
+        self.window.close()
+        return added
@@ -0,0 +1,129 @@
+# Standard Library
+from typing import NoReturn
+
+# Third-party
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QPlainTextEdit, QTableWidget, QTableWidgetItem, QHeaderView
+)
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QColor
+
+# Local application
+from crt.base_gui import BaseGUI
+
+
+class PasteLoadsDialog(QDialog):
+    """Dialog that previews loads pasted from the clipboard before adding them."""
+
+    def __init__(self, text: str, content: dict, parent=None):
+        super().__init__(parent)
+        self.content = content
+        self.setWindowTitle(content["Paste Loads"])
+        self.setMinimumSize(620, 520)
+        self.setWindowModality(Qt.WindowModality.ApplicationModal)
+        self._build_ui(text, content)
+
+    def _build_ui(self, text: str, content: dict):
+        c = content
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 14, 16, 14)
+        layout.setSpacing(10)
+
+        # Title
+        title = QLabel(c["Paste Loads"])
+        title.setFont(QFont("Helvetica", 18, QFont.Weight.Bold))
+        layout.addWidget(title)
+
+        # Pasted text, editable so bad lines can be fixed in place
+        self.text = QPlainTextEdit(text)
+        self.text.setObjectName("text")
+        self.text.setFont(QFont("Courier", 11))
+        self.text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        layout.addWidget(self.text, stretch=1)
+
+        # Preview table
+        self.table = QTableWidget(0, 4)
+        self.table.setObjectName("preview")
+        self.table.setHorizontalHeaderLabels(["#", c["Start Frame"], c["End Frame"], ""])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table, stretch=1)
+
+        self.summary = QLabel("")
+        self.summary.setFont(QFont("Helvetica", 12))
+        layout.addWidget(self.summary)
+
+        # Buttons
+        btn_row = QHBoxLayout()
+        btn_row.setSpacing(8)
+        self.btn_preview = QPushButton(c["Update Preview"])
+        self.btn_preview.setObjectName("preview")
+        self.btn_add = QPushButton(c["Add Loads"])
+        self.btn_add.setObjectName("add")
+        self.btn_cancel = QPushButton(c["Cancel"])
+        self.btn_cancel.setObjectName("cancel")
+        for btn in (self.btn_preview, self.btn_add, self.btn_cancel):
+            btn.setFont(QFont("Helvetica", 12))
+            btn.setMinimumHeight(34)
+            btn_row.addWidget(btn)
+        layout.addLayout(btn_row)
+
+    def get_values(self) -> dict:
+        return {"text": self.text.toPlainText()}
+
+
+class PasteLoadsGUI(BaseGUI):
+    """Wrapper around PasteLoadsDialog to match the BaseGUI/event-loop interface."""
+
+    def __init__(self, text: str, content: dict):
+        self.window = PasteLoadsDialog(text, content)
+        self._last_event = None
+        self._last_values = {}
+        self._connect_signals()
+
+    def _connect_signals(self):
+        d = self.window
+        d.btn_preview.clicked.connect(lambda: self._emit("preview"))
+        d.btn_add.clicked.connect(lambda: self._emit("add"))
+        d.btn_cancel.clicked.connect(lambda: self._emit("cancel"))
+
+    def _emit(self, event: str):
+        self._last_event = event
+        self._last_values = self.window.get_values()
+
+    def set_preview(self, rows: list, summary: str) -> NoReturn:
+        """Fills the preview table.
+
+        Args:
+            rows (list): The line number, start, end and status of every row, and whether the row is an error.
+            summary (str): The text shown below the table.
+        """
+        table = self.window.table
+        table.setUpdatesEnabled(False)
+        table.setRowCount(len(rows))
+        error_color = QColor("#f38ba8")
+        for index, (line, start, end, status, is_error) in enumerate(rows):
+            for column, text in enumerate((line, start, end, status)):
+                item = QTableWidgetItem(str(text))
+                if is_error:
+                    item.setForeground(error_color)
+                table.setItem(index, column, item)
+        table.setUpdatesEnabled(True)
+        self.window.summary.setText(summary)
+
+    def read(self) -> tuple:
+        """Blocking read: shows the dialog and returns (event, values)."""
+        from PySide6.QtWidgets import QApplication
+        self._last_event = None
+        self.window.show()
+        while self._last_event is None and self.window.isVisible():
+            QApplication.processEvents()
+        event = self._last_event
+        values = self._last_values
+        return event, values
+
+    def close(self):
+        if self.window:
+            self.window.close()
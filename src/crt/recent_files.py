@@ -0,0 +1,235 @@
+# Standard library
+import json
+import os
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Iterator, Optional
+
+# Local application
+from crt import formatting
+from crt.time import Time
+from crt.time_binary import is_binary, read_header
+from crt.time_file import SaveWorker, load_time_file, write_atomic
+
+@dataclass(frozen=True, slots=True)
+class FileSummary:
+    """
+    What the session history shows about a time file, and the file state it was read from.
+    """
+    mtime_ns: int
+    size: int
+    framerate: str
+    with_loads: str
+    without_loads: str
+    load_count: int
+
+def _format(time: Time, frames: int) -> str:
+    """Formats a length of a time like the main window does.
+
+    Args:
+        time (Time): The time, for its framerate and precision.
+        frames (int): The length in frames.
+
+    Returns:
+        str: The length in ISO format.
+    """
+    return formatting.iso_format(*formatting.time_components(time.frames_to_units(frames), time.precision))
+
+def summarise(path: str, stat: Optional[os.stat_result] = None) -> FileSummary:
+    """Reads the summary of a time file.
+
+    Binary files are summarised from their header alone. JSON files have to be parsed, but their loads are only
+    summed, not validated.
+
+    Args:
+        path (str): The file path.
+        stat (os.stat_result | None): The file state, if it is already known. Defaults to None.
+
+    Raises:
+        OSError: The file cannot be read.
+        ValueError: The file is corrupted.
+
+    Returns:
+        FileSummary: The summary.
+    """
+    stat = stat or os.stat(path)
+    if is_binary(path):
+        with open(path, "rb") as file:
+            header = read_header(file)
+        start_frame, end_frame, framerate = header.start_frame, header.end_frame, header.framerate
+        count, total = header.count, header.total
+    else:
+        data = load_time_file(path)
+        start_frame, end_frame, framerate = data["start_frame"], data["end_frame"], data["framerate"]
+        loads = data["loads"]
+        count = len(loads)
+        total = sum(int(end) - int(start) for start, end in loads)
+
+    time = Time(start_frame, end_frame, framerate)
+    return FileSummary(
+        stat.st_mtime_ns, stat.st_size, str(time.framerate),
+        _format(time, time.length_with_loads), _format(time, time.length_with_loads - total), count,
+    )
+
+def _write(path: str, data: dict) -> None:
+    """Writes the list of recent files.
+
+    Args:
+        path (str): The file path.
+        data (dict): The list, see `RecentFiles.save`.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    write_atomic(path, json.dumps(data))
+
+class RecentFiles:
+    """
+    A persistent, size-capped list of the most recently used time files, with a cached summary of each.
+
+    The files are kept in an ordered map, so using a file, checking for it and evicting the oldest file are all O(1).
+    A summary is only read again once the modification time or size of its file changes. The list is written back to
+    its file after every change, on a background thread if asked to, so the GUI never waits for the disk.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, limit: int = 50, background: bool = False) -> None:
+        """Initializes the RecentFiles class.
+
+        Args:
+            path (str): The file the list is kept in. A missing or corrupted file starts an empty list.
+            limit (int): The number of files to remember. Defaults to 50.
+            background (bool): Whether to write the list on a background thread, see `close`. Defaults to False.
+        """
+        self.path = path
+        self.limit = limit
+        # Oldest first, so the most recent file is moved to the end
+        self._files: OrderedDict[str, Optional[FileSummary]] = OrderedDict()
+        self._saver = SaveWorker(write=_write) if background else None
+        self._load()
+
+    def _load(self) -> None:
+        """Reads the list from its file."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") != self.VERSION:
+                return
+            for entry in data["files"][-self.limit:]:
+                summary = entry.get("summary")
+                self._files[entry["path"]] = FileSummary(**summary) if summary else None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._files.clear()
+
+    def save(self) -> None:
+        """Writes the list to its file, or hands it to the background thread."""
+        files = [
+            {"path": path, "summary": asdict(summary) if summary else None}
+            for path, summary in self._files.items()
+        ]
+        data = {"version": self.VERSION, "files": files}
+        if self._saver is None:
+            _write(self.path, data)
+        else:
+            self._saver.submit(self.path, data)
+
+    def close(self) -> None:
+        """Waits for the list to be written by the background thread and stops it."""
+        if self._saver is not None:
+            self._saver.close()
+
+    def touch(self, path: str) -> None:
+        """Marks a file as the most recently used, forgetting the oldest file if the list is full.
+
+        Args:
+            path (str): The file path.
+        """
+        path = os.path.abspath(path)
+        if path in self._files:
+            self._files.move_to_end(path)
+        else:
+            self._files[path] = None
+            while len(self._files) > self.limit:
+                self._files.popitem(last=False)
+        self.save()
+
+    def remove(self, path: str) -> None:
+        """Forgets a file.
+
+        Args:
+            path (str): The file path.
+        """
+        path = os.path.abspath(path)
+        if path in self._files:
+            del self._files[path]
+            self.save()
+
+    def _refresh(self, path: str) -> tuple[Optional[FileSummary], bool]:
+        """Gets the summary of a file, reading it again only if the file changed since it was cached.
+
+        Args:
+            path (str): The absolute file path.
+
+        Returns:
+            tuple[FileSummary | None, bool]: The summary, or None if the file is missing or cannot be read, and
+            whether the cached summary was replaced.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None, False
+        cached = self._files.get(path)
+        if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+            return cached, False
+        try:
+            summary = summarise(path, stat)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, False
+        if path not in self._files:
+            return summary, False
+        self._files[path] = summary
+        return summary, True
+
+    def summary(self, path: str) -> Optional[FileSummary]:
+        """Gets the summary of a file, reading it again only if the file changed since it was cached.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            FileSummary | None: The summary, or None if the file is missing or cannot be read.
+        """
+        summary, changed = self._refresh(os.path.abspath(path))
+        if changed:
+            self.save()
+        return summary
+
+    def summaries(self, exclude: Optional[str] = None) -> list[tuple[str, Optional[FileSummary]]]:
+        """Lists the files with their summaries, most recent first.
+
+        Args:
+            exclude (str | None): A file to leave out, e.g. the open file. Defaults to None.
+
+        Returns:
+            list[tuple[str, FileSummary | None]]: Every file and its summary, or None if it cannot be read.
+        """
+        exclude = os.path.abspath(exclude) if exclude else None
+        rows = []
+        changed = False
+        for path in list(reversed(self._files)):
+            if path == exclude:
+                continue
+            summary, refreshed = self._refresh(path)
+            changed |= refreshed
+            rows.append((path, summary))
+        if changed:
+            self.save()
+        return rows
+
+    def __contains__(self, path: str) -> bool:
+        return os.path.abspath(path) in self._files
+
+    def __iter__(self) -> Iterator[str]:
+        return reversed(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
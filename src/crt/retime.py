@@ -0,0 +1,77 @@
+# Standard library
+from typing import Optional
+
+# Local application
+from crt.coalesce import Merge, coalesce
+from crt.load import LoadValidationError
+from crt.mod_note import render_mod_note
+from crt.time import Time
+from crt.time_file import load_time_file
+
+def open_time(path: str, precision: int = 3, merge_overlaps: bool = True) -> tuple[Time, list[Merge]]:
+    """Opens a time file into a new time.
+
+    Files written before overlapping loads were rejected are opened by merging their overlapping loads, like the GUI
+    offers to. Only overlaps are merged: a file with loads outside of its run, or loads that are not whole numbers, is
+    rejected with every bad load listed.
+
+    Args:
+        path (str): The path of a .json or .crtb time file.
+        precision (int): The precision of the time. Defaults to 3.
+        merge_overlaps (bool): Whether to merge overlapping loads rather than reject the file. Defaults to True.
+
+    Raises:
+        ValueError: The file is corrupted.
+        LoadValidationError: The file holds loads that are invalid for another reason than overlapping, or overlapping
+            loads and `merge_overlaps` is False.
+
+    Returns:
+        tuple[Time, list[Merge]]: The time, and every load that was made by merging loads of the file.
+    """
+    data = load_time_file(path)
+    time = Time(data["start_frame"], data["end_frame"], data["framerate"], precision)
+    if "aggregates" in data:
+        time.adopt_loads(data["loads"], data["aggregates"])
+        return time, []
+    try:
+        time.replace_loads(data["loads"])
+    except LoadValidationError as e:
+        # Merging cannot fix any other kind of bad load, and the loads it would be given are not all sound
+        if not merge_overlaps or not e.only_overlaps:
+            raise
+        merged, merges = coalesce(data["loads"])
+        time.replace_loads(merged)
+        return time, merges
+    return time, []
+
+def summarise(time: Time, note_format: Optional[str] = None, merges: Optional[list[Merge]] = None) -> dict:
+    """Describes a time with plain values, ready to be serialised as JSON.
+
+    Args:
+        time (Time): The time.
+        note_format (str | None): The mod note template, see `crt.mod_note.render_mod_note`. Defaults to None, which
+            leaves out the mod note.
+        merges (list[Merge] | None): The merges made while opening the time, see `open_time`. Defaults to None.
+
+    Returns:
+        dict: The run, the times with and without loads as text and as seconds, and the loads. If loads were merged,
+        also how many loads were merged and how many loads they became.
+    """
+    summary = {
+        "start_frame": time.start_frame,
+        "end_frame": time.end_frame,
+        "framerate": str(time.framerate),
+        "with_loads": time.iso_format(False),
+        "without_loads": time.iso_format(True),
+        "with_loads_seconds": str(time.with_loads),
+        "without_loads_seconds": str(time.without_loads),
+        "total_frames": time.length_with_loads,
+        "load_count": len(time.loads),
+        "load_frames": time.total_load_length,
+    }
+    if merges:
+        summary["merged_loads"] = sum(merge.count for merge in merges)
+        summary["merged_into"] = len(merges)
+    if note_format is not None:
+        summary["mod_note"] = render_mod_note(time, note_format)
+    return summary
@@ -69,10 +69,10 @@ class SaveAsDialog(QDialog):
 
     def _browse(self):
         path, _ = QFileDialog.getSaveFileName(
-            self, "Save As", "", "Load Files (*.json)"
+            self, "Save As", "", "Load Files (*.json);;Binary Load Files (*.crtb)"
         )
         if path:
-            if not path.endswith(".json"):
+            if not path.endswith((".json", ".crtb")):
                 path += ".json"
             self.file_name.setText(path)
 
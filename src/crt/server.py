@@ -0,0 +1,340 @@
+"""
+A local HTTP/JSON retime service for bots and tooling.
+
+Endpoints:
+    POST /retime  A request object, or {"requests": [...]} to retime many times in one call.
+    GET  /stats   Request, error and latency counters.
+    GET  /health  Always {"status": "ok"}.
+
+A request object holds "start" and "end" (frames, timestamps or debug info), an optional "framerate" (default 60),
+"loads" as [start, end] pairs, "precision" and "mod_note_format". The response holds the fields of
+`crt.retime.summarise`, or an "error".
+"""
+
+# Standard library
+import asyncio
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from time import monotonic, perf_counter
+from typing import Optional
+
+# Local application
+from crt.framerate import to_fraction
+from crt.parsing import parse_frame
+from crt.retime import summarise
+from crt.time import Time
+
+# Requests with at least this many loads are retimed in a worker process, smaller ones are cheaper inline
+OFFLOAD_LOADS = 2000
+MAX_BODY = 64 * 1024 * 1024
+
+def _frame(value, framerate) -> int:
+    """Converts a start, end or load value into a frame number.
+
+    Args:
+        value (int | str): A frame number, or a timestamp or debug info as text.
+        framerate (FramerateLike): The framerate used to convert timestamps.
+
+    Raises:
+        ValueError: The value is not a frame.
+
+    Returns:
+        int: The frame number.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if not isinstance(value, str) or not any(char.isdigit() for char in value):
+        raise ValueError(f"The frame {value!r} is invalid.")
+    return parse_frame(value, framerate)
+
+def retime_request(request: dict) -> dict:
+    """Retimes one request object.
+
+    Args:
+        request (dict): The request, see the module documentation.
+
+    Returns:
+        dict: The summary of the time, or the error.
+    """
+    try:
+        if not isinstance(request, dict):
+            raise ValueError("A request must be an object.")
+        framerate = to_fraction(request.get("framerate", 60))
+        if framerate <= 0:
+            raise ValueError("The framerate must be greater than 0.")
+        if "start" not in request or "end" not in request:
+            raise ValueError("A request needs a start and an end.")
+        precision = request.get("precision", 3)
+        if not isinstance(precision, int) or isinstance(precision, bool) or not 0 <= precision <= 9:
+            raise ValueError("The precision must be a whole number from 0 to 9.")
+        time = Time(_frame(request["start"], framerate), _frame(request["end"], framerate), framerate, precision)
+        if time.end_frame < time.start_frame:
+            raise ValueError("The run ends before it starts.")
+        loads = request.get("loads") or []
+        if not isinstance(loads, list) or not all(isinstance(load, list) and len(load) == 2 for load in loads):
+            raise ValueError("The loads must be [start, end] pairs.")
+        time.add_loads((_frame(start, framerate), _frame(end, framerate)) for start, end in loads)
+        return summarise(time, request.get("mod_note_format"))
+    except (KeyError, IndexError, AttributeError) as e:
+        return {"error": f"The mod note format uses an unknown field: {e}"}
+    except Exception as e:
+        # A bad request must never take the connection down with it
+        return {"error": str(e) or type(e).__name__}
+
+def retime_requests(requests: list) -> list[dict]:
+    """Retimes a batch of request objects, in a worker process for large batches.
+
+    Args:
+        requests (list): The requests.
+
+    Returns:
+        list[dict]: The result of every request, in order.
+    """
+    return [retime_request(request) for request in requests]
+
+class RetimeServer:
+    """
+    An asyncio HTTP/1.1 server that retimes JSON requests.
+
+    Small requests are retimed on the event loop. Requests with many loads go to a bounded pool of worker processes,
+    and once `max_pending` of them are waiting further large requests are turned away with 503 rather than queued
+    without limit. Every request is counted for `/stats`, which also reports the latency percentiles and throughput
+    of the most recent requests.
+    """
+
+    # The number of recent requests the latency percentiles and throughput are taken over
+    WINDOW = 4096
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None) -> None:
+        """Initializes the RetimeServer class.
+
+        Args:
+            workers (int | None): The number of worker processes. Defaults to None, which uses one per CPU. 0 retimes
+                everything on the event loop.
+            max_pending (int | None): The number of large requests that may wait for a worker. Defaults to None, which
+                allows four per worker.
+        """
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.max_pending = self.workers * 4 if max_pending is None else max_pending
+        self._pool = None
+        self._pending = 0
+        self._started = monotonic()
+        self._recent: deque[tuple[float, float]] = deque(maxlen=self.WINDOW)
+        self._counters = {"requests": 0, "items": 0, "errors": 0, "offloaded": 0, "rejected": 0, "in_flight": 0}
+
+    def stats(self) -> dict:
+        """Reports the counters.
+
+        Returns:
+            dict: The request counts, throughput and latency percentiles in milliseconds.
+        """
+        now = monotonic()
+        uptime = now - self._started
+        latencies = sorted(latency for _, latency in self._recent)
+
+        def percentile(fraction: float) -> float:
+            return round(latencies[min(int(len(latencies) * fraction), len(latencies) - 1)] * 1000, 3)
+
+        recent = sum(1 for finished, _ in self._recent if now - finished <= 10)
+        return {
+            **self._counters,
+            "uptime_seconds": round(uptime, 3),
+            "throughput_per_second": round(self._counters["requests"] / uptime, 3) if uptime else 0.0,
+            "recent_throughput_per_second": round(recent / min(uptime, 10), 3) if uptime else 0.0,
+            "latency_ms": {
+                "p50": percentile(0.5), "p90": percentile(0.9), "p99": percentile(0.99),
+                "max": round(latencies[-1] * 1000, 3),
+                "mean": round(sum(latencies) / len(latencies) * 1000, 3),
+            } if latencies else None,
+            "workers": self.workers,
+            "pending": self._pending,
+        }
+
+    async def _retime(self, requests: list) -> Optional[list[dict]]:
+        """Retimes a batch of requests inline or in the worker pool.
+
+        Args:
+            requests (list): The requests.
+
+        Returns:
+            list[dict] | None: The results, or None if the pool is full.
+        """
+        loads = sum(
+            len(request["loads"]) for request in requests
+            if isinstance(request, dict) and isinstance(request.get("loads"), list)
+        )
+        if self._pool is None or loads < OFFLOAD_LOADS:
+            return retime_requests(requests)
+        if self._pending >= self.max_pending:
+            self._counters["rejected"] += 1
+            return None
+        self._pending += 1
+        self._counters["offloaded"] += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, retime_requests, requests)
+        finally:
+            self._pending -= 1
+
+    async def _route(self, method: str, target: str, body: bytes) -> tuple[HTTPStatus, dict]:
+        """Answers a request.
+
+        Args:
+            method (str): The HTTP method.
+            target (str): The request target.
+            body (bytes): The request body.
+
+        Returns:
+            tuple[HTTPStatus, dict]: The status and the JSON response.
+        """
+        path = target.split("?", 1)[0]
+        match path:
+            case "/health":
+                return HTTPStatus.OK, {"status": "ok"}
+            case "/stats":
+                return HTTPStatus.OK, self.stats()
+            case "/retime" if method != "POST":
+                return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST."}
+            case "/retime":
+                pass
+            case _:
+                return HTTPStatus.NOT_FOUND, {"error": f"{path} does not exist."}
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self._counters["errors"] += 1
+            return HTTPStatus.BAD_REQUEST, {"error": "The body is not valid JSON."}
+        batch = isinstance(payload, dict) and "requests" in payload
+        requests = payload["requests"] if batch else [payload]
+        if not isinstance(requests, list):
+            self._counters["errors"] += 1
+            return HTTPStatus.BAD_REQUEST, {"error": "The requests must be a list."}
+
+        results = await self._retime(requests)
+        if results is None:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": "The server is busy."}
+        self._counters["items"] += len(results)
+        self._counters["errors"] += sum("error" in result for result in results)
+        if batch:
+            return HTTPStatus.OK, {"results": results}
+        return (HTTPStatus.BAD_REQUEST if "error" in results[0] else HTTPStatus.OK), results[0]
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: HTTPStatus, response: dict, keep_alive: bool) -> None:
+        """Writes a JSON response.
+
+        Args:
+            writer (asyncio.StreamWriter): The connection writer.
+            status (HTTPStatus): The status.
+            response (dict): The JSON response.
+            keep_alive (bool): Whether the connection stays open for another request.
+        """
+        content = json.dumps(response).encode()
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(content)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + content
+        )
+        await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serves the requests of a connection, keeping it alive between requests.
+
+        A request that cannot be framed, because of a malformed request line or Content-Length, is answered with 400
+        and the connection is closed, as the start of the next request is unknown.
+
+        Args:
+            reader (asyncio.StreamReader): The connection reader.
+            writer (asyncio.StreamWriter): The connection writer.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while (line := await reader.readline()).strip():
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                started = perf_counter()
+                self._counters["requests"] += 1
+                parts = request_line.decode("latin-1").split()
+                length = headers.get("content-length", "0")
+                if len(parts) != 3 or not (length.isascii() and length.isdigit()):
+                    self._counters["errors"] += 1
+                    error = "The request line is malformed." if len(parts) != 3 else "The Content-Length is invalid."
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": error}, False)
+                    self._recent.append((monotonic(), perf_counter() - started))
+                    break
+                method, target, version = parts
+                length = int(length)
+
+                self._counters["in_flight"] += 1
+                try:
+                    if length > MAX_BODY:
+                        status, response = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "The body is too large."}
+                        headers["connection"] = "close"
+                    else:
+                        body = await reader.readexactly(length) if length else b""
+                        try:
+                            status, response = await self._route(method.upper(), target, body)
+                        except Exception as e:
+                            # A bug must still answer with a status rather than drop the connection
+                            self._counters["errors"] += 1
+                            status, response = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e) or type(e).__name__}
+                finally:
+                    self._counters["in_flight"] -= 1
+
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, response, keep_alive)
+                self._recent.append((monotonic(), perf_counter() - started))
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # A dropped connection, or a line longer than the stream buffer
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, unix: Optional[str] = None, ready: Optional[asyncio.Event] = None) -> None:
+        """Serves until cancelled.
+
+        Args:
+            host (str): The address to listen on. Defaults to "127.0.0.1", which only accepts local connections.
+            port (int): The port to listen on. Defaults to 8765.
+            unix (str | None): A Unix socket path to listen on instead of TCP. Defaults to None.
+            ready (asyncio.Event | None): Set once the server is listening. Defaults to None.
+        """
+        if self.workers:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            if unix:
+                server = await asyncio.start_unix_server(self.handle, path=unix)
+            else:
+                server = await asyncio.start_server(self.handle, host, port)
+            async with server:
+                if ready is not None:
+                    ready.set()
+                await server.serve_forever()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+
+def run_server(host: str = "127.0.0.1", port: int = 8765, unix: Optional[str] = None, workers: Optional[int] = None) -> None:
+    """Runs a retime server until it is interrupted.
+
+    Args:
+        host (str): The address to listen on. Defaults to "127.0.0.1".
+        port (int): The port to listen on. Defaults to 8765.
+        unix (str | None): A Unix socket path to listen on instead of TCP. Defaults to None.
+        workers (int | None): The number of worker processes. Defaults to None, which uses one per CPU.
+    """
+    try:
+        asyncio.run(RetimeServer(workers).serve(host, port, unix))
+    except KeyboardInterrupt:
+        pass
@@ -1,20 +1,28 @@
 # Standard library
-from typing import NoReturn
+from typing import NoReturn, Optional
 
 # Local application
 from crt.session_history.gui import SessionHistoryGUI
 from crt.language import Language
+from crt.recent_files import RecentFiles
 
 
 class SessionHistory:
     """Session history for CRT."""
 
-    def __init__(self, language: Language, past_file_paths: list) -> NoReturn:
-        """Initializes the SessionHistory class."""
-        if not past_file_paths:
+    def __init__(self, language: Language, recent_files: RecentFiles, current_file_path: Optional[str] = None) -> NoReturn:
+        """Initializes the SessionHistory class.
+
+        Args:
+            language (Language): The language of the window.
+            recent_files (RecentFiles): The recently used files.
+            current_file_path (str | None): The open file, which is left out. Defaults to None.
+        """
+        rows = recent_files.summaries(exclude=current_file_path)
+        if not rows:
             raise ValueError("No session history.")
 
-        self.window = SessionHistoryGUI(past_file_paths, language.content)
+        self.window = SessionHistoryGUI(rows, language.content)
 
     def run(self) -> str:
         """Runs the session history dialog.
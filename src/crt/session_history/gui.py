@@ -1,5 +1,5 @@
 # Standard Library
-from typing import NoReturn
+from typing import NoReturn, Optional
 
 # Third-party
 from PySide6.QtWidgets import (
@@ -10,19 +10,28 @@ from PySide6.QtGui import QFont
 
 # Local application
 from crt.base_gui import BaseGUI
+from crt.recent_files import FileSummary
+
+
+def _describe(summary: Optional[FileSummary]) -> str:
+    """Summarises a time file on one line."""
+    if summary is None:
+        return "Missing or unreadable"
+    loads = "1 load" if summary.load_count == 1 else f"{summary.load_count} loads"
+    return f"{summary.without_loads} without loads · {summary.with_loads} with loads · {loads} · {summary.framerate} FPS"
 
 
 class SessionHistoryDialog(QDialog):
     """Session history dialog for CRT."""
 
-    def __init__(self, past_file_paths: list, content: dict, parent=None):
+    def __init__(self, rows: list, content: dict, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Session History")
         self.setFixedSize(560, 300)
         self.setWindowModality(Qt.WindowModality.ApplicationModal)
-        self._build_ui(past_file_paths, content)
+        self._build_ui(rows, content)
 
-    def _build_ui(self, past_file_paths: list, content: dict):
+    def _build_ui(self, rows: list, content: dict):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(8)
@@ -30,30 +39,33 @@ class SessionHistoryDialog(QDialog):
         self.list_widget = QListWidget()
         self.list_widget.setObjectName("session_history")
         self.list_widget.setFont(QFont("Helvetica", 12))
-        for path in past_file_paths:
-            self.list_widget.addItem(QListWidgetItem(path))
+        for path, summary in rows:
+            item = QListWidgetItem(f"{path}\n{_describe(summary)}")
+            item.setData(Qt.ItemDataRole.UserRole, path)
+            item.setToolTip(path)
+            self.list_widget.addItem(item)
         layout.addWidget(self.list_widget)
 
     def get_selected(self):
         items = self.list_widget.selectedItems()
-        return [item.text() for item in items]
+        return [item.data(Qt.ItemDataRole.UserRole) for item in items]
 
 
 class SessionHistoryGUI(BaseGUI):
     """Wrapper around SessionHistoryDialog to match the BaseGUI/event-loop interface."""
 
-    def __init__(self, past_file_paths: list, content: dict):
-        self.window = SessionHistoryDialog(past_file_paths, content)
+    def __init__(self, rows: list, content: dict):
+        self.window = SessionHistoryDialog(rows, content)
         self._last_event = None
         self._last_values = {}
         self._connect_signals()
 
     def _connect_signals(self):
         self.window.list_widget.itemDoubleClicked.connect(
-            lambda item: self._emit("session_history", item.text())
+            lambda item: self._emit("session_history", item.data(Qt.ItemDataRole.UserRole))
         )
         self.window.list_widget.itemActivated.connect(
-            lambda item: self._emit("session_history", item.text())
+            lambda item: self._emit("session_history", item.data(Qt.ItemDataRole.UserRole))
         )
 
     def _emit(self, event: str, value=None):
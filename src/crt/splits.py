@@ -0,0 +1,136 @@
+# Standard library
+import re
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import BinaryIO, Optional, Union
+from xml.etree.ElementTree import iterparse
+
+# Local application
+from crt.framerate import FramerateLike, to_fraction
+
+# LiveSplit writes .NET TimeSpans: [-][d.]hh:mm:ss[.fffffff]
+_TIMESPAN = re.compile(r"\s*(-)?(?:(\d+)\.)?(\d+):(\d+):(\d+)(?:\.(\d+))?\s*")
+
+# Sections that can hold thousands of entries per attempt but never matter for a retime
+_SKIPPED = frozenset(("AttemptHistory", "SegmentHistory", "AutoSplitterSettings"))
+
+@dataclass(frozen=True, slots=True)
+class SplitSegment:
+    """
+    A segment of a splits file and its split time in seconds from the start of the run.
+    """
+    name: str
+    split_time: Optional[Fraction] = None
+
+@dataclass(slots=True)
+class Splits:
+    """
+    The segments of a splits file.
+    """
+    game: str = ""
+    category: str = ""
+    segments: list[SplitSegment] = field(default_factory=list)
+
+def parse_timespan(text: str) -> Fraction:
+    """Converts a LiveSplit time into seconds.
+
+    Args:
+        text (str): The time, e.g. "01:02:03.4560000" or "1.02:03:04.5".
+
+    Raises:
+        ValueError: The time is invalid.
+
+    Returns:
+        Fraction: The exact time in seconds.
+    """
+    match = _TIMESPAN.fullmatch(text)
+    if match is None:
+        raise ValueError(f"The split time {text!r} is invalid.")
+    sign, days, hours, minutes, seconds, fraction = match.groups()
+    whole = ((int(days or 0) * 24 + int(hours)) * 60 + int(minutes)) * 60 + int(seconds)
+    value = Fraction(whole * 10 ** len(fraction or "") + int(fraction or 0), 10 ** len(fraction or ""))
+    return -value if sign else value
+
+def read_splits(source: Union[str, BinaryIO], comparison: str = "Personal Best", timing: str = "RealTime") -> Splits:
+    """Reads the segments of a LiveSplit .lss file without building the whole document.
+
+    The file is parsed incrementally and every element is discarded once it has been read, so attempt and segment
+    histories cost no memory however long they are.
+
+    Args:
+        source (str | BinaryIO): The path or binary file of the splits.
+        comparison (str): The comparison to read the split times from. Defaults to "Personal Best".
+        timing (str): "RealTime" or "GameTime". Defaults to "RealTime".
+
+    Raises:
+        ValueError: The file is not a valid splits file.
+
+    Returns:
+        Splits: The game, the category and every segment in order. Skipped splits have no split time.
+    """
+    splits = Splits()
+    stack = []
+    skipping = 0
+    name = split_time = None
+    in_comparison = False
+
+    try:
+        for event, elem in iterparse(source, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                stack.append(elem)
+                if tag in _SKIPPED:
+                    skipping += 1
+                elif not skipping and tag == "SplitTime":
+                    in_comparison = elem.get("name") == comparison
+                continue
+
+            stack.pop()
+            if skipping:
+                if tag in _SKIPPED:
+                    skipping -= 1
+                    elem.clear()
+                elif stack:
+                    # Drop the finished entry from its parent inside the skipped section
+                    stack[-1].clear()
+                continue
+
+            match tag:
+                case "GameName":
+                    splits.game = (elem.text or "").strip()
+                case "CategoryName":
+                    splits.category = (elem.text or "").strip()
+                case "Name" if len(stack) >= 1 and stack[-1].tag == "Segment":
+                    name = (elem.text or "").strip()
+                case "SplitTime":
+                    in_comparison = False
+                case _ if tag == timing and in_comparison and elem.text:
+                    split_time = parse_timespan(elem.text)
+                case "Segment":
+                    splits.segments.append(SplitSegment(name or "", split_time))
+                    name = split_time = None
+                    elem.clear()
+    except SyntaxError as e:
+        # ElementTree.ParseError is a SyntaxError
+        raise ValueError(f"The splits file is invalid: {e}")
+
+    if not splits.segments:
+        raise ValueError("The splits file has no segments.")
+    return splits
+
+def split_frames(segments: list[SplitSegment], framerate: FramerateLike, start_frame: int = 0) -> list[Optional[int]]:
+    """Converts split times into frames, rounding half to even.
+
+    Args:
+        segments (list[SplitSegment]): The segments.
+        framerate (FramerateLike): The framerate of the video.
+        start_frame (int): The frame the run starts on. Defaults to 0.
+
+    Returns:
+        list[int | None]: The frame of every split, or None for skipped splits.
+    """
+    framerate = to_fraction(framerate)
+    return [
+        None if segment.split_time is None else start_frame + round(segment.split_time * framerate)
+        for segment in segments
+    ]
@@ -0,0 +1,10 @@
+"""
+Window that shows the segments of a splits file.
+"""
+
+from crt.splits_viewer.app import SplitsViewer
+
+__name__ = "crt.splits_viewer"
+__author__ = "Conner Glover"
+__description__ = "Window that shows the segments of a splits file."
+__all__ = ["SplitsViewer"]
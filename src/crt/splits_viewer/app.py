@@ -0,0 +1,55 @@
+# Standard library
+from typing import NoReturn
+
+# Local application
+from crt.splits import Splits, split_frames
+from crt.splits_viewer.gui import SplitsViewerGUI
+from crt.time import Time
+from crt.language import Language
+
+
+class SplitsViewer:
+    """Splits viewer for CRT — shows every segment of a splits file timed against the loads of the time."""
+
+    def __init__(self, time: Time, splits: Splits, language: Language) -> NoReturn:
+        """Initializes the SplitsViewer class."""
+        self.time = time
+        self.splits = splits
+        title = " - ".join(part for part in (splits.game, splits.category) if part) or language.content["Import Splits"]
+        self.window = SplitsViewerGUI(title, self._rows(), language.content)
+
+    def _rows(self) -> list[tuple]:
+        """Builds the table rows.
+
+        Split times count from the start frame of the time. A skipped split has no frame, so its segment is timed
+        together with the next one.
+
+        Returns:
+            list[tuple]: The name, split frame, time with loads and time without loads of every segment.
+        """
+        rows = []
+        previous = self.time.start_frame
+        frames = split_frames(self.splits.segments, self.time.framerate_fraction, self.time.start_frame)
+        for segment, frame in zip(self.splits.segments, frames):
+            if frame is None:
+                rows.append((segment.name, "-", "-", "-"))
+                continue
+            rows.append((
+                segment.name,
+                frame,
+                self.time.time_between(previous, frame),
+                self.time.time_between(previous, frame, without_loads=True),
+            ))
+            previous = frame
+        return rows
+
+    def run(self) -> NoReturn:
+        """Runs the splits viewer until it is closed."""
+        while True:
+            event, values = self.window.read()
+
+            match event:
+                case None:
+                    break
+
+        self.window.close()
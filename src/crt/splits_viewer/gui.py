@@ -0,0 +1,72 @@
+# Third-party
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView
+)
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+
+# Local application
+from crt.base_gui import BaseGUI
+
+
+class SplitsViewerDialog(QDialog):
+    """Dialog that lists the segments of a splits file with their times."""
+
+    def __init__(self, title: str, rows: list, content: dict, parent=None):
+        super().__init__(parent)
+        self.content = content
+        self.setWindowTitle(content["Import Splits"])
+        self.setMinimumSize(620, 420)
+        self.setWindowModality(Qt.WindowModality.ApplicationModal)
+        self._build_ui(title, rows, content)
+
+    def _build_ui(self, title: str, rows: list, content: dict):
+        c = content
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 14, 16, 14)
+        layout.setSpacing(10)
+
+        # Title
+        title_lbl = QLabel(title)
+        title_lbl.setFont(QFont("Helvetica", 18, QFont.Weight.Bold))
+        layout.addWidget(title_lbl)
+
+        # Segment table
+        self.table = QTableWidget(len(rows), 4)
+        self.table.setObjectName("segments")
+        self.table.setHorizontalHeaderLabels([c["Segment"], c["Split Frame"], c["With Loads"], c["Without Loads"]])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setFont(QFont("Helvetica", 12))
+        for index, row in enumerate(rows):
+            for column, text in enumerate(row):
+                item = QTableWidgetItem(str(text))
+                if column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(index, column, item)
+        layout.addWidget(self.table)
+
+
+class SplitsViewerGUI(BaseGUI):
+    """Wrapper around SplitsViewerDialog to match the BaseGUI/event-loop interface."""
+
+    def __init__(self, title: str, rows: list, content: dict):
+        self.window = SplitsViewerDialog(title, rows, content)
+        self._last_event = None
+        self._last_values = {}
+
+    def read(self) -> tuple:
+        """Blocking read: shows the dialog and returns (event, values)."""
+        from PySide6.QtWidgets import QApplication
+        self._last_event = None
+        self.window.show()
+        while self._last_event is None and self.window.isVisible():
+            QApplication.processEvents()
+        event = self._last_event
+        values = self._last_values
+        return event, values
+
+    def close(self):
+        if self.window:
+            self.window.close()
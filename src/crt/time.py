@@ -1,32 +1,123 @@
 # Standard library
 from decimal import Decimal as d
-from typing import Optional, NoReturn
+from enum import IntEnum
+from fractions import Fraction
+from operator import mul
+from typing import Callable, Iterable, Optional, NoReturn, Tuple, Union
 
 # Local application
-from crt.load import Load
-from crt.decorators import validate_load, format_time
+from crt import formatting
+from crt.coalesce import Merge, coalesce
+from crt.framerate import FramerateLike, to_display, to_fraction, units_to_decimal
+from crt.load import Load, LoadStore, LoadValidationError
+from crt.load_index import LoadIndex
+from crt.decorators import check_load, validate_load, format_time
+
+class Op(IntEnum):
+    """
+    The kinds of edit a `Time` reports to its listeners.
+
+    Every edit is reported as a compact tuple starting with its op, holding the values before and after the edit:
+
+    - MUTATE: (op, old_start, old_end, old_framerate_numerator, old_framerate_denominator, new_start, new_end,
+      new_framerate_numerator, new_framerate_denominator)
+    - ADD_LOAD: (op, index, start_frame, end_frame)
+    - DELETE_LOAD: (op, index, start_frame, end_frame)
+    - MUTATE_LOAD: (op, old_index, old_start, old_end, new_index, new_start, new_end)
+    - REPLACE_LOADS: (op, old_loads, new_loads), where both are `LoadStore` snapshots
+    """
+    MUTATE = 1
+    ADD_LOAD = 2
+    DELETE_LOAD = 3
+    MUTATE_LOAD = 4
+    REPLACE_LOADS = 5
+
+Edit = tuple
 
 class Time:
     """
     A class that represents a time in a video.
+
+    Every mutator reports the edit it made to the callbacks registered with `subscribe`, see `Op`, and bumps
+    `revision`, so callers can skip work when nothing has changed since they last looked.
     """
     
-    def __init__(self, start_frame: Optional[int] = 0, end_frame: Optional[int] = 0, framerate: Optional[d] = 60, precision: Optional[int] = 3, loads: Optional[list[Load]] = None) -> NoReturn:
+    def __init__(self, start_frame: Optional[int] = 0, end_frame: Optional[int] = 0, framerate: Optional[FramerateLike] = 60, precision: Optional[int] = 3, loads: Optional[Iterable[Load]] = None) -> NoReturn:
         """Initializes the Time class.
         
         Args:
             start_frame (int): The start frame of the time.
             end_frame (int): The end frame of the time.
-            framerate (d): The framerate of the video.
+            framerate (FramerateLike): The framerate of the video, e.g. 60, "59.94" or "30000/1001".
             precision (int): The precision of the time.
-            loads (list[Load] | None): The loads of the time.
+            loads (Iterable[Load] | None): The loads of the time.
         """
-        self.loads = loads if loads is not None else []
+        self._listeners: list[Callable[[Edit], None]] = []
+        self.revision = 0
         self.start_frame = start_frame
         self.end_frame = end_frame
         self.framerate = framerate
         self.precision = precision
+        self._set_index(LoadIndex())
+        if loads is not None:
+            self.replace_loads(loads)
 
+    def subscribe(self, callback: Callable[[Edit], None]) -> None:
+        """Registers a callback that receives every edit made to the time.
+
+        Args:
+            callback (Callable[[Edit], None]): The callback, see `Op` for the edits it receives.
+        """
+        self._listeners.append(callback)
+    
+    def unsubscribe(self, callback: Callable[[Edit], None]) -> None:
+        """Removes a callback registered with `subscribe`.
+
+        Args:
+            callback (Callable[[Edit], None]): The callback.
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def _emit(self, edit: Edit) -> None:
+        """Bumps the revision and reports an edit to every listener.
+
+        Args:
+            edit (Edit): The edit, see `Op`.
+        """
+        self.revision += 1
+        for callback in self._listeners:
+            callback(edit)
+    
+    def apply(self, edit: Edit, reverse: bool = False) -> None:
+        """Replays an edit reported by this or another time, or reverts it.
+
+        The replayed edit is reported to the listeners like any other edit.
+
+        Args:
+            edit (Edit): The edit, see `Op`.
+            reverse (bool): Whether to revert the edit instead. Defaults to False.
+        """
+        match Op(edit[0]):
+            case Op.MUTATE:
+                start_frame, end_frame, numerator, denominator = edit[1:5] if reverse else edit[5:9]
+                self.mutate(start_frame, end_frame, Fraction(numerator, denominator))
+            case Op.ADD_LOAD if reverse:
+                self.delete_load(edit[1])
+            case Op.ADD_LOAD:
+                self.add_load(edit[2], edit[3])
+            case Op.DELETE_LOAD if reverse:
+                self.add_load(edit[2], edit[3])
+            case Op.DELETE_LOAD:
+                self.delete_load(edit[1])
+            case Op.MUTATE_LOAD if reverse:
+                self.mutate_load(edit[4], start_frame=edit[2], end_frame=edit[3])
+            case Op.MUTATE_LOAD:
+                self.mutate_load(edit[1], start_frame=edit[5], end_frame=edit[6])
+            case Op.REPLACE_LOADS:
+                loads = edit[1] if reverse else edit[2]
+                self._replace_index(LoadIndex(loads.copy()))
+    
     @property
     def length_with_loads(self) -> int:
         """Calculates the total length in frames including loads.
@@ -36,6 +127,326 @@ class Time:
         """        
         return int(self.end_frame - self.start_frame)
     
+    @property
+    def framerate(self) -> Union[d, Fraction]:
+        """The framerate of the video.
+
+        Returns:
+            d | Fraction: The framerate as a Decimal, or as a Fraction if it has no exact decimal form.
+        """
+        return self._framerate_display
+    
+    @framerate.setter
+    def framerate(self, framerate: FramerateLike) -> None:
+        """Sets the framerate, keeping it as an exact rational.
+
+        Args:
+            framerate (FramerateLike): The framerate of the video.
+        """
+        self._framerate = to_fraction(framerate)
+        self._framerate_display = to_display(self._framerate)
+        self._conversion = None
+        self.revision += 1
+    
+    @property
+    def precision(self) -> int:
+        """The number of decimal places times are rounded to.
+
+        Returns:
+            int: The precision of the time.
+        """
+        return self._precision
+    
+    @precision.setter
+    def precision(self, precision: int) -> None:
+        """Sets the precision of the time.
+
+        Args:
+            precision (int): The number of decimal places.
+        """
+        self._precision = int(precision)
+        self._conversion = None
+        self.revision += 1
+    
+    @property
+    def framerate_fraction(self) -> Fraction:
+        """The exact framerate of the video.
+
+        Returns:
+            Fraction: The framerate.
+        """
+        return self._framerate
+    
+    def frames_to_units(self, frames: int) -> int:
+        """Converts frames into whole `10 ** -precision` second units with integer arithmetic.
+
+        Args:
+            frames (int): The number of frames.
+
+        Returns:
+            int: The rounded time in units, or 0 if the framerate is 0.
+        """
+        if self._conversion is None:
+            # Cache the integer scale factors so each conversion is one multiply and one divmod
+            self._conversion = (
+                self._framerate.denominator * 10 ** self._precision,
+                self._framerate.numerator,
+                units_to_decimal(1, self._precision),
+            )
+        scale, divisor, _ = self._conversion
+        if not divisor:
+            return 0
+        units, remainder = divmod(frames * scale, divisor)
+        # Round half to even, matching crt.framerate.frames_to_units
+        twice = remainder * 2
+        if twice > divisor or (twice == divisor and units & 1):
+            units += 1
+        return units
+    
+    def frames_to_time(self, frames: int) -> d:
+        """Converts frames into seconds with integer arithmetic, rounding only to the precision.
+
+        Args:
+            frames (int): The number of frames.
+
+        Returns:
+            d: The time in seconds, or 0 if the framerate is 0.
+        """
+        units = self.frames_to_units(frames)
+        return d(units) * self._conversion[2]
+    
+    def time_components(self, loads: bool = False) -> Tuple[str, str, str, str]:
+        """Splits the time into hours, minutes, seconds and the fractional part.
+
+        Args:
+            loads (bool): Whether to use the time without loads. Defaults to False.
+
+        Returns:
+            Tuple[str, str, str, str]: The zero-padded components, see `crt.formatting.time_components`.
+        """
+        frames = self.length_without_loads if loads else self.length_with_loads
+        return formatting.time_components(self.frames_to_units(frames), self._precision)
+    
+    @property
+    def loads(self) -> LoadStore:
+        """The loads of the time, ordered by start frame.
+
+        Returns:
+            LoadStore: The loads of the time.
+        """
+        return self._loads
+    
+    @loads.setter
+    def loads(self, loads: Iterable[Load]) -> None:
+        """Replaces the loads, see `replace_loads`.
+
+        Args:
+            loads (Iterable[Load]): The new loads, in any order.
+
+        Raises:
+            LoadValidationError: At least one of the loads is invalid.
+        """
+        self.replace_loads(loads)
+    
+    def _validate_loads(self, loads: Iterable[Union[Load, tuple[int, int]]], existing: Optional[LoadStore] = None) -> LoadIndex:
+        """Validates a batch of loads in one pass and indexes it.
+
+        Args:
+            loads (Iterable[Load | tuple[int, int]]): The loads to validate.
+            existing (LoadStore | None): The loads the batch is added to, if any.
+
+        Raises:
+            LoadValidationError: At least one of the loads is invalid.
+
+        Returns:
+            LoadIndex: The index of the existing loads and the batch.
+        """
+        if isinstance(loads, LoadStore):
+            loads = loads.pairs()
+        rows = []
+        errors = []
+        for row, load in enumerate(loads):
+            start_frame, end_frame = (load.start_frame, load.end_frame) if isinstance(load, Load) else load
+            try:
+                start_frame, end_frame = int(start_frame), int(end_frame)
+            except (TypeError, ValueError):
+                errors.append((row, "The load frames must be whole numbers."))
+                continue
+            try:
+                check_load(start_frame, end_frame)
+                self._check_bounds(start_frame, end_frame)
+            except ValueError as e:
+                errors.append((row, str(e)))
+                continue
+            rows.append((start_frame, end_frame, row))
+
+        index, overlaps = LoadIndex.build(rows, existing)
+        errors.extend(overlaps)
+        if errors:
+            raise LoadValidationError(sorted(errors))
+        return index
+    
+    def _replace_index(self, index: LoadIndex, aggregates: Optional[tuple[int, Optional[int], Optional[int]]] = None) -> None:
+        """Swaps in a new load index and reports the replacement.
+
+        The old store is never touched again by the time, so it is handed to the listeners without copying.
+
+        Args:
+            index (LoadIndex): The new index.
+            aggregates (tuple[int, int | None, int | None] | None): The known total, shortest and longest load length,
+                see `_set_index`. Defaults to None.
+        """
+        old_loads = self._loads
+        self._set_index(index, aggregates)
+        # Nobody can hold on to the snapshot without a listener, so skip the copy
+        self._emit((Op.REPLACE_LOADS, old_loads, index.store.copy() if self._listeners else None))
+    
+    def _set_index(self, index: LoadIndex, aggregates: Optional[tuple[int, Optional[int], Optional[int]]] = None) -> None:
+        """Swaps in a new load index and rebuilds the aggregates.
+
+        Args:
+            index (LoadIndex): The new index.
+            aggregates (tuple[int, int | None, int | None] | None): The total, shortest and longest load length if they
+                are already known, which skips the scan over the loads. The sum of squares is then only computed if the
+                variance is asked for. Defaults to None.
+        """
+        self._index = index
+        self._loads = index.store
+        if aggregates is not None:
+            self._load_total, self._load_min, self._load_max = aggregates
+            self._load_sum_of_squares = None
+            self._extremes_stale = False
+            return
+        lengths = self._loads.lengths()
+        self._load_total = sum(lengths)
+        self._load_sum_of_squares = sum(map(mul, lengths, lengths))
+        self._load_min = min(lengths) if lengths else None
+        self._load_max = max(lengths) if lengths else None
+        self._extremes_stale = False
+    
+    def add_loads(self, loads: Iterable[Union[Load, tuple[int, int]]]) -> int:
+        """Adds a batch of loads, validating every load before any of them are added.
+
+        Args:
+            loads (Iterable[Load | tuple[int, int]]): The loads to add, in any order.
+
+        Raises:
+            LoadValidationError: At least one of the loads is invalid. The error lists every bad row.
+
+        Returns:
+            int: The number of loads added.
+        """
+        count = len(self._loads)
+        self._replace_index(self._validate_loads(loads, self._loads))
+        return len(self._loads) - count
+    
+    def replace_loads(self, loads: Iterable[Union[Load, tuple[int, int]]]) -> None:
+        """Replaces every load with a batch, validating every load before any of them are replaced.
+
+        Args:
+            loads (Iterable[Load | tuple[int, int]]): The new loads, in any order.
+
+        Raises:
+            LoadValidationError: At least one of the loads is invalid. The error lists every bad row.
+        """
+        self._replace_index(self._validate_loads(loads))
+    
+    def adopt_loads(self, store: LoadStore, aggregates: Optional[tuple[int, Optional[int], Optional[int]]] = None) -> None:
+        """Replaces the loads with a store that is known to be valid, without validating or copying it.
+
+        This is how binary time files are opened: they only ever hold loads that passed validation when they were
+        saved, so re-checking a million loads would only slow the opening down. The store is used as is, so a store
+        backed by a memory-mapped file keeps paging its loads in lazily. A store that fails the cheap checks of
+        `_plausible`, e.g. from a damaged or hand-made file, is validated like `replace_loads` instead.
+
+        Args:
+            store (LoadStore): Loads sorted by start frame that do not overlap and lie within the run.
+            aggregates (tuple[int, int | None, int | None] | None): The total, shortest and longest load length, if
+                known. Defaults to None.
+
+        Raises:
+            LoadValidationError: The store failed the cheap checks and at least one of its loads is invalid.
+        """
+        if not self._plausible(store, aggregates):
+            self.replace_loads(store)
+            return
+        self._replace_index(LoadIndex(store), aggregates)
+    
+    def _plausible(self, store: LoadStore, aggregates: Optional[tuple[int, Optional[int], Optional[int]]]) -> bool:
+        """Checks in constant time that a store can be adopted without validating every load.
+
+        Args:
+            store (LoadStore): The loads.
+            aggregates (tuple[int, int | None, int | None] | None): The total, shortest and longest load length.
+
+        Returns:
+            bool: True if the first and last loads lie within the run and the aggregates agree with the load count.
+        """
+        count = len(store)
+        if not count:
+            return aggregates is None or tuple(aggregates) == (0, None, None)
+        first, last = store[0], store[-1]
+        if first.start_frame < self.start_frame or last.end_frame > self.end_frame:
+            return False
+        if first.start_frame >= first.end_frame or last.start_frame >= last.end_frame:
+            return False
+        if aggregates is None:
+            return True
+        total, shortest, longest = aggregates
+        if shortest is None or longest is None or not 0 < shortest <= longest:
+            return False
+        return (count * shortest <= total <= count * longest
+                and shortest <= first.end_frame - first.start_frame <= longest
+                and shortest <= last.end_frame - last.start_frame <= longest
+                and total <= last.end_frame - first.start_frame)
+    
+    def _track_load(self, length: int) -> None:
+        """Adds a load length to the running aggregates.
+
+        Args:
+            length (int): The length of the load in frames.
+        """
+        self._load_total += length
+        if self._load_sum_of_squares is not None:
+            self._load_sum_of_squares += length * length
+        if not self._extremes_stale:
+            if self._load_min is None or length < self._load_min:
+                self._load_min = length
+            if self._load_max is None or length > self._load_max:
+                self._load_max = length
+    
+    def _untrack_load(self, length: int) -> None:
+        """Removes a load length from the running aggregates.
+
+        The minimum and maximum are only rescanned lazily, and only when the removed load was one of them.
+
+        Args:
+            length (int): The length of the load in frames.
+        """
+        self._load_total -= length
+        if self._load_sum_of_squares is not None:
+            self._load_sum_of_squares -= length * length
+        if length == self._load_min or length == self._load_max:
+            self._extremes_stale = True
+    
+    def _refresh_extremes(self) -> None:
+        """Rescans the loads for the shortest and longest load if a removal invalidated them."""
+        if not self._extremes_stale:
+            return
+        lengths = self._loads.lengths()
+        self._load_min = min(lengths) if lengths else None
+        self._load_max = max(lengths) if lengths else None
+        self._extremes_stale = False
+    
+    @property
+    def total_load_length(self) -> int:
+        """The combined length of every load in frames.
+
+        Returns:
+            int: The total load length.
+        """
+        return self._load_total
+    
     @property
     def length_without_loads(self) -> int:
         """Calculates the total length in frames excluding loads.
@@ -43,7 +454,7 @@ class Time:
         Returns:
             int: The total length in frames excluding loads.
         """        
-        return int(self.length_with_loads - sum([load.length for load in self.loads]))
+        return int(self.length_with_loads - self._load_total)
     
     @property
     def average_load_length(self) -> int:
@@ -52,7 +463,42 @@ class Time:
         Returns:
             int: The average load length.
         """        
-        return int(sum([load.length for load in self.loads]) / len(self.loads)) if self.loads else 0
+        return int(self._load_total / len(self._loads)) if self._loads else 0
+    
+    @property
+    def shortest_load_length(self) -> int:
+        """The length of the shortest load.
+
+        Returns:
+            int: The shortest load length, or 0 if there are no loads.
+        """
+        self._refresh_extremes()
+        return self._load_min if self._load_min is not None else 0
+    
+    @property
+    def longest_load_length(self) -> int:
+        """The length of the longest load.
+
+        Returns:
+            int: The longest load length, or 0 if there are no loads.
+        """
+        self._refresh_extremes()
+        return self._load_max if self._load_max is not None else 0
+    
+    @property
+    def load_length_variance(self) -> float:
+        """The population variance of the load lengths.
+
+        Returns:
+            float: The variance of the load lengths, or 0.0 if there are no loads.
+        """
+        count = len(self._loads)
+        if not count:
+            return 0.0
+        if self._load_sum_of_squares is None:
+            lengths = self._loads.lengths()
+            self._load_sum_of_squares = sum(map(mul, lengths, lengths))
+        return max(self._load_sum_of_squares * count - self._load_total ** 2, 0) / (count * count)
     
     @property
     def with_loads(self) -> d:
@@ -61,9 +507,7 @@ class Time:
         Returns:
             d: The total time.
         """        
-        if int(self.framerate) == 0:
-            return d(0.000)
-        return round(d(self.length_with_loads / d(self.framerate)), self.precision)
+        return self.frames_to_time(self.length_with_loads)
     
     @property
     def without_loads(self) -> d:
@@ -72,26 +516,160 @@ class Time:
         Returns:
             d: The time excluding loads.
         """        
-        if self.framerate == 0:
-            return d(0.000)
-        return round(d(self.length_without_loads / d(self.framerate)), self.precision)
+        return self.frames_to_time(self.length_without_loads)
+    
+    def load_length_between(self, start_frame: int, end_frame: int) -> int:
+        """Calculates the load length within `start_frame <= frame < end_frame`, clipping loads that straddle the range.
+
+        Args:
+            start_frame (int): The first frame of the range.
+            end_frame (int): The frame after the last frame of the range.
+
+        Returns:
+            int: The load length within the range in frames.
+        """
+        if end_frame <= start_frame:
+            return 0
+        return self._index.covered(start_frame, end_frame)
+    
+    def load_length_before(self, frame: int) -> int:
+        """Calculates the load length before a frame.
+
+        Args:
+            frame (int): The frame to measure up to.
+
+        Returns:
+            int: The load length before the frame in frames.
+        """
+        if not self._loads:
+            return 0
+        return self.load_length_between(self._loads[0].start_frame, frame)
+    
+    def length_between(self, start_frame: int, end_frame: int, without_loads: bool = False) -> int:
+        """Calculates the length of the part of the run within `start_frame <= frame < end_frame`.
+
+        Args:
+            start_frame (int): The first frame of the range, e.g. a split.
+            end_frame (int): The frame after the last frame of the range, e.g. the next split.
+            without_loads (bool): Whether to exclude the loads within the range. Defaults to False.
+
+        Returns:
+            int: The length of the range in frames.
+        """
+        start_frame = max(start_frame, self.start_frame)
+        end_frame = min(end_frame, self.end_frame)
+        if end_frame <= start_frame:
+            return 0
+        length = end_frame - start_frame
+        if without_loads:
+            length -= self._index.covered(start_frame, end_frame)
+        return length
+    
+    def time_between(self, start_frame: int, end_frame: int, without_loads: bool = False) -> d:
+        """Calculates the time of the part of the run within `start_frame <= frame < end_frame`.
+
+        Args:
+            start_frame (int): The first frame of the range, e.g. a split.
+            end_frame (int): The frame after the last frame of the range, e.g. the next split.
+            without_loads (bool): Whether to exclude the loads within the range. Defaults to False.
+
+        Returns:
+            d: The time of the range.
+        """
+        return self.frames_to_time(self.length_between(start_frame, end_frame, without_loads))
+    
+    def coalesce_loads(self, gap: int = 0) -> list[Merge]:
+        """Merges loads that touch or are at most `gap` frames apart.
+
+        Args:
+            gap (int): The largest number of frames between two loads that still merges them. Defaults to 0.
+
+        Returns:
+            list[Merge]: Every load that was made from more than one load.
+        """
+        merged, merges = coalesce(self._loads, gap, presorted=True)
+        if merges:
+            self._replace_index(LoadIndex(merged))
+        return merges
     
     def clear_loads(self) -> None:
         """Clears the loads.
         """
-        self.loads = []
+        if self._loads:
+            self._replace_index(LoadIndex())
     
-    def mutate(self, start_frame: Optional[int] = None, end_frame: Optional[int] = None, framerate: Optional[d] = None) -> None:
+    def mutate(self, start_frame: Optional[int] = None, end_frame: Optional[int] = None, framerate: Optional[FramerateLike] = None) -> None:
         """Mutates the time.
         
         Args:
             start_frame (int): The start frame of the time. Default to None.
             end_frame (int): The end frame of the time. Default to None.
-            framerate (d): The framerate of the video. Defaults to None
+            framerate (FramerateLike): The framerate of the video. Defaults to None
+
+        Raises:
+            ValueError: The new run would leave loads outside of it, which a time file could not be reopened with.
+        """
+        old = (self.start_frame, self.end_frame, self._framerate)
+        start_frame = start_frame if start_frame is not None else self.start_frame
+        end_frame = end_frame if end_frame is not None else self.end_frame
+        outside = self._index.outside(start_frame, end_frame) if self._loads else None
+        if outside:
+            raise ValueError(
+                f"The run would leave {len(outside)} loads outside of it, starting with load {outside[0] + 1}."
+            )
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        if framerate is not None:
+            self.framerate = framerate
+        if old != (self.start_frame, self.end_frame, self._framerate):
+            self._emit((
+                Op.MUTATE, old[0], old[1], old[2].numerator, old[2].denominator,
+                self.start_frame, self.end_frame, self._framerate.numerator, self._framerate.denominator,
+            ))
+    
+    def loads_between(self, start_frame: int, end_frame: int) -> range:
+        """Finds the loads that share at least one frame with `start_frame <= frame < end_frame`.
+
+        Args:
+            start_frame (int): The first frame of the range.
+            end_frame (int): The frame after the last frame of the range.
+
+        Returns:
+            range: The indices of the intersecting loads.
+        """
+        return self._index.intersecting(start_frame, end_frame)
+    
+    def load_at(self, frame: int) -> Optional[int]:
+        """Finds the load that covers a frame.
+
+        Args:
+            frame (int): The frame to look up.
+
+        Returns:
+            int | None: The index of the load, or None if the frame is not inside a load.
         """
-        self.start_frame = start_frame if start_frame is not None else self.start_frame
-        self.end_frame = end_frame if end_frame is not None else self.end_frame
-        self.framerate = framerate if framerate is not None else self.framerate
+        return self._index.containing(frame)
+    
+    def loads_outside_run(self) -> list[int]:
+        """Finds the loads that no longer lie between the start and end frame, e.g. after the run was re-bounded.
+
+        Returns:
+            list[int]: The indices of the loads outside of the run.
+        """
+        return self._index.outside(self.start_frame, self.end_frame)
+    
+    def _check_bounds(self, start_frame: int, end_frame: int) -> None:
+        """Checks that a load lies within the run.
+
+        Args:
+            start_frame (int): The first frame of the load.
+            end_frame (int): The final frame of the load.
+
+        Raises:
+            ValueError: The load lies outside of the run.
+        """
+        if start_frame < self.start_frame or end_frame > self.end_frame:
+            raise ValueError("The load lies outside of the run.")
     
     def get_load(self, index: int) -> d:
         """Gets the load time.
@@ -102,9 +680,7 @@ class Time:
         Returns:
             d: The load time.
         """
-        load_time = self.loads[index].length / self.framerate
-        
-        return load_time
+        return self.frames_to_time(self._loads[index].length)
     
     def delete_load(self, index: int) -> NoReturn:
         """Deletes the load.
@@ -112,24 +688,53 @@ class Time:
         Args:
             index (int): The index of the load.
         """
-        del self.loads[index]
+        if index < 0:
+            index += len(self._loads)
+        load = self._index.remove(index)
+        self._untrack_load(load.length)
+        self._emit((Op.DELETE_LOAD, index, load.start_frame, load.end_frame))
     
     @validate_load
-    def mutate_load(self, index: int, start_frame: Optional[int] = None, end_frame: Optional[int] = None) -> NoReturn:
+    def mutate_load(self, index: int, start_frame: Optional[int] = None, end_frame: Optional[int] = None) -> int:
         """Mutates the load.
         
         Args:
             index (int): The index of the load.
             start_frame (int): The start frame of the load.
             end_frame (int): The end frame of the load.
+
+        Raises:
+            ValueError: The duration of the load is 0.000
+            ValueError: The load time ends before it starts.
+            ValueError: The load lies outside of the run.
+            ValueError: The load overlaps an existing load.
+
+        Returns:
+            int: The new index of the load, which changes if the load moved past a neighbour.
         """
-        if start_frame is not None:
-            self.loads[index].start_frame = start_frame
-        if end_frame is not None:
-            self.loads[index].end_frame = end_frame
+        if index < 0:
+            index += len(self._loads)
+        load = self._loads[index]
+        new_start = start_frame if start_frame is not None else load.start_frame
+        new_end = end_frame if end_frame is not None else load.end_frame
+        if (new_start, new_end) == (load.start_frame, load.end_frame):
+            return index
+        check_load(new_start, new_end)
+        self._check_bounds(new_start, new_end)
+        
+        self._index.remove(index)
+        try:
+            new_index = self._index.insert(new_start, new_end)
+        except ValueError:
+            self._index.restore(index, load)
+            raise
+        self._untrack_load(load.length)
+        self._track_load(new_end - new_start)
+        self._emit((Op.MUTATE_LOAD, index, load.start_frame, load.end_frame, new_index, new_start, new_end))
+        return new_index
     
     @validate_load
-    def add_load(self, start_frame: int, end_frame: int) -> NoReturn:
+    def add_load(self, start_frame: int, end_frame: int) -> int:
         """Adds a load.
 
         Args:
@@ -138,15 +743,20 @@ class Time:
 
         Raises:
             ValueError: You must provide an input for the loads.
-            ValueError: The load time exceeds the time.
+            ValueError: The load lies outside of the run.
+            ValueError: The load overlaps an existing load.
+
+        Returns:
+            int: The index of the new load.
         """        
         if start_frame == 0 and end_frame == 0:
             raise ValueError("You must provide an input for the loads")
-        elif self.length_without_loads - (end_frame - start_frame) < 0:
-            raise ValueError("The load time exceeds the time")
+        self._check_bounds(start_frame, end_frame)
         
-        load = Load(start_frame, end_frame)
-        self.loads.append(load)
+        index = self._index.insert(start_frame, end_frame)
+        self._track_load(end_frame - start_frame)
+        self._emit((Op.ADD_LOAD, index, start_frame, end_frame))
+        return index
 
     @format_time
     def src_format(self, hours: str, minutes: str, seconds: str, ms: str) -> str:
@@ -156,12 +766,12 @@ class Time:
             hours (str): String of hours
             minutes (str): String of minutes
             seconds (str): String of seconds
-            ms (str): String of Milliseconds
+            ms (str): String of the fractional part, `precision` digits long
 
         Returns:
             str: Formatted time
         """        
-        return f"{hours}h {minutes}m {seconds}s {ms}ms"
+        return formatting.src_format(hours, minutes, seconds, ms)
     
     @format_time 
     def iso_format(self, hours: str, minutes: str, seconds: str, ms: str) -> str:
@@ -171,13 +781,9 @@ class Time:
             hours (str): String of hours
             minutes (str): String of minutes
             seconds (str): String of seconds
-            ms (str): String of Milliseconds
+            ms (str): String of the fractional part, `precision` digits long
 
         Returns:
             str: Formatted time
         """
-        if int(hours) > 0:
-            return f"{hours}:{minutes}:{seconds}.{ms}"
-        elif int(minutes) > 0:
-            return f"{minutes}:{seconds}.{ms}"
-        return f"{seconds}.{ms}"
+        return formatting.iso_format(hours, minutes, seconds, ms)
@@ -0,0 +1,226 @@
+# Standard library
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import BinaryIO, Optional
+
+# Local application
+from crt.load import LoadStore
+
+MAGIC = b"CRTB"
+VERSION = 1
+EXTENSION = ".crtb"
+
+# magic, version, flags, start frame, end frame, framerate numerator and denominator, precision, reserved, load count,
+# total, shortest and longest load length. Little-endian and 80 bytes, so the int64 columns after it stay aligned.
+HEADER = struct.Struct("<4sHHqqqqIIqqqq")
+
+# The shortest and longest load length of a time without loads
+_NO_LOADS = -1
+
+@dataclass(frozen=True, slots=True)
+class BinaryHeader:
+    """
+    The header of a binary time file: everything but the loads themselves.
+    """
+    start_frame: int
+    end_frame: int
+    framerate: Fraction
+    precision: int
+    count: int
+    total: int
+    shortest: Optional[int]
+    longest: Optional[int]
+
+    @property
+    def aggregates(self) -> tuple[int, Optional[int], Optional[int]]:
+        """The load aggregates, in the order `Time.adopt_loads` takes them.
+
+        Returns:
+            tuple[int, int | None, int | None]: The total, shortest and longest load length.
+        """
+        return self.total, self.shortest, self.longest
+
+def is_binary(path: str) -> bool:
+    """Checks whether a path names a binary time file.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        bool: True if the path has the binary extension.
+    """
+    return path.lower().endswith(EXTENSION)
+
+def to_binary(data: dict) -> bytes:
+    """Serialises a time file into the binary format.
+
+    The header is followed by the start frame of every load and then the end frame of every load, as little-endian
+    int64.
+
+    Args:
+        data (dict): The time file contents, see `crt.time_file.snapshot`.
+
+    Raises:
+        ValueError: A frame or the framerate does not fit the format.
+
+    Returns:
+        bytes: The file contents.
+    """
+    loads = data["loads"]
+    if not isinstance(loads, LoadStore):
+        loads = LoadStore(loads)
+    framerate = Fraction(str(data["framerate"]))
+    aggregates = data.get("aggregates")
+    if aggregates is None:
+        lengths = loads.lengths()
+        aggregates = (sum(lengths), min(lengths, default=None), max(lengths, default=None))
+    total, shortest, longest = aggregates
+
+    try:
+        header = HEADER.pack(
+            MAGIC, VERSION, 0,
+            int(data["start_frame"]), int(data["end_frame"]),
+            framerate.numerator, framerate.denominator,
+            int(data.get("precision", 3)), 0,
+            len(loads), total,
+            _NO_LOADS if shortest is None else shortest,
+            _NO_LOADS if longest is None else longest,
+        )
+    except struct.error as e:
+        raise ValueError(f"The time cannot be stored in a binary file: {e}")
+
+    columns = [loads.starts, loads.ends]
+    if sys.byteorder != "little":
+        columns = [array(LoadStore.TYPECODE, column) for column in columns]
+        for column in columns:
+            column.byteswap()
+    return b"".join((header, *columns))
+
+def _unpack_header(buffer: bytes) -> BinaryHeader:
+    """Reads and checks a binary header.
+
+    Args:
+        buffer (bytes): At least the first `HEADER.size` bytes of the file.
+
+    Raises:
+        ValueError: The file is not a binary time file or was written by a newer version.
+
+    Returns:
+        BinaryHeader: The header.
+    """
+    if len(buffer) < HEADER.size:
+        raise ValueError("The file provided is corrupted.")
+    (magic, version, _, start_frame, end_frame, numerator, denominator, precision, _, count, total, shortest,
+     longest) = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("The file provided is not a time file.")
+    if version > VERSION:
+        raise ValueError("The file was saved by a newer version of CRT.")
+    if denominator <= 0 or count < 0:
+        raise ValueError("The file provided is corrupted.")
+    return BinaryHeader(
+        start_frame, end_frame, Fraction(numerator, denominator), precision, count, total,
+        None if shortest == _NO_LOADS else shortest,
+        None if longest == _NO_LOADS else longest,
+    )
+
+def read_header(file: BinaryIO) -> BinaryHeader:
+    """Reads the header of a binary time file without reading the loads.
+
+    Args:
+        file (BinaryIO): The file.
+
+    Raises:
+        ValueError: The file is not a valid binary time file.
+
+    Returns:
+        BinaryHeader: The header.
+    """
+    return _unpack_header(file.read(HEADER.size))
+
+def open_binary(path: str) -> tuple[BinaryHeader, LoadStore]:
+    """Opens a binary time file by memory-mapping it.
+
+    Only the header is read. The loads are read straight from the mapping, so the operating system pages them in as
+    they are used and opening a file costs the same however many loads it holds. The mapping stays open for as long as
+    the store reads from it, and the file can still be replaced by a save in the meantime on POSIX systems.
+
+    Args:
+        path (str): The file path.
+
+    Raises:
+        ValueError: The file is not a valid binary time file.
+
+    Returns:
+        tuple[BinaryHeader, LoadStore]: The header and the loads.
+    """
+    with open(path, "rb") as file:
+        header = read_header(file)
+        size = HEADER.size + 2 * header.count * 8
+        file.seek(0, 2)
+        if file.tell() != size:
+            raise ValueError("The file provided is corrupted.")
+        if not header.count:
+            return header, LoadStore()
+        if sys.byteorder != "little":
+            # The columns have to be byte swapped anyway, so there is nothing to gain from mapping them
+            file.seek(HEADER.size)
+            starts, ends = array(LoadStore.TYPECODE), array(LoadStore.TYPECODE)
+            starts.fromfile(file, header.count)
+            ends.fromfile(file, header.count)
+            starts.byteswap()
+            ends.byteswap()
+            return header, LoadStore.from_arrays(starts, ends)
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapping)
+    middle = HEADER.size + header.count * 8
+    starts = view[HEADER.size:middle].cast(LoadStore.TYPECODE)
+    ends = view[middle:].cast(LoadStore.TYPECODE)
+    return header, LoadStore.from_buffer(starts, ends)
+
+def json_to_binary(source: str, destination: str) -> int:
+    """Converts a JSON time file into a binary time file.
+
+    Args:
+        source (str): The path of the JSON file.
+        destination (str): The path of the binary file.
+
+    Raises:
+        ValueError: The JSON file is corrupted or holds invalid loads.
+
+    Returns:
+        int: The number of loads converted.
+    """
+    # Imported here to keep this module usable on its own, crt.time_file imports it back
+    from crt.time import Time
+    from crt.time_file import load_time_file, save_time_file, snapshot
+
+    data = load_time_file(source)
+    time = Time(data["start_frame"], data["end_frame"], data["framerate"])
+    time.replace_loads(data["loads"])
+    save_time_file(destination, snapshot(time))
+    return len(time.loads)
+
+def binary_to_json(source: str, destination: str) -> int:
+    """Converts a binary time file into a JSON time file.
+
+    Args:
+        source (str): The path of the binary file.
+        destination (str): The path of the JSON file.
+
+    Raises:
+        ValueError: The binary file is corrupted.
+
+    Returns:
+        int: The number of loads converted.
+    """
+    from crt.time_file import load_time_file, save_time_file
+
+    data = load_time_file(source)
+    save_time_file(destination, data)
+    return len(data["loads"])
@@ -0,0 +1,313 @@
+# Standard library
+import json
+import os
+import re
+import threading
+from time import monotonic
+from typing import Callable, Optional, Union
+
+# Local application
+from crt.load import LoadStore
+from crt.time import Time
+from crt.time_binary import is_binary, open_binary, read_header, to_binary
+
+# mkstemp creates private files, so new time files get the permissions open() would have given them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# The keys of a JSON time file
+_JSON_KEYS = ("start_frame", "end_frame", "framerate", "loads")
+
+_RUN_KEY = re.compile(r'"(start_frame|end_frame|framerate)"\s*:\s*')
+_DECODER = json.JSONDecoder()
+
+def snapshot(time: Time) -> dict:
+    """Takes a copy of everything a time file stores.
+
+    Copying the load columns is a memory copy, so this is cheap enough for the GUI thread even with many loads. The
+    snapshot can then be serialised on another thread while the time keeps changing.
+
+    Args:
+        time (Time): The time.
+
+    Returns:
+        dict: The time file contents, with the loads as a `LoadStore`, plus the precision and the load aggregates that
+        the binary format stores.
+    """
+    if os.name == "nt" and time.loads.mapped:
+        # Windows cannot replace a file that is still mapped, so stop reading the loads from it before saving
+        time.loads.detach()
+    return {
+        "start_frame": time.start_frame,
+        "end_frame": time.end_frame,
+        "framerate": str(time.framerate),
+        "loads": time.loads.copy(),
+        "precision": time.precision,
+        "aggregates": (time.total_load_length, time.shortest_load_length if time.loads else None,
+                       time.longest_load_length if time.loads else None),
+    }
+
+def to_json(data: dict) -> str:
+    """Serialises a time file.
+
+    Args:
+        data (dict): The time file contents, see `snapshot`.
+
+    Returns:
+        str: The JSON text.
+    """
+    data = {key: data[key] for key in _JSON_KEYS}
+    if isinstance(data["loads"], LoadStore):
+        data["loads"] = list(data["loads"].pairs())
+    return json.dumps(data)
+
+def write_atomic(path: str, text: Union[str, bytes]) -> None:
+    """Writes a file so that it is either fully replaced or left untouched.
+
+    The text goes into a temporary file in the same directory, which is flushed to disk and then renamed over the
+    target. A crash or full disk halfway through never leaves a truncated file behind.
+
+    Args:
+        path (str): The file path.
+        text (str | bytes): The file contents.
+    """
+    # tempfile pulls in random and shutil, which only saving needs
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        os.chmod(temp_path, mode)
+        with os.fdopen(fd, "wb" if isinstance(text, bytes) else "w") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+def save_time_file(path: str, data: dict) -> None:
+    """Saves a time file atomically, in the binary format if the path ends with ".crtb" and as JSON otherwise.
+
+    Args:
+        path (str): The file path.
+        data (dict): The time file contents, see `snapshot`.
+    """
+    write_atomic(path, to_binary(data) if is_binary(path) else to_json(data))
+
+def load_time_file(path: str) -> dict:
+    """Loads a time file.
+
+    Binary files are memory-mapped, see `crt.time_binary.open_binary`. Their contents also hold the precision and
+    the load aggregates, and the loads are a `LoadStore` that can be handed to `Time.adopt_loads`.
+
+    Args:
+        path (str): The file path.
+
+    Raises:
+        ValueError: The file is corrupted.
+
+    Returns:
+        dict: The time file contents.
+    """
+    if is_binary(path):
+        header, loads = open_binary(path)
+        if len(loads) != header.count:
+            raise ValueError("The file provided is corrupted.")
+        return {
+            "start_frame": header.start_frame,
+            "end_frame": header.end_frame,
+            "framerate": str(header.framerate),
+            "loads": loads,
+            "precision": header.precision,
+            "aggregates": header.aggregates,
+        }
+    with open(path, "r") as file:
+        try:
+            return json.load(file)
+        except json.decoder.JSONDecodeError:
+            raise ValueError("The file provided is corrupted.")
+
+def read_run(path: str, size: int = 4096) -> Optional[dict]:
+    """Reads the start frame, end frame and framerate of a time file without reading its loads.
+
+    Time files list the loads last, so the run is found in the first few bytes of even the largest file.
+
+    Args:
+        path (str): The file path.
+        size (int): The number of characters of a JSON file to look at. Defaults to 4096.
+
+    Raises:
+        ValueError: A binary file is corrupted.
+
+    Returns:
+        dict | None: The start frame, end frame and framerate, or None if they are not at the start of the file.
+    """
+    if is_binary(path):
+        with open(path, "rb") as file:
+            header = read_header(file)
+        return {"start_frame": header.start_frame, "end_frame": header.end_frame, "framerate": str(header.framerate)}
+
+    with open(path, "r") as file:
+        text = file.read(size)
+    run = {}
+    for match in _RUN_KEY.finditer(text):
+        try:
+            value, end = _DECODER.raw_decode(text, match.end())
+        except ValueError:
+            continue
+        # A number that runs into the end of the text may have been cut off
+        if end < len(text):
+            run.setdefault(match.group(1), value)
+    return run if len(run) == 3 else None
+
+def load_in_background(path: str, on_finished: Callable[[str, Optional[dict], Optional[Exception]], None]) -> threading.Thread:
+    """Loads a time file and validates its loads on a worker thread.
+
+    The result can be applied with `Time.adopt_loads` without validating the loads again. Loads that fail the
+    validation are reported as the `LoadValidationError`.
+
+    Args:
+        path (str): The file path.
+        on_finished (Callable[[str, dict | None, Exception | None], None]): Called on the worker thread with the path
+            and either the time file contents, with the loads as a `LoadStore` and their aggregates, or the error.
+
+    Returns:
+        threading.Thread: The worker thread.
+    """
+    def run() -> None:
+        try:
+            data = load_time_file(path)
+            if "aggregates" not in data:
+                time = Time(data["start_frame"], data["end_frame"], data["framerate"])
+                time.replace_loads(data["loads"])
+                data["loads"] = time.loads
+                data["aggregates"] = (time.total_load_length, time.shortest_load_length if time.loads else None,
+                                      time.longest_load_length if time.loads else None)
+        except Exception as e:
+            on_finished(path, None, e)
+            return
+        on_finished(path, data, None)
+
+    thread = threading.Thread(target=run, name="crt-open", daemon=True)
+    thread.start()
+    return thread
+
+class SaveWorker:
+    """
+    Writes time files on a background thread.
+
+    Saves are coalesced: a save submitted while an earlier save of the same path is still waiting replaces it, so a
+    burst of saves results in a single write of the newest snapshot. Every finished write is reported through
+    `on_finished` with the path and the error, or None if it succeeded. The callback runs on the worker thread.
+    """
+
+    def __init__(self, on_finished: Optional[Callable[[str, Optional[Exception]], None]] = None, delay: float = 0.1, write: Optional[Callable[[str, dict], None]] = None) -> None:
+        """Initializes the SaveWorker class.
+
+        Args:
+            on_finished (Callable[[str, Exception | None], None] | None): Called after every write. Defaults to None.
+            delay (float): How long to wait for further saves before writing, in seconds. Defaults to 0.1.
+            write (Callable[[str, dict], None] | None): Writes one save. Defaults to None, which saves a time file, see
+                `save_time_file`.
+        """
+        self.on_finished = on_finished
+        self.delay = delay
+        self.write = write or save_time_file
+        self._pending: dict[str, dict] = {}
+        self._writing = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, path: str, data: dict) -> None:
+        """Queues a save, replacing any save of the same path that has not started yet.
+
+        Args:
+            path (str): The file path.
+            data (dict): The time file contents, see `snapshot`, or whatever `write` takes.
+
+        Raises:
+            RuntimeError: The worker was closed.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The save worker is closed.")
+            self._pending[path] = data
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="crt-save", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    @property
+    def busy(self) -> bool:
+        """Whether a save is waiting or being written.
+
+        Returns:
+            bool: True until every submitted save has been written.
+        """
+        with self._condition:
+            return bool(self._pending) or self._writing
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits for every submitted save to be written.
+
+        Args:
+            timeout (float | None): The longest time to wait in seconds. Defaults to None, which waits forever.
+
+        Returns:
+            bool: True if every save was written, False if the timeout expired.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Writes the remaining saves and stops the worker.
+
+        Args:
+            timeout (float | None): The longest time to wait in seconds. Defaults to None, which waits forever.
+
+        Returns:
+            bool: True if every save was written, False if the timeout expired.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        return self.flush(timeout)
+
+    def _run(self) -> None:
+        """Writes saves until the worker is closed."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                # Give a burst of saves the chance to collapse into one write
+                deadline = monotonic() + self.delay
+                while not self._closed and (remaining := deadline - monotonic()) > 0:
+                    self._condition.wait(remaining)
+                path = next(iter(self._pending))
+                data = self._pending.pop(path)
+                self._writing = True
+
+            error = None
+            try:
+                self.write(path, data)
+            except Exception as e:
+                error = e
+
+            try:
+                if self.on_finished is not None:
+                    self.on_finished(path, error)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
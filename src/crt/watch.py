@@ -0,0 +1,558 @@
+"""
+Watches a folder of time files and retimes every file whose contents change.
+
+Changes are noticed with inotify on Linux and by polling the modification times elsewhere. Bursts of writes to a file
+are debounced into a single retime. A persistent SQLite index remembers the state and content hash of every file, so
+a restart only hashes the files whose modification time or size changed while nothing was watching, and only retimes
+the files whose hash changed.
+"""
+
+# Standard library
+import hashlib
+import json
+import os
+import select
+import sqlite3
+import struct
+import sys
+import threading
+from datetime import datetime, timezone
+from time import monotonic, sleep
+from typing import IO, Iterable, Optional
+
+# Local application
+from crt.batch import find_time_files, retime_file, retime_files
+from crt.time_binary import EXTENSION
+
+# The file the index is kept in by default, inside the watched directory
+INDEX_NAME = ".crt-index.sqlite3"
+# Output files with these extensions get a SQLite results table instead of JSON Lines
+SQLITE_EXTENSIONS = (".sqlite", ".sqlite3", ".db")
+# At least this many changed files at once are retimed on a process pool
+POOL_THRESHOLD = 16
+
+def _is_time_file(path: str) -> bool:
+    """Checks whether a path names a time file.
+
+    Args:
+        path (str): The path.
+
+    Returns:
+        bool: Whether the path ends in .json or .crtb.
+    """
+    return path.lower().endswith((".json", EXTENSION))
+
+def content_hash(path: str) -> str:
+    """Hashes the contents of a file.
+
+    Args:
+        path (str): The file path.
+
+    Raises:
+        OSError: The file cannot be read.
+
+    Returns:
+        str: The SHA-256 of the file in hexadecimal.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class FileIndex:
+    """
+    The state and content hash of every watched file, kept in SQLite so that it survives restarts.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initializes the FileIndex class.
+
+        Args:
+            path (str): The database file, created if it is missing.
+        """
+        self.path = path
+        # The watcher may run on another thread than the one that created it, but only ever on one at a time
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, hash TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    def get(self, path: str) -> Optional[tuple[int, int, str]]:
+        """Gets what is known about a file.
+
+        Args:
+            path (str): The absolute file path.
+
+        Returns:
+            tuple[int, int, str] | None: The modification time in nanoseconds, size and content hash of the file when
+            it was last retimed, or None if it never was.
+        """
+        return self._connection.execute(
+            "SELECT mtime_ns, size, hash FROM files WHERE path = ?", (path,)
+        ).fetchone()
+
+    def put(self, path: str, mtime_ns: int, size: int, file_hash: str) -> None:
+        """Records the state of a file.
+
+        Args:
+            path (str): The absolute file path.
+            mtime_ns (int): The modification time in nanoseconds.
+            size (int): The size in bytes.
+            file_hash (str): The content hash.
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size, hash) VALUES (?, ?, ?, ?)",
+            (path, mtime_ns, size, file_hash),
+        )
+
+    def remove(self, path: str) -> None:
+        """Forgets a file.
+
+        Args:
+            path (str): The absolute file path.
+        """
+        self._connection.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def paths(self, directory: str) -> set[str]:
+        """Lists the known files in a directory and its subdirectories.
+
+        Args:
+            directory (str): The absolute directory path.
+
+        Returns:
+            set[str]: The absolute file paths.
+        """
+        prefix = os.path.join(directory, "")
+        rows = self._connection.execute("SELECT path FROM files WHERE substr(path, 1, ?) = ?", (len(prefix), prefix))
+        return {path for path, in rows}
+
+    def commit(self) -> None:
+        """Writes the changes to disk."""
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Writes the changes to disk and closes the database."""
+        self._connection.commit()
+        self._connection.close()
+
+class ResultLog:
+    """
+    Appends retime results to a JSON Lines file, or to standard output.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initializes the ResultLog class.
+
+        Args:
+            path (str | None): The file to append to. Defaults to None, which writes to standard output.
+        """
+        self.path = path
+        self._file: IO[str] = open(path, "a", encoding="utf-8") if path else sys.stdout
+
+    def append(self, record: dict) -> None:
+        """Appends a result.
+
+        Args:
+            record (dict): The result, see `FolderWatcher.process`.
+        """
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Closes the file."""
+        if self._file is not sys.stdout:
+            self._file.close()
+
+class SqliteResultLog:
+    """
+    Appends retime results to the results table of a SQLite database.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initializes the SqliteResultLog class.
+
+        Args:
+            path (str): The database file, created if it is missing.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "id INTEGER PRIMARY KEY, path TEXT NOT NULL, hash TEXT, retimed_at TEXT NOT NULL, "
+            "without_loads TEXT, with_loads TEXT, error TEXT, result TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    def append(self, record: dict) -> None:
+        """Appends a result.
+
+        Args:
+            record (dict): The result, see `FolderWatcher.process`.
+        """
+        self._connection.execute(
+            "INSERT INTO results (path, hash, retimed_at, without_loads, with_loads, error, result) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                record["path"], record.get("hash"), record["retimed_at"], record.get("without_loads"),
+                record.get("with_loads"), record.get("error"), json.dumps(record),
+            ),
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._connection.close()
+
+def open_result_log(path: Optional[str] = None) -> "ResultLog | SqliteResultLog":
+    """Opens the log that results are appended to, picking its kind from the file extension.
+
+    Args:
+        path (str | None): A .sqlite, .sqlite3 or .db database, or a JSON Lines file. Defaults to None, which writes
+            JSON Lines to standard output.
+
+    Returns:
+        ResultLog | SqliteResultLog: The log.
+    """
+    if path and path.lower().endswith(SQLITE_EXTENSIONS):
+        return SqliteResultLog(path)
+    return ResultLog(path)
+
+class _PollingMonitor:
+    """
+    Notices changes by comparing the modification time and size of every time file at an interval.
+    """
+
+    def __init__(self, directory: str, recursive: bool, interval: float) -> None:
+        """Initializes the _PollingMonitor class.
+
+        Args:
+            directory (str): The absolute directory path.
+            recursive (bool): Whether to watch subdirectories too.
+            interval (float): The number of seconds between scans.
+        """
+        self.directory = directory
+        self.recursive = recursive
+        self.interval = interval
+        self._states = self._scan()
+        self._next_scan = monotonic() + interval
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        """Reads the state of every time file.
+
+        Returns:
+            dict[str, tuple[int, int]]: The modification time in nanoseconds and size of every file.
+        """
+        states = {}
+        for path in find_time_files(self.directory, self.recursive):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            states[path] = (stat.st_mtime_ns, stat.st_size)
+        return states
+
+    def wait(self, timeout: float) -> set[str]:
+        """Waits for changes.
+
+        Args:
+            timeout (float): The most seconds to wait.
+
+        Returns:
+            set[str]: The files that were added, changed or removed, possibly none.
+        """
+        delay = self._next_scan - monotonic()
+        if delay > timeout:
+            sleep(timeout)
+            return set()
+        sleep(max(delay, 0))
+        self._next_scan = monotonic() + self.interval
+        states = self._scan()
+        changed = {path for path, state in states.items() if self._states.get(path) != state}
+        changed.update(self._states.keys() - states.keys())
+        self._states = states
+        return changed
+
+    def close(self) -> None:
+        """Stops watching."""
+
+class _InotifyMonitor:
+    """
+    Notices changes with Linux inotify, watching every subdirectory as it appears.
+    """
+
+    IN_MODIFY = 0x2
+    IN_CLOSE_WRITE = 0x8
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, directory: str, recursive: bool) -> None:
+        """Initializes the _InotifyMonitor class.
+
+        Args:
+            directory (str): The absolute directory path.
+            recursive (bool): Whether to watch subdirectories too.
+
+        Raises:
+            OSError: inotify is not available.
+        """
+        # ctypes is only needed on this path
+        import ctypes
+        import ctypes.util
+
+        self.directory = directory
+        self.recursive = recursive
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._get_errno = ctypes.get_errno
+        self._directories: dict[int, str] = {}
+        self._add_directory(directory)
+
+    def _add_directory(self, directory: str) -> set[str]:
+        """Watches a directory, and its subdirectories if the monitor is recursive.
+
+        Args:
+            directory (str): The absolute directory path.
+
+        Returns:
+            set[str]: The time files already in the directory, which may have been written before it was watched.
+        """
+        pending = [directory]
+        found = set()
+        while pending:
+            directory = pending.pop()
+            descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.MASK)
+            if descriptor < 0:
+                if directory == self.directory:
+                    errno = self._get_errno()
+                    raise OSError(errno, os.strerror(errno), directory)
+                continue
+            self._directories[descriptor] = directory
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                pending.append(entry.path)
+                        elif _is_time_file(entry.name):
+                            found.add(entry.path)
+            except OSError:
+                continue
+        return found
+
+    def wait(self, timeout: float) -> set[str]:
+        """Waits for changes.
+
+        Args:
+            timeout (float): The most seconds to wait.
+
+        Returns:
+            set[str]: The files that were added, changed or removed, possibly none.
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        changed = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            descriptor, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were lost, so treat every file as changed and let the index sort out which really did
+                changed.update(find_time_files(self.directory, self.recursive))
+                continue
+            if mask & self.IN_IGNORED:
+                self._directories.pop(descriptor, None)
+                continue
+            directory = self._directories.get(descriptor)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & self.IN_ISDIR:
+                if self.recursive and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    changed.update(self._add_directory(path))
+            elif _is_time_file(name):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        """Stops watching."""
+        os.close(self._fd)
+
+class FolderWatcher:
+    """
+    Retimes the time files in a folder whenever their contents change.
+
+    Every change to a file restarts its debounce timer, and the file is only retimed once it has been quiet for the
+    debounce delay, so a burst of writes costs a single retime. A file is then hashed only if its modification time or
+    size differs from the index, and retimed only if its hash does.
+    """
+
+    def __init__(self, directory: str, log: "ResultLog | SqliteResultLog", index_path: Optional[str] = None, recursive: bool = True, debounce: float = 0.5, poll_interval: float = 2.0, polling: bool = False, note_format: Optional[str] = None, precision: int = 3, workers: Optional[int] = None) -> None:
+        """Initializes the FolderWatcher class.
+
+        Args:
+            directory (str): The directory to watch.
+            log (ResultLog | SqliteResultLog): The log results are appended to.
+            index_path (str | None): The index database. Defaults to None, which keeps it in the directory.
+            recursive (bool): Whether to watch subdirectories too. Defaults to True.
+            debounce (float): The number of quiet seconds to wait before retiming a changed file. Defaults to 0.5.
+            poll_interval (float): The number of seconds between scans when polling. Defaults to 2.0.
+            polling (bool): Whether to poll even where inotify is available. Defaults to False.
+            note_format (str | None): The mod note template. Defaults to None, which leaves out the mod note.
+            precision (int): The precision of the times. Defaults to 3.
+            workers (int | None): The number of processes used when many files change at once. Defaults to None,
+                which uses one per CPU.
+
+        Raises:
+            ValueError: The directory does not exist.
+        """
+        if not os.path.isdir(directory):
+            raise ValueError(f"{directory} is not a directory.")
+        self.directory = os.path.abspath(directory)
+        self.log = log
+        self.recursive = recursive
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.polling = polling
+        self.note_format = note_format
+        self.precision = precision
+        self.workers = workers
+        index_path = index_path or os.path.join(self.directory, INDEX_NAME)
+        self.index = FileIndex(index_path)
+        # A result log or index named like a time file in the directory would otherwise be retimed after every write
+        self._own_paths = {os.path.abspath(path) for path in (index_path, log.path) if path}
+        self._stop = threading.Event()
+
+    def _retime(self, paths: list[str]) -> Iterable[dict]:
+        """Retimes files, on a process pool if there are many.
+
+        Args:
+            paths (list[str]): The paths of the time files.
+
+        Returns:
+            Iterable[dict]: The result of every file, see `crt.batch.retime_file`.
+        """
+        if len(paths) >= POOL_THRESHOLD and self.workers != 1:
+            return retime_files(paths, self.workers, self.note_format, self.precision)
+        return (retime_file(path, self.note_format, self.precision) for path in paths)
+
+    def process(self, paths: Iterable[str]) -> int:
+        """Retimes the files whose contents changed since they were last retimed, and forgets the removed files.
+
+        Every retime appends a record with the path, content hash, the UTC time it was retimed at and either the
+        summary of the time, see `crt.retime.summarise`, or the error. The result log and index of the watcher itself
+        are never retimed, even if they lie in the directory.
+
+        Args:
+            paths (Iterable[str]): The paths of files that may have changed.
+
+        Returns:
+            int: The number of files retimed.
+        """
+        hashes = {}
+        for path in paths:
+            path = os.path.abspath(path)
+            if path in self._own_paths:
+                continue
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                self.index.remove(path)
+                continue
+            except OSError:
+                continue
+            known = self.index.get(path)
+            if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                continue
+            try:
+                file_hash = content_hash(path)
+            except OSError:
+                continue
+            if known is not None and known[2] == file_hash:
+                # Touched but not changed, so only remember the new state
+                self.index.put(path, stat.st_mtime_ns, stat.st_size, file_hash)
+                continue
+            hashes[path] = (stat, file_hash)
+
+        retimed_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        for result in self._retime(list(hashes)):
+            path = result.pop("path")
+            stat, file_hash = hashes[path]
+            self.log.append({"path": path, "hash": file_hash, "retimed_at": retimed_at, **result})
+            self.index.put(path, stat.st_mtime_ns, stat.st_size, file_hash)
+        self.index.commit()
+        return len(hashes)
+
+    def sync(self) -> int:
+        """Catches up with the changes made while nothing was watching.
+
+        Returns:
+            int: The number of files retimed.
+        """
+        paths = set(find_time_files(self.directory, self.recursive))
+        return self.process(paths | (self.index.paths(self.directory) - paths))
+
+    def _open_monitor(self) -> "_InotifyMonitor | _PollingMonitor":
+        """Opens the monitor, preferring inotify.
+
+        Returns:
+            _InotifyMonitor | _PollingMonitor: The monitor.
+        """
+        if not self.polling and sys.platform.startswith("linux"):
+            try:
+                return _InotifyMonitor(self.directory, self.recursive)
+            except (OSError, AttributeError):
+                pass
+        return _PollingMonitor(self.directory, self.recursive, self.poll_interval)
+
+    def run(self) -> None:
+        """Syncs, then retimes changed files until `stop` is called."""
+        # Start watching before syncing, so that nothing written during the sync is missed
+        monitor = self._open_monitor()
+        try:
+            self.sync()
+            pending: dict[str, float] = {}
+            while not self._stop.is_set():
+                timeout = self.debounce if not pending else max(min(pending.values()) + self.debounce - monotonic(), 0)
+                changed = monitor.wait(min(timeout, self.poll_interval))
+                now = monotonic()
+                for path in changed:
+                    pending[path] = now
+                due = [path for path, changed in pending.items() if now - changed >= self.debounce]
+                for path in due:
+                    del pending[path]
+                if due:
+                    self.process(due)
+        finally:
+            monitor.close()
+
+    def stop(self) -> None:
+        """Makes `run` return, from another thread or a signal handler."""
+        self._stop.set()
+
+    def close(self) -> None:
+        """Closes the index and the log."""
+        self.index.close()
+        self.log.close()
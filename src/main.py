@@ -1,9 +1,16 @@
+import sys
+
 import crt
 
 def main():
     """
     Main function for CRT.
+
+    Launches the GUI, or runs the command-line interface if arguments are given, see `crt.cli`.
     """
+    if len(sys.argv) > 1:
+        from crt.cli import main as cli_main
+        sys.exit(cli_main())
     app = crt.App()
     app.run()
 